@@ -0,0 +1,219 @@
+import bisect
+import statistics
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import List, Callable, Dict, Optional
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.flowable import Flowable
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
+from rxbp.mixins.flowableopmixin import FlowableOpMixin
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+from rxbp.typing import ElementType
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    scheduler: str
+    batch_size: int
+
+    # number of elements emitted by the source
+    n_elements: int
+
+    # median over all repetitions, based on the number of elements emitted by the source
+    elements_per_second: float
+
+    # time from sending a batch at the source until the sink receives the first batch
+    # sent after it in microseconds
+    latency_p50: float
+    latency_p90: float
+    latency_p99: float
+
+    # gap between two consecutive batches received by the sink in microseconds
+    inter_batch_gap_p50: float
+    inter_batch_gap_p90: float
+    inter_batch_gap_p99: float
+
+    error: Optional[str] = None
+
+    @property
+    def key(self):
+        return f'{self.name}[{self.scheduler},{self.batch_size}]'
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+class LatencyProbe:
+    """ Records the time each batch is sent by the sources of a pipeline
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.send_times: List[float] = []
+
+    def _record(self, batch: ElementType) -> ElementType:
+        send_time = time.perf_counter()
+
+        # the sources of a pipeline can send on different threads
+        with self.lock:
+            self.send_times.append(send_time)
+
+        return batch
+
+    def source(self, flowable: FlowableOpMixin):
+        """
+        Record the send time of each batch of the given source Flowable.
+
+        The batches are not changed; therefore, the underlying Flowable is replaced
+        directly such that an indexed Flowable keeps its base.
+        """
+
+        return flowable._copy(underlying=MapBatchFlowable(source=flowable, func=self._record))
+
+    def get_latencies(self, arrival_times: List[float]) -> List[float]:
+        """
+        Assign each sent batch to the first batch received by the sink afterwards,
+        e.g. the batches sent to `to_list` are assigned to the single batch
+        received at the end. Batches sent after the last received batch, e.g.
+        those filtered out entirely, are ignored.
+        """
+
+        with self.lock:
+            send_times = sorted(self.send_times)
+
+        latencies = []
+
+        for send_time in send_times:
+            index = bisect.bisect_left(arrival_times, send_time)
+
+            if index == len(arrival_times):
+                break
+
+            latencies.append((arrival_times[index] - send_time) * 1e6)
+
+        return latencies
+
+
+class BenchmarkObserver(Observer):
+    """ Consumes all received elements and records the arrival time of each batch
+    """
+
+    def __init__(self):
+        self.arrival_times: List[float] = []
+        self.exception = None
+        self.is_done = threading.Event()
+
+    def on_next(self, elem: ElementType):
+        # elements are consumed such that lazy operators are evaluated
+        for _ in elem:
+            pass
+
+        self.arrival_times.append(time.perf_counter())
+        return continue_ack
+
+    def on_error(self, exc):
+        self.exception = exc
+        self.is_done.set()
+
+    def on_completed(self):
+        self.is_done.set()
+
+
+def percentile(values: List[float], p: float) -> float:
+    if not values:
+        return float('nan')
+
+    values = sorted(values)
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def measure(
+        name: str,
+        n_elements: int,
+        flowable_factory: Callable[[Scheduler, LatencyProbe], Flowable],
+        scheduler_name: str,
+        scheduler_factory: Callable[[], Scheduler],
+        batch_size: int,
+        repeat: int,
+        timeout: float,
+) -> BenchmarkResult:
+    """
+    Subscribe `repeat` times to a newly created Flowable and measure the throughput,
+    the latency from the sources to the sink and the time between two consecutive
+    batches received by the sink.
+    """
+
+    throughputs = []
+    latencies = []
+    gaps = []
+
+    for _ in range(repeat):
+        scheduler = scheduler_factory()
+
+        # like `Flowable.run`, the Flowable is subscribed on a trampoline scheduler
+        # and the elements are sent on the measured scheduler
+        subscribe_scheduler = TrampolineScheduler()
+
+        try:
+            probe = LatencyProbe()
+            flowable = flowable_factory(scheduler, probe)
+            observer = BenchmarkObserver()
+
+            start = time.perf_counter()
+            flowable.subscribe(observer=observer, scheduler=scheduler, subscribe_scheduler=subscribe_scheduler)
+
+            if not observer.is_done.wait(timeout):
+                raise TimeoutError(f'benchmark did not complete within {timeout}s')
+
+            if observer.exception is not None:
+                raise observer.exception
+
+        except Exception as exc:
+            return BenchmarkResult(
+                name=name,
+                scheduler=scheduler_name,
+                batch_size=batch_size,
+                n_elements=n_elements,
+                elements_per_second=float('nan'),
+                latency_p50=float('nan'),
+                latency_p90=float('nan'),
+                latency_p99=float('nan'),
+                inter_batch_gap_p50=float('nan'),
+                inter_batch_gap_p90=float('nan'),
+                inter_batch_gap_p99=float('nan'),
+                # rxbp exceptions contain the stack of the operator, keep the first line only
+                error=f'{type(exc).__name__}: {str(exc).splitlines()[0] if str(exc) else ""}',
+            )
+
+        finally:
+            dispose = getattr(scheduler, 'dispose', None)
+            if dispose is not None:
+                dispose()
+
+        end = observer.arrival_times[-1] if observer.arrival_times else time.perf_counter()
+        throughputs.append(n_elements / max(end - start, 1e-9))
+
+        latencies += probe.get_latencies(observer.arrival_times)
+
+        arrival_times = [start] + observer.arrival_times
+        gaps += [(t2 - t1) * 1e6 for t1, t2 in zip(arrival_times[:-1], arrival_times[1:])]
+
+    return BenchmarkResult(
+        name=name,
+        scheduler=scheduler_name,
+        batch_size=batch_size,
+        n_elements=n_elements,
+        elements_per_second=statistics.median(throughputs),
+        latency_p50=percentile(latencies, 50),
+        latency_p90=percentile(latencies, 90),
+        latency_p99=percentile(latencies, 99),
+        inter_batch_gap_p50=percentile(gaps, 50),
+        inter_batch_gap_p90=percentile(gaps, 90),
+        inter_batch_gap_p99=percentile(gaps, 99),
+    )
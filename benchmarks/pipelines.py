@@ -0,0 +1,113 @@
+"""
+Flowable pipelines measured by the benchmark suite.
+
+Each pipeline is a function that takes the number of elements, the batch size,
+the scheduler used to subscribe and the latency probe, and returns the Flowable
+to be measured. The sources of a pipeline are passed to the probe such that the
+latency to the sink can be measured.
+"""
+
+import rxbp
+from benchmarks.benchmarkutils import LatencyProbe
+from rxbp.flowable import Flowable
+from rxbp.scheduler import Scheduler
+
+
+def map_filter_to_list(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return probe.source(rxbp.range(n, batch_size=batch_size)).pipe(
+        rxbp.op.map(lambda v: v + 1),
+        rxbp.op.filter(lambda v: v % 2 == 0),
+        rxbp.op.to_list(),
+    )
+
+
+def zip_two(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return rxbp.zip(
+        probe.source(rxbp.range(n, batch_size=batch_size)),
+        probe.source(rxbp.range(n, batch_size=batch_size)),
+    )
+
+
+def merge_two(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return rxbp.merge(
+        probe.source(rxbp.range(n // 2, batch_size=batch_size)),
+        probe.source(rxbp.range(n // 2, batch_size=batch_size)),
+    )
+
+
+def flat_map(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    inner_size = 100
+
+    # the batch size applies to the inner Flowables, which send the measured batches
+    return rxbp.range(n // inner_size).pipe(
+        rxbp.op.flat_map(lambda _: probe.source(rxbp.range(inner_size, batch_size=batch_size))),
+    )
+
+
+def buffer(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return probe.source(rxbp.range(n, batch_size=batch_size)).pipe(
+        rxbp.op.buffer(1000),
+    )
+
+
+def observe_on(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return probe.source(rxbp.range(n, batch_size=batch_size)).pipe(
+        rxbp.op.observe_on(scheduler),
+    )
+
+
+def share(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    # a shared Flowable can only be subscribed inside a MultiCast
+    return rxbp.multicast.return_value(probe.source(rxbp.range(n, batch_size=batch_size)).share()).pipe(
+        rxbp.multicast.op.map(lambda shared: shared.pipe(
+            rxbp.op.zip(shared.pipe(
+                rxbp.op.map(lambda v: v + 1),
+            )),
+        )),
+    ).to_flowable()
+
+
+def match(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return probe.source(rxbp.indexed.range(n, batch_size=batch_size)).pipe(
+        rxbp.indexed.op.match(probe.source(rxbp.indexed.range(n, batch_size=batch_size)).pipe(
+            rxbp.op.filter(lambda v: v % 2 == 0),
+        )),
+    )
+
+
+def multicast_zip(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    return rxbp.multicast.return_value(probe.source(rxbp.range(n, batch_size=batch_size))).pipe(
+        rxbp.multicast.op.map(lambda base: base.pipe(
+            rxbp.op.zip(base.pipe(
+                rxbp.op.map(lambda v: v + 1),
+            )),
+        )),
+    ).to_flowable()
+
+
+def multicast_share(n: int, batch_size: int, scheduler: Scheduler, probe: LatencyProbe) -> Flowable:
+    def merge_flowables(multicast):
+        return rxbp.multicast.merge(
+            multicast,
+            multicast,
+        ).pipe(
+            rxbp.multicast.op.collect_flowables(),
+        )
+
+    return rxbp.multicast.return_value(probe.source(rxbp.range(n // 2, batch_size=batch_size)).share()).pipe(
+        rxbp.multicast.op.share(merge_flowables),
+    ).to_flowable()
+
+
+PIPELINES = {
+    'map_filter_to_list': map_filter_to_list,
+    'zip': zip_two,
+    'merge': merge_two,
+    'flat_map': flat_map,
+    'buffer': buffer,
+    'observe_on': observe_on,
+    'share': share,
+    'match': match,
+    'multicast_zip': multicast_zip,
+    'multicast_share': multicast_share,
+}
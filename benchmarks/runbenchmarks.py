@@ -0,0 +1,152 @@
+"""
+Benchmark suite for the core operators and schedulers.
+
+Each pipeline defined in `benchmarks/pipelines.py` is measured for every
+combination of scheduler and batch size. The suite reports the throughput in
+elements per second, the percentiles of the latency from sending a batch at
+the source until the sink receives it, and the median gap between two
+consecutive batches received by the sink.
+
+Run the suite from the root directory of the repository:
+
+    python -m benchmarks.runbenchmarks
+
+Store the results of a run and compare a later run against them to detect
+regressions; the process exits with status 1 if the throughput of a benchmark
+dropped by more than the tolerance:
+
+    python -m benchmarks.runbenchmarks --output baseline.json
+    python -m benchmarks.runbenchmarks --compare baseline.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Dict
+
+from benchmarks.benchmarkutils import measure, BenchmarkResult
+from benchmarks.pipelines import PIPELINES
+from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+from rxbp.schedulers.eventloopscheduler import EventLoopScheduler
+from rxbp.schedulers.threadpoolscheduler import ThreadPoolScheduler
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+SCHEDULERS = {
+    'trampoline': TrampolineScheduler,
+    'eventloop': EventLoopScheduler,
+    'threadpool': lambda: ThreadPoolScheduler('benchmark'),
+    'asyncio': AsyncIOScheduler,
+}
+
+
+def run(
+        pipelines: List[str],
+        schedulers: List[str],
+        batch_sizes: List[int],
+        n_elements: int,
+        repeat: int,
+        timeout: float,
+) -> List[BenchmarkResult]:
+    results = []
+
+    for name in pipelines:
+        for scheduler_name in schedulers:
+            for batch_size in batch_sizes:
+                def flowable_factory(scheduler, probe, pipeline=PIPELINES[name], batch_size=batch_size):
+                    return pipeline(n_elements, batch_size, scheduler, probe)
+
+                result = measure(
+                    name=name,
+                    n_elements=n_elements,
+                    flowable_factory=flowable_factory,
+                    scheduler_name=scheduler_name,
+                    scheduler_factory=SCHEDULERS[scheduler_name],
+                    batch_size=batch_size,
+                    repeat=repeat,
+                    timeout=timeout,
+                )
+
+                print_result(result)
+                results.append(result)
+
+    return results
+
+
+def print_result(result: BenchmarkResult):
+    if result.error is not None:
+        print(f'{result.key:<45} failed: {result.error}')
+    else:
+        print(
+            f'{result.key:<45} {result.elements_per_second:>14,.0f} elem/s'
+            f'   latency p50 {result.latency_p50:>10.1f}us'
+            f'   p90 {result.latency_p90:>10.1f}us'
+            f'   p99 {result.latency_p99:>10.1f}us'
+            f'   gap p50 {result.inter_batch_gap_p50:>10.1f}us'
+        )
+
+
+def compare(results: List[BenchmarkResult], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """
+    Return the benchmarks whose throughput dropped by more than `tolerance` relative
+    to the baseline.
+    """
+
+    regressions = []
+
+    for result in results:
+        if result.key not in baseline:
+            continue
+
+        baseline_throughput = baseline[result.key]['elements_per_second']
+
+        if result.error is not None:
+            regressions.append(f'{result.key}: {result.error}')
+
+        elif result.elements_per_second < (1 - tolerance) * baseline_throughput:
+            ratio = result.elements_per_second / baseline_throughput
+            regressions.append(f'{result.key}: {ratio:.0%} of baseline throughput')
+
+    return regressions
+
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description='rxbp benchmark suite')
+    parser.add_argument('--pipelines', nargs='+', default=list(PIPELINES), choices=list(PIPELINES))
+    parser.add_argument('--schedulers', nargs='+', default=list(SCHEDULERS), choices=list(SCHEDULERS))
+    parser.add_argument('--batch-sizes', nargs='+', type=int, default=[1, 100, 1000])
+    parser.add_argument('--n-elements', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=60.0, help='timeout of a single run in seconds')
+    parser.add_argument('--output', help='write the results to a JSON file')
+    parser.add_argument('--compare', help='compare the results to a JSON file written by a previous run')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='tolerated relative throughput drop')
+    args = parser.parse_args(argv)
+
+    results = run(
+        pipelines=args.pipelines,
+        schedulers=args.schedulers,
+        batch_sizes=args.batch_sizes,
+        n_elements=args.n_elements,
+        repeat=args.repeat,
+        timeout=args.timeout,
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({result.key: result.to_dict() for result in results}, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+        regressions = compare(results, baseline, tolerance=args.tolerance)
+
+        for regression in regressions:
+            print(f'regression: {regression}')
+
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
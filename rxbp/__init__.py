@@ -3,7 +3,10 @@ from . import indexed
 from . import multicast
 from . import op
 from .source import from_iterable, from_range, from_list, return_value, from_rx, concat, zip, \
-    merge, empty
+    merge, empty, from_async_iterable
+from .toasynciterator import to_async_iterator
+from .utils.debugmode import set_debug_enabled
+from .utils.getstacklines import set_stack_capture
 
 from_ = from_iterable
 range = from_range
@@ -0,0 +1,33 @@
+import itertools
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+
+
+class CountdownAck(AckSubject):
+    """
+    Aggregates `count` acknowledgments into a single acknowledgment, which is
+    `stop_ack` if any of the counted down acknowledgments is a `StopAck` and
+    `continue_ack` otherwise.
+
+    Contrary to `reduce_ack`, no object is allocated per aggregated
+    acknowledgment and the countdown does not acquire a lock.
+    """
+
+    def __init__(self, count: int):
+        super().__init__()
+
+        self.count = count
+        self.is_stopped = False
+
+        # `next` on an `itertools.count` is atomic, the last count down gets `count - 1`
+        self._counter = itertools.count()
+
+    def count_down(self, ack: Ack = continue_ack):
+        if isinstance(ack, StopAck):
+            self.is_stopped = True
+
+        if next(self._counter) == self.count - 1:
+            self.on_next(stop_ack if self.is_stopped else continue_ack)
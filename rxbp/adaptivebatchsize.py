@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AdaptiveBatchSize:
+    """
+    Batch size of `rxbp.from_rx` that adapts at runtime.
+
+    The batch size is doubled if the elements arrive faster than the batches
+    are filled within half of `max_linger`, or if the consumer did not process
+    the previous batch yet or acknowledges slower than `max_linger`. It is
+    halved if a batch is sent because `max_linger` elapsed before it was full.
+
+    :param min_size: lower bound of the batch size
+    :param max_size: upper bound of the batch size
+    :param max_linger: maximum time in seconds an element waits in an incomplete batch
+    """
+
+    min_size: int = 1
+    max_size: int = 1024
+    max_linger: float = 0.01
+
+    def __post_init__(self):
+        assert 0 < self.min_size <= self.max_size, \
+            f'batch size bounds "{self.min_size}" and "{self.max_size}" are invalid'
+        assert 0 < self.max_linger, 'max linger time must be positive'
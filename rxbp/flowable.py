@@ -1,8 +1,9 @@
 import functools
 from abc import ABC
 from dataclasses import dataclass
-from typing import Generic
+from typing import Generic, Callable, Any
 
+from rxbp.lagmetrics import LagMetrics
 from rxbp.mixins.flowableopmixin import FlowableOpMixin
 from rxbp.mixins.flowablesubscribemixin import FlowableSubscribeMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
@@ -29,9 +30,33 @@ class Flowable(
             return flowable
 
     def run(self, scheduler: Scheduler = None):
-        return list(to_iterator(source=self, scheduler=scheduler))
+        return list(to_iterator(source=self, scheduler=scheduler, buffer_size=None))
+
+    def share(
+            self,
+            max_lag: int = None,
+            lag_policy: str = None,
+            size_func: Callable[[Any], int] = None,
+            lag_metrics: LagMetrics = None,
+    ) -> 'Flowable':
+        """
+        Broadcast the elements of the Flowable to possibly multiple subscribers.
+
+        :param max_lag: maximum number of elements the slowest subscriber lags behind
+        the fastest one, by default the lag is unbounded
+        :param lag_policy: applied to a subscriber exceeding the maximum lag, one of the
+        policies in `rxbp.lagpolicy`, by default the source is back-pressured
+        :param size_func: size of an element counted against the maximum lag instead of
+        one, e.g. `sys.getsizeof` to bound the lag in bytes
+        :param lag_metrics: filled in with the lag of each subscriber, see `rxbp.lagmetrics`
+        """
 
-    def share(self) -> 'Flowable':
         stack = get_stack_lines()
 
-        return self._share(stack=stack)
+        return self._share(
+            stack=stack,
+            max_lag=max_lag,
+            lag_policy=lag_policy,
+            size_func=size_func,
+            lag_metrics=lag_metrics,
+        )
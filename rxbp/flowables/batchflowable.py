@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.batchobservable import BatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class BatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    max_size: int
+    max_delay: Optional[float]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            observable=BatchObservable(
+                source=subscription.observable,
+                max_size=self.max_size,
+                max_delay=self.max_delay,
+                scheduler=subscriber.scheduler,
+            ),
+        )
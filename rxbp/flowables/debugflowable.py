@@ -7,6 +7,8 @@ from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.debugobservable import DebugObservable
 from rxbp.observerinfo import ObserverInfo
 from rxbp.subscriber import Subscriber
+from rxbp.utils.debugmode import is_debug_enabled
+from rxbp.utils.operatorprofiler import OperatorStats
 
 
 @dataclass
@@ -22,8 +24,16 @@ class DebugFlowable(FlowableMixin):
     on_observe: Callable[[ObserverInfo], None]
     on_raw_ack: Callable[[Ack], None]
     stack: List[FrameSummary]
+    sample_every: int = None
+    sample_probability: float = None
+    stats: OperatorStats = None
 
     def unsafe_subscribe(self, subscriber: Subscriber):
+
+        # a disabled debug operator is removed from the chain
+        if not is_debug_enabled():
+            return self.source.unsafe_subscribe(subscriber=subscriber)
+
         self.on_subscribe(subscriber)
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
 
@@ -39,6 +49,9 @@ class DebugFlowable(FlowableMixin):
             on_raw_ack=self.on_raw_ack,
             subscriber=subscriber,
             stack=self.stack,
+            sample_every=self.sample_every,
+            sample_probability=self.sample_probability,
+            stats=self.stats,
         )
 
         return subscription.copy(observable=observable)
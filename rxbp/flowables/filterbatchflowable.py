@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.filterbatchobservable import FilterBatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+from rxbp.typing import ElementType
+
+
+@dataclass
+class FilterBatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    predicate: Callable[[ElementType], Iterable[bool]]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber)
+
+        observable = FilterBatchObservable(
+            source=subscription.observable,
+            predicate=self.predicate,
+        )
+
+        return subscription.copy(observable=observable)
@@ -3,6 +3,7 @@ from typing import Callable, Any
 
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.filterobservable import FilterObservable
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 
@@ -15,9 +16,9 @@ class FilterFlowable(FlowableMixin):
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self.source.unsafe_subscribe(subscriber)
 
-        observable = FilterObservable(
+        observable = fuse_observable(FilterObservable(
             source=subscription.observable,
             predicate=self.predicate,
-        )
+        ))
 
         return subscription.copy(observable=observable)
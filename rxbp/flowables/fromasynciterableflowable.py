@@ -0,0 +1,35 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, Any, Optional
+
+from rxbp.init.initsubscription import init_subscription
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fromasynciterableobservable import FromAsyncIterableObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class FromAsyncIterableFlowable(FlowableMixin):
+    async_iterable: AsyncIterable[Any]
+    loop: Optional[asyncio.AbstractEventLoop]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        if self.loop is None:
+            # a loop that is not running would never start the iteration
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise Exception(
+                    'no running event loop, either specify the "loop" argument of '
+                    '"from_async_iterable" or subscribe from within a running event loop'
+                )
+        else:
+            loop = self.loop
+
+        return init_subscription(
+            observable=FromAsyncIterableObservable(
+                async_iterable=self.async_iterable,
+                loop=loop,
+            ),
+        )
@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional
 
 import rx
 
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
 from rxbp.init.initsubscription import init_subscription
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.fromrxbufferingobservable import FromRxBufferingObservable
@@ -15,6 +17,7 @@ class FromRxBufferingFlowable(FlowableMixin):
     batched_source: rx.typing.Observable
     overflow_strategy: OverflowStrategy
     buffer_size: int
+    adaptive_batch_size: Optional[AdaptiveBatchSize] = None
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         return init_subscription(
@@ -24,5 +27,6 @@ class FromRxBufferingFlowable(FlowableMixin):
                 subscribe_scheduler=subscriber.subscribe_scheduler,
                 overflow_strategy=self.overflow_strategy,
                 buffer_size=self.buffer_size,
+                adaptive_batch_size=self.adaptive_batch_size,
             ),
         )
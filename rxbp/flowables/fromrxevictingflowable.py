@@ -1,7 +1,9 @@
 from dataclasses import dataclass
+from typing import Optional
 
 import rx
 
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
 from rxbp.init.initsubscription import init_subscription
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observables.fromrxevictingobservable import FromRxEvictingObservable
@@ -14,6 +16,7 @@ from rxbp.subscription import Subscription
 class FromRxEvictingFlowable(FlowableMixin):
     batched_source: rx.typing.Observable
     overflow_strategy: OverflowStrategy
+    adaptive_batch_size: Optional[AdaptiveBatchSize] = None
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         return init_subscription(
@@ -22,5 +25,6 @@ class FromRxEvictingFlowable(FlowableMixin):
                 scheduler=subscriber.scheduler,
                 subscribe_scheduler=subscriber.subscribe_scheduler,
                 overflow_strategy=self.overflow_strategy,
+                adaptive_batch_size=self.adaptive_batch_size,
             ),
         )
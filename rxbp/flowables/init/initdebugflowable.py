@@ -6,6 +6,7 @@ from rxbp.flowables.debugflowable import DebugFlowable
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observerinfo import ObserverInfo
 from rxbp.subscriber import Subscriber
+from rxbp.utils.operatorprofiler import OperatorProfiler
 
 
 def init_debug_flowable(
@@ -21,15 +22,29 @@ def init_debug_flowable(
         on_raw_ack: Callable[[Ack], None] = None,
         verbose: bool = None,
         stack: List[FrameSummary] = None,
+        sample_every: int = None,
+        sample_probability: float = None,
+        profiler: OperatorProfiler = None,
 ):
     """
     Print debug messages to the console when providing the `name` argument
 
     :on_next: customize the on next debug console print
+    :sample_every: only debug every n-th batch
+    :sample_probability: only debug a batch with the given probability
+    :profiler: measure the throughput and latency of the operator under its name
     """
 
+    assert sample_every is None or sample_probability is None, \
+        'either "sample_every" or "sample_probability" can be specified'
+    assert sample_every is None or 1 <= sample_every, \
+        f'"sample_every" must be at least 1, got {sample_every}'
+    assert sample_probability is None or 0 <= sample_probability <= 1, \
+        f'"sample_probability" must be between 0 and 1, got {sample_probability}'
+
     if verbose is None:
-        verbose = True
+        # a profiled operator does not print to the console by default
+        verbose = profiler is None
 
     if verbose:
         on_next_func = on_next or (lambda v: print(f'{name}.on_next {v}'))
@@ -69,4 +84,7 @@ def init_debug_flowable(
         on_async_ack=on_async_ack_func,
         on_raw_ack=on_raw_ack_func,
         stack=stack,
+        sample_every=sample_every,
+        sample_probability=sample_probability,
+        stats=profiler.get_stats(name) if profiler is not None else None,
     )
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.mapbatchobservable import MapBatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+from rxbp.typing import ElementType
+
+
+@dataclass
+class MapBatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    func: Callable[[ElementType], ElementType]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            observable=MapBatchObservable(
+                source=subscription.observable,
+                func=self.func,
+            ),
+        )
@@ -3,6 +3,7 @@ from traceback import FrameSummary
 from typing import Callable, Any, List
 
 from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.observables.mapobservable import MapObservable
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
@@ -20,10 +21,10 @@ class MapFlowable(FlowableMixin):
         # try:
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
         return subscription.copy(
-            observable=MapObservable(
+            observable=fuse_observable(MapObservable(
                 source=subscription.observable,
                 func=self.func,
-            ),
+            )),
         )
 
         # except AttributeError:
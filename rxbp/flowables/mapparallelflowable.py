@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.mapparallelobservable import MapParallelObservable
+from rxbp.schedulers.threadpoolscheduler import ThreadPoolScheduler
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+from rxbp.typing import ValueType
+
+
+@dataclass
+class MapParallelFlowable(FlowableMixin):
+    source: FlowableMixin
+    func: Callable[[ValueType], ValueType]
+    executor: Optional[Executor]
+    max_in_flight: Optional[int]
+    is_ordered: bool
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        # by default, the batches are mapped on the thread pool of the subscriber scheduler
+        executor = self.executor or subscriber.scheduler
+
+        if isinstance(executor, ThreadPoolScheduler):
+            executor = executor.executor
+
+        assert isinstance(executor, Executor), \
+            f'either an executor or a ThreadPoolScheduler is required, got "{executor}"'
+
+        max_in_flight = self.max_in_flight or getattr(executor, '_max_workers', None) or os.cpu_count() or 1
+
+        return subscription.copy(
+            observable=MapParallelObservable(
+                source=subscription.observable,
+                func=self.func,
+                executor=executor,
+                max_in_flight=max_in_flight,
+                scheduler=subscriber.scheduler,
+                is_ordered=self.is_ordered,
+            ),
+        )
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.prefetchobservable import PrefetchObservable
+from rxbp.scheduler import Scheduler
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class PrefetchFlowable(FlowableMixin):
+    source: FlowableMixin
+    prefetch: int
+    replenish: int
+    scheduler: Optional[Scheduler]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            observable=PrefetchObservable(
+                source=subscription.observable,
+                scheduler=self.scheduler or subscriber.scheduler,
+                prefetch=self.prefetch,
+                replenish=self.replenish,
+            ),
+        )
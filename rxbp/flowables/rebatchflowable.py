@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.rebatchobservable import RebatchObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class RebatchFlowable(FlowableMixin):
+    source: FlowableMixin
+    size: int
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscription = self.source.unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            observable=RebatchObservable(
+                source=subscription.observable,
+                size=self.size,
+            ),
+        )
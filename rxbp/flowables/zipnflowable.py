@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from traceback import FrameSummary
+from typing import List
+
+from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.zipnobservable import ZipNObservable
+from rxbp.subscriber import Subscriber
+from rxbp.subscription import Subscription
+
+
+@dataclass
+class ZipNFlowable(FlowableMixin):
+    sources: List[FlowableMixin]
+    stack: List[FrameSummary]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
+        subscriptions = [source.unsafe_subscribe(subscriber=subscriber) for source in self.sources]
+
+        return subscriptions[0].copy(
+            observable=ZipNObservable(
+                sources=[subscription.observable for subscription in subscriptions],
+                stack=self.stack,
+            ),
+        )
@@ -1,6 +1,7 @@
 from typing import Callable, Any
 
 from rxbp.mixins.flowablemixin import FlowableMixin
+from rxbp.observables.fusedobservable import fuse_observable
 from rxbp.observables.zipwithindexobservable import ZipWithIndexObservable
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
@@ -16,5 +17,5 @@ class ZipWithIndexFlowable(FlowableMixin):
 
     def unsafe_subscribe(self, subscriber: Subscriber) -> Subscription:
         subscription = self._source.unsafe_subscribe(subscriber=subscriber)
-        observable = ZipWithIndexObservable(source=subscription.observable, selector=self._selector)
+        observable = fuse_observable(ZipWithIndexObservable(source=subscription.observable, selector=self._selector))
         return subscription.copy(observable=observable)
\ No newline at end of file
@@ -8,6 +8,7 @@ from rxbp.indexed.selectors.flowablebase import FlowableBase
 from rxbp.indexed.selectors.flowablebaseandselectors import FlowableBaseAndSelectors
 from rxbp.observables.init.initdebugobservable import init_debug_observable
 from rxbp.subscriber import Subscriber
+from rxbp.utils.debugmode import is_debug_enabled
 
 
 @dataclass
@@ -20,6 +21,10 @@ class DebugBaseIndexedFlowable(IndexedFlowableMixin):
     def unsafe_subscribe(self, subscriber: Subscriber) -> IndexedSubscription:
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
 
+        # a disabled debug operator leaves the selectors unchanged
+        if not is_debug_enabled():
+            return subscription
+
         if self.base in subscription.index.selectors:
             selector = init_debug_observable(
                 source=subscription.index.selectors[self.base],
@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
+from rxbp.indexed.indexedsubscription import IndexedSubscription
+from rxbp.indexed.mixins.indexedflowablemixin import IndexedFlowableMixin
+from rxbp.indexed.selectors.flowablebaseandselectors import FlowableBaseAndSelectors
+from rxbp.subscriber import Subscriber
+from rxbp.typing import ElementType
+
+
+@dataclass
+class MapBatchIndexedFlowable(IndexedFlowableMixin):
+    """
+    The batch function can change the number of elements in a batch, therefore,
+    the resulting Flowable has neither a base nor selectors.
+    """
+
+    source: IndexedFlowableMixin
+    func: Callable[[ElementType], ElementType]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> IndexedSubscription:
+        subscription = MapBatchFlowable(
+            source=self.source,
+            func=self.func,
+        ).unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            index=FlowableBaseAndSelectors(base=None, selectors=None),
+            observable=subscription.observable,
+        )
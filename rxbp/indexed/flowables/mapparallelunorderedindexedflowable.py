@@ -0,0 +1,37 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from rxbp.flowables.mapparallelflowable import MapParallelFlowable
+from rxbp.indexed.indexedsubscription import IndexedSubscription
+from rxbp.indexed.mixins.indexedflowablemixin import IndexedFlowableMixin
+from rxbp.indexed.selectors.flowablebaseandselectors import FlowableBaseAndSelectors
+from rxbp.subscriber import Subscriber
+from rxbp.typing import ValueType
+
+
+@dataclass
+class MapParallelUnorderedIndexedFlowable(IndexedFlowableMixin):
+    """
+    The batches are reordered, therefore, the resulting Flowable has neither a
+    base nor selectors.
+    """
+
+    source: IndexedFlowableMixin
+    func: Callable[[ValueType], ValueType]
+    executor: Optional[Executor]
+    max_in_flight: Optional[int]
+
+    def unsafe_subscribe(self, subscriber: Subscriber) -> IndexedSubscription:
+        subscription = MapParallelFlowable(
+            source=self.source,
+            func=self.func,
+            executor=self.executor,
+            max_in_flight=self.max_in_flight,
+            is_ordered=False,
+        ).unsafe_subscribe(subscriber=subscriber)
+
+        return subscription.copy(
+            index=FlowableBaseAndSelectors(base=None, selectors=None),
+            observable=subscription.observable,
+        )
@@ -33,7 +33,7 @@ class IndexedFlowable(
         return self._share(stack=stack)
 
     def run(self, scheduler: Scheduler = None):
-        return list(to_iterator(source=self, scheduler=scheduler))
+        return list(to_iterator(source=self, scheduler=scheduler, buffer_size=None))
 
     def pipe(self, *operators: PipeOperation[FlowableAbsOpMixin]) -> 'IndexedFlowable':
         flowable = functools.reduce(lambda obs, op: op(obs), operators, self)
@@ -1,10 +1,12 @@
 import functools
 import itertools
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Callable, Any, Tuple, List
+from typing import Callable, Any, Tuple, List, Iterable
 
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
 from rxbp.flowables.mapflowable import MapFlowable
 from rxbp.flowables.reduceflowable import ReduceFlowable
 from rxbp.flowables.refcountflowable import RefCountFlowable
@@ -14,6 +16,8 @@ from rxbp.indexed.flowables.concatindexedflowable import ConcatIndexedFlowable
 from rxbp.indexed.flowables.controlledzipindexedflowable import ControlledZipIndexedFlowable
 from rxbp.indexed.flowables.debugbaseindexedflowable import DebugBaseIndexedFlowable
 from rxbp.indexed.flowables.filterindexedflowable import FilterIndexedFlowable
+from rxbp.indexed.flowables.mapbatchindexedflowable import MapBatchIndexedFlowable
+from rxbp.indexed.flowables.mapparallelunorderedindexedflowable import MapParallelUnorderedIndexedFlowable
 from rxbp.indexed.flowables.matchindexedflowable import MatchIndexedFlowable
 from rxbp.indexed.flowables.pairwiseindexedflowable import PairwiseIndexedFlowable
 from rxbp.indexed.flowables.zipindexedflowable import ZipIndexedFlowable
@@ -26,6 +30,7 @@ from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.mixins.flowableopmixin import FlowableOpMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
 from rxbp.subscriber import Subscriber
+from rxbp.typing import ElementType
 
 
 class IndexedFlowableOpMixin(
@@ -111,6 +116,46 @@ class IndexedFlowableOpMixin(
         )
         return self._copy(underlying=flowable)
 
+    def filter_batch(
+            self,
+            predicate: Callable[[ElementType], Iterable[bool]],
+            stack: List[FrameSummary],
+    ) -> IndexedFlowableMixin:
+        # the selectors of an indexed Flowable are created element-wise; therefore,
+        # the mask is zipped to the elements and the indexed filter is reused
+        def zip_mask(batch: ElementType):
+            return list(zip(predicate(batch), batch))
+
+        # zipping the mask preserves the number of elements in a batch, such that
+        # the base of the source remains valid
+        flowable = self._copy(underlying=MapBatchFlowable(source=self, func=zip_mask))
+
+        return flowable.filter(
+            predicate=lambda t: t[0],
+            stack=stack,
+        ).map(func=lambda t: t[1])
+
+    def map_batch(self, func: Callable[[ElementType], ElementType]):
+        flowable = MapBatchIndexedFlowable(source=self, func=func)
+        return self._copy(underlying=flowable)
+
+    def map_parallel_unordered(
+            self,
+            func: Callable[[Any], Any],
+            executor: Executor = None,
+            max_in_flight: int = None,
+    ):
+        assert max_in_flight is None or 0 < max_in_flight, \
+            f'maximum number of batches in flight "{max_in_flight}" must be positive'
+
+        flowable = MapParallelUnorderedIndexedFlowable(
+            source=self,
+            func=func,
+            executor=executor,
+            max_in_flight=max_in_flight,
+        )
+        return self._copy(underlying=flowable)
+
     def match(
             self,
             *others: IndexedFlowableMixin,
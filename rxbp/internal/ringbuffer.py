@@ -0,0 +1,94 @@
+from typing import List, Any, Sized, Iterable
+
+
+def _size_of(batch: Iterable) -> int:
+    # an evicted iterator is never sent, it is consumed to count its elements
+    if isinstance(batch, Sized):
+        return len(batch)
+
+    return sum(1 for _ in batch)
+
+
+class RingBuffer:
+    """
+    A fixed-capacity buffer that evicts batches once it is full.
+
+    The buffer is preallocated and adding a batch is O(1). The buffer
+    is not thread-safe; it is the responsibility of the caller to lock it.
+    """
+
+    def __init__(self, capacity: int, clear_on_overflow: bool = None):
+        """
+        :param capacity: maximum number of batches in the buffer
+        :param clear_on_overflow: if set to True, all batches are dropped when the buffer
+        is full, otherwise only the oldest batch is dropped
+        """
+
+        assert 0 < capacity, 'the capacity of a ring buffer must be positive'
+
+        self.capacity = capacity
+        self.clear_on_overflow = clear_on_overflow
+
+        self.buffer: List[Any] = [None] * capacity
+        self.head = 0
+        self.size = 0
+
+        # total number of batches and elements evicted from the buffer
+        self.dropped = 0
+        self.dropped_elements = 0
+
+    def __len__(self):
+        return self.size
+
+    def offer(self, batch: Iterable) -> int:
+        """
+        Add a batch to the buffer and return the number of batches dropped
+        to make space for it.
+        """
+
+        if self.size < self.capacity:
+            self.buffer[(self.head + self.size) % self.capacity] = batch
+            self.size += 1
+            return 0
+
+        elif self.clear_on_overflow:
+            dropped = self.size
+            self.dropped_elements += sum(_size_of(evicted) for evicted in self.buffer)
+            self.buffer = [None] * self.capacity
+            self.buffer[0] = batch
+            self.head = 0
+            self.size = 1
+
+        else:
+            dropped = 1
+            self.dropped_elements += _size_of(self.buffer[self.head])
+            self.buffer[self.head] = batch
+            self.head = (self.head + 1) % self.capacity
+
+        self.dropped += dropped
+        return dropped
+
+    def drain(self) -> List[Any]:
+        """
+        Remove all elements from the buffer and return them in insertion order.
+        """
+
+        if self.size == 0:
+            return []
+
+        tail = self.head + self.size
+
+        # release the references of the drained slots only
+        if tail <= self.capacity:
+            elements = self.buffer[self.head:tail]
+            self.buffer[self.head:tail] = [None] * self.size
+        else:
+            wrapped = tail - self.capacity
+            elements = self.buffer[self.head:] + self.buffer[:wrapped]
+            self.buffer[self.head:] = [None] * (self.capacity - self.head)
+            self.buffer[:wrapped] = [None] * wrapped
+
+        self.head = 0
+        self.size = 0
+
+        return elements
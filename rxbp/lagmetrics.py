@@ -0,0 +1,42 @@
+import threading
+from typing import Callable, Dict, Any
+
+
+class LagMetrics:
+    """
+    Handle on the lag metrics of a shared Flowable, e.g.
+
+        lag_metrics = LagMetrics()
+        shared = source.share(max_lag=100, lag_policy=DROP_OLDEST, lag_metrics=lag_metrics)
+        ...
+        lag_metrics.snapshot()
+
+    The shared Flowable creates its subject once it gets subscribed; before,
+    the snapshot contains no subscriptions.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._get_snapshot: Callable[[], Dict[str, Any]] = None
+
+    def attach(self, get_snapshot: Callable[[], Dict[str, Any]]):
+        with self.lock:
+            self._get_snapshot = get_snapshot
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current lag of each subscription together with the batches dropped
+        for it, the largest lag observed so far and the number of detached subscriptions.
+        """
+
+        with self.lock:
+            get_snapshot = self._get_snapshot
+
+        if get_snapshot is None:
+            return {
+                'subscriptions': [],
+                'largest_lag': 0,
+                'n_detached': 0,
+            }
+
+        return get_snapshot()
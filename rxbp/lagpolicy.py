@@ -0,0 +1,15 @@
+"""
+Policies applied by a shared Flowable to a subscriber that lags behind the
+fastest subscriber by more than the maximum lag.
+"""
+
+# the source is back-pressured until the lagging subscriber caught up
+BACKPRESSURE = 'backpressure'
+
+# the oldest batches not yet sent to the lagging subscriber are dropped
+DROP_OLDEST = 'drop_oldest'
+
+# the lagging subscriber receives an error instead of its next batch
+DETACH = 'detach'
+
+lag_policies = (BACKPRESSURE, DROP_OLDEST, DETACH)
@@ -1,15 +1,26 @@
 from abc import abstractmethod, ABC
+from concurrent.futures import Executor
 from traceback import FrameSummary
-from typing import Callable, Any, Iterator, List
+from typing import Callable, Any, Iterator, List, Iterable
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
+from rxbp.utils.operatorprofiler import OperatorProfiler
 
 
 class FlowableAbsOpMixin(ABC):
+    @abstractmethod
+    def batch(self, max_size: int, max_delay: float = None) -> FlowableMixin:
+        """
+        Coalesce the batches emitted by the source into batches of up to `max_size` elements
+        or emit the collected elements after `max_delay` seconds.
+        """
+
+        ...
+
     @abstractmethod
     def buffer(self, buffer_size: int = None) -> FlowableMixin:
         """
@@ -67,10 +78,16 @@ class FlowableAbsOpMixin(ABC):
             on_subscribe: Callable[[ObserverInfo], None],
             on_raw_ack: Callable[[Ack], None],
             stack: List[FrameSummary],
+            sample_every: int,
+            sample_probability: float,
+            profiler: OperatorProfiler,
     ) -> FlowableMixin:
         """ Print debug messages to the console when providing the `name` argument
 
         :on_next: customize the on next debug console print
+        :sample_every: only debug every n-th batch
+        :sample_probability: only debug a batch with the given probability
+        :profiler: measure the throughput and latency of the operator under its name
         """
 
         ...
@@ -117,6 +134,20 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def filter_batch(
+            self,
+            predicate: Callable[[ElementType], Iterable[bool]],
+            stack: List[FrameSummary],
+    ) -> FlowableMixin:
+        """ Only emit those elements for which the mask returned by the predicate holds.
+
+        :param predicate: a function that returns a boolean mask for the given batch
+        :return: filtered Flowable
+        """
+
+        ...
+
     @abstractmethod
     def first(self, stack: List[FrameSummary]) -> FlowableMixin:
         """
@@ -159,6 +190,52 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def map_batch(self, func: Callable[[ElementType], ElementType]) -> FlowableMixin:
+        """ Map each batch emitted by the source by applying the given function.
+
+        :param func: function that defines the mapping applied to each batch of the \
+        Flowable sequence.
+        """
+
+        ...
+
+    @abstractmethod
+    def map_parallel(
+            self,
+            func: Callable[[ValueType], ValueType],
+            executor: Executor = None,
+            max_in_flight: int = None,
+    ) -> FlowableMixin:
+        """
+        Map each element emitted by the source on the executor and emit the mapped
+        elements in their original order.
+
+        :param func: function that defines the mapping applied to each element
+        :param executor: the executor, or a ThreadPoolScheduler whose executor is used
+        :param max_in_flight: maximum number of batches mapped concurrently
+        """
+
+        ...
+
+    @abstractmethod
+    def map_parallel_unordered(
+            self,
+            func: Callable[[ValueType], ValueType],
+            executor: Executor = None,
+            max_in_flight: int = None,
+    ) -> FlowableMixin:
+        """
+        Map each element emitted by the source on the executor and emit the mapped
+        batches as soon as they are ready.
+
+        :param func: function that defines the mapping applied to each element
+        :param executor: the executor, or a ThreadPoolScheduler whose executor is used
+        :param max_in_flight: maximum number of batches mapped concurrently
+        """
+
+        ...
+
     @abstractmethod
     def map_to_iterator(
             self,
@@ -174,11 +251,13 @@ class FlowableAbsOpMixin(ABC):
         ...
 
     @abstractmethod
-    def merge(self, *others: FlowableMixin) -> FlowableMixin:
+    def merge(self, *others: FlowableMixin, weights: List[int] = None) -> FlowableMixin:
         """
         Merge the elements of this and the other Flowable sequences into a single *Flowable*.
 
         :param sources: other Flowables that get merged to this Flowable.
+        :param weights: number of batches each Flowable can send per round, starting
+        with this Flowable
         """
 
         ...
@@ -203,6 +282,26 @@ class FlowableAbsOpMixin(ABC):
 
         ...
 
+    @abstractmethod
+    def prefetch(self, n: int, scheduler: Scheduler = None) -> FlowableMixin:
+        """
+        Allow up to `n` batches to be in flight between the source and the downstream
+        operators, such that both sides can run concurrently.
+
+        :param n: maximum number of batches sent without being acknowledged downstream
+        :param scheduler: scheduler the batches are sent downstream on
+        """
+
+        ...
+
+    @abstractmethod
+    def rebatch(self, size: int) -> FlowableMixin:
+        """
+        Split the batches emitted by the source into batches of at most `size` elements.
+        """
+
+        ...
+
     @abstractmethod
     def reduce(
             self,
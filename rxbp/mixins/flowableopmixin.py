@@ -1,47 +1,56 @@
-import functools
 import itertools
 from abc import abstractmethod, ABC
+from concurrent.futures import Executor
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Callable, Any, Tuple, Iterator, List
+from typing import Callable, Any, Tuple, Iterator, List, Iterable
 
 import rx
 
 from rxbp.acknowledgement.ack import Ack
+from rxbp.flowables.batchflowable import BatchFlowable
 from rxbp.flowables.bufferflowable import BufferFlowable
 from rxbp.flowables.concatflowable import ConcatFlowable
 from rxbp.flowables.controlledzipflowable import ControlledZipFlowable
 from rxbp.flowables.defaultifemptyflowable import DefaultIfEmptyFlowable
 from rxbp.flowables.doactionflowable import DoActionFlowable
+from rxbp.flowables.filterbatchflowable import FilterBatchFlowable
 from rxbp.flowables.filterflowable import FilterFlowable
 from rxbp.flowables.firstflowable import FirstFlowable
 from rxbp.flowables.firstordefaultflowable import FirstOrDefaultFlowable
 from rxbp.flowables.flatmapflowable import FlatMapFlowable
 from rxbp.flowables.init.initdebugflowable import init_debug_flowable
 from rxbp.flowables.lastflowable import LastFlowable
+from rxbp.flowables.mapbatchflowable import MapBatchFlowable
 from rxbp.flowables.mapflowable import MapFlowable
+from rxbp.flowables.mapparallelflowable import MapParallelFlowable
 from rxbp.flowables.maptoiteratorflowable import MapToIteratorFlowable
-from rxbp.flowables.mergeflowable import MergeFlowable
+from rxbp.flowables.mergenflowable import MergeNFlowable
 from rxbp.flowables.observeonflowable import ObserveOnFlowable
 from rxbp.flowables.pairwiseflowable import PairwiseFlowable
+from rxbp.flowables.prefetchflowable import PrefetchFlowable
+from rxbp.flowables.rebatchflowable import RebatchFlowable
 from rxbp.flowables.reduceflowable import ReduceFlowable
 from rxbp.flowables.refcountflowable import RefCountFlowable
 from rxbp.flowables.repeatfirstflowable import RepeatFirstFlowable
 from rxbp.flowables.scanflowable import ScanFlowable
 from rxbp.flowables.tolistflowable import ToListFlowable
-from rxbp.flowables.zipflowable import ZipFlowable
+from rxbp.flowables.zipnflowable import ZipNFlowable
 from rxbp.flowables.zipwithindexflowable import ZipWithIndexFlowable
+from rxbp.lagmetrics import LagMetrics
 from rxbp.mixins.flowableabsopmixin import FlowableAbsOpMixin
 from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.mixins.sharedflowablemixin import SharedFlowableMixin
 from rxbp.observables.materializeobservable import MaterializeObservable
+from rxbp.observablesubjects.cacheservefirstobservablesubject import CacheServeFirstObservableSubject
 from rxbp.observerinfo import ObserverInfo
 from rxbp.scheduler import Scheduler
 from rxbp.subscriber import Subscriber
 from rxbp.subscription import Subscription
 from rxbp.torx import to_rx
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
 from rxbp.utils.getstacklines import get_stack_lines
+from rxbp.utils.operatorprofiler import OperatorProfiler
 
 
 class FlowableOpMixin(
@@ -68,6 +77,12 @@ class FlowableOpMixin(
     #     raw = functools.reduce(lambda obs, op: op(obs), operators, self)
     #     return self._copy(raw)
 
+    def batch(self, max_size: int, max_delay: float = None) -> 'FlowableOpMixin':
+        assert 0 < max_size, f'maximum batch size "{max_size}" must be positive'
+
+        flowable = BatchFlowable(source=self, max_size=max_size, max_delay=max_delay)
+        return self._copy(underlying=flowable)
+
     def buffer(self, buffer_size: int = None) -> 'FlowableOpMixin':
         flowable = BufferFlowable(source=self, buffer_size=buffer_size)
         return self._copy(underlying=flowable)
@@ -127,7 +142,10 @@ class FlowableOpMixin(
             on_subscribe: Callable[[Subscriber], None] = None,
             on_raw_ack: Callable[[Ack], None] = None,
             stack: List[FrameSummary] = None,
-            verbose: bool = None
+            verbose: bool = None,
+            sample_every: int = None,
+            sample_probability: float = None,
+            profiler: OperatorProfiler = None,
     ):
 
         return self._copy(underlying=init_debug_flowable(
@@ -143,6 +161,9 @@ class FlowableOpMixin(
             on_raw_ack=on_raw_ack,
             stack=stack,
             verbose=verbose,
+            sample_every=sample_every,
+            sample_probability=sample_probability,
+            profiler=profiler,
         ))
 
     def default_if_empty(self, lazy_val: Callable[[], Any]) -> 'FlowableOpMixin':
@@ -176,6 +197,14 @@ class FlowableOpMixin(
         flowable = FilterFlowable(source=self, predicate=predicate)
         return self._copy(underlying=flowable)
 
+    def filter_batch(
+            self,
+            predicate: Callable[[ElementType], Iterable[bool]],
+            stack: List[FrameSummary],
+    ) -> 'FlowableOpMixin':
+        flowable = FilterBatchFlowable(source=self, predicate=predicate)
+        return self._copy(underlying=flowable)
+
     def first(self, stack: List[FrameSummary]):
         flowable = FirstFlowable(source=self, stack=stack)
         return self._copy(underlying=flowable)
@@ -196,6 +225,46 @@ class FlowableOpMixin(
         flowable = MapFlowable(source=self, func=func)
         return self._copy(underlying=flowable)
 
+    def map_batch(self, func: Callable[[ElementType], ElementType]):
+        flowable = MapBatchFlowable(source=self, func=func)
+        return self._copy(underlying=flowable)
+
+    def map_parallel(
+            self,
+            func: Callable[[ValueType], ValueType],
+            executor: Executor = None,
+            max_in_flight: int = None,
+    ):
+        assert max_in_flight is None or 0 < max_in_flight, \
+            f'maximum number of batches in flight "{max_in_flight}" must be positive'
+
+        flowable = MapParallelFlowable(
+            source=self,
+            func=func,
+            executor=executor,
+            max_in_flight=max_in_flight,
+            is_ordered=True,
+        )
+        return self._copy(underlying=flowable)
+
+    def map_parallel_unordered(
+            self,
+            func: Callable[[ValueType], ValueType],
+            executor: Executor = None,
+            max_in_flight: int = None,
+    ):
+        assert max_in_flight is None or 0 < max_in_flight, \
+            f'maximum number of batches in flight "{max_in_flight}" must be positive'
+
+        flowable = MapParallelFlowable(
+            source=self,
+            func=func,
+            executor=executor,
+            max_in_flight=max_in_flight,
+            is_ordered=False,
+        )
+        return self._copy(underlying=flowable)
+
     def map_to_iterator(
             self,
             func: Callable[[ValueType], Iterator[ValueType]],
@@ -220,7 +289,7 @@ class FlowableOpMixin(
 
         return self._copy(underlying=MaterializeFlowable(source=self))
 
-    def merge(self, *others: FlowableMixin):
+    def merge(self, *others: FlowableMixin, weights: List[int] = None):
 
         assert all(isinstance(source, FlowableMixin) for source in others), \
             f'"{others}" must all be of type FlowableMixin'
@@ -230,18 +299,14 @@ class FlowableOpMixin(
         else:
             sources = (self,) + others
 
-            def gen_stack():
-                for source in reversed(sources):
-                    def func(right: 'FlowableOpMixin' = None, left: 'FlowableOpMixin' = source):
-                        if right is None:
-                            return left
-                        else:
-                            flowable = MergeFlowable(source=left, other=right)
-                            return flowable
-
-                    yield func
+            assert weights is None or (len(weights) == len(sources) and all(0 < w for w in weights)), \
+                f'weights "{weights}" must be positive and match the number of Flowables'
 
-            flowable: FlowableMixin = functools.reduce(lambda acc, func: func(acc), gen_stack(), None)
+            # a single N-ary merge serves the sources in round-robin order
+            flowable = MergeNFlowable(
+                sources=list(sources),
+                weights=weights,
+            )
 
             try:
                 source = next(source for source in sources if isinstance(source, SharedFlowableMixin))
@@ -258,6 +323,24 @@ class FlowableOpMixin(
 
         return self._copy(underlying=PairwiseFlowable(source=self))
 
+    def prefetch(self, n: int, scheduler: Scheduler = None) -> 'FlowableOpMixin':
+        assert 0 < n, f'number of prefetched batches "{n}" must be positive'
+
+        flowable = PrefetchFlowable(
+            source=self,
+            prefetch=n,
+            # return the credits once three quarters of them are used
+            replenish=n - n // 4,
+            scheduler=scheduler,
+        )
+        return self._copy(underlying=flowable)
+
+    def rebatch(self, size: int) -> 'FlowableOpMixin':
+        assert 0 < size, f'batch size "{size}" must be positive'
+
+        flowable = RebatchFlowable(source=self, size=size)
+        return self._copy(underlying=flowable)
+
     def reduce(
             self,
             func: Callable[[Any, Any], Any],
@@ -279,8 +362,32 @@ class FlowableOpMixin(
         flowable = ScanFlowable(source=self, func=func, initial=initial)
         return self._copy(underlying=flowable)
 
-    def _share(self, stack: List[FrameSummary]):
-        return self._copy(underlying=RefCountFlowable(source=self, stack=stack), is_shared=True)
+    def _share(
+            self,
+            stack: List[FrameSummary],
+            max_lag: int = None,
+            lag_policy: str = None,
+            size_func: Callable[[Any], int] = None,
+            lag_metrics: LagMetrics = None,
+    ):
+        assert max_lag is not None or (lag_policy is None and size_func is None), \
+            '"lag_policy" and "size_func" require "max_lag" to be specified'
+
+        if max_lag is None and lag_metrics is None:
+            subject_gen = None
+
+        else:
+            def subject_gen(scheduler: Scheduler):
+                return CacheServeFirstObservableSubject(
+                    scheduler=scheduler,
+                    max_lag=max_lag,
+                    lag_policy=lag_policy,
+                    size_func=size_func,
+                    lag_metrics=lag_metrics,
+                )
+
+        flowable = RefCountFlowable(source=self, stack=stack, subject_gen=subject_gen)
+        return self._copy(underlying=flowable, is_shared=True)
 
     def to_list(self):
 
@@ -306,28 +413,11 @@ class FlowableOpMixin(
         else:
             sources = (self,) + others
 
-            def gen_stack():
-                for source in reversed(sources):
-                    def func(right: 'FlowableOpMixin' = None, left: 'FlowableOpMixin' = source):
-                        if right is None:
-                            return left.map(lambda v: (v,))
-                        else:
-                            def inner_result_selector(t: Tuple[Any, Tuple[Any]]):
-                                return (t[0],) + t[1]
-
-                            flowable = MapFlowable(
-                                source=ZipFlowable(
-                                    left=left,
-                                    right=right,
-                                    stack=stack,
-                                ),
-                                func=inner_result_selector,
-                            )
-                            return flowable
-
-                    yield func
-
-            flowable: FlowableMixin = functools.reduce(lambda acc, func: func(acc), gen_stack(), None)
+            # a single N-ary zip emits flat tuples and acknowledges all sources at once
+            flowable = ZipNFlowable(
+                sources=list(sources),
+                stack=stack,
+            )
 
             try:
                 source = next(source for source in sources if isinstance(source, SharedFlowableMixin))
@@ -7,6 +7,7 @@ from rxbp.multicast.multicastobservables.debugmulticastobservable import DebugMu
 from rxbp.multicast.multicastobserverinfo import MultiCastObserverInfo
 from rxbp.multicast.multicastsubscriber import MultiCastSubscriber
 from rxbp.multicast.multicastsubscription import MultiCastSubscription
+from rxbp.utils.debugmode import is_debug_enabled
 
 
 @dataclass
@@ -22,6 +23,10 @@ class DebugMultiCast(MultiCastMixin):
     stack: List[FrameSummary]
 
     def unsafe_subscribe(self, subscriber: MultiCastSubscriber) -> MultiCastSubscription:
+        # a disabled debug operator is removed from the chain
+        if not is_debug_enabled():
+            return self.source.unsafe_subscribe(subscriber=subscriber)
+
         self.on_subscribe(subscriber)
         subscription = self.source.unsafe_subscribe(subscriber=subscriber)
 
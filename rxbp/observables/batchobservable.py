@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.batchobserver import BatchObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class BatchObservable(Observable):
+    source: Observable
+    max_size: int
+    max_delay: Optional[float]
+    scheduler: Scheduler
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=BatchObserver(
+                observer=observer_info.observer,
+                max_size=self.max_size,
+                max_delay=self.max_delay,
+                scheduler=self.scheduler,
+            ),
+        ))
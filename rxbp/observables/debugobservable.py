@@ -7,6 +7,7 @@ from rxbp.observable import Observable
 from rxbp.observerinfo import ObserverInfo
 from rxbp.observers.debugobserver import DebugObserver
 from rxbp.subscriber import Subscriber
+from rxbp.utils.operatorprofiler import OperatorStats
 from rxbp.utils.tooperatorexception import to_operator_exception
 
 
@@ -23,6 +24,9 @@ class DebugObservable(Observable):
     on_raw_ack: Callable[[Ack], None]
     subscriber: Subscriber
     stack: List[FrameSummary]
+    sample_every: int = None
+    sample_probability: float = None
+    stats: OperatorStats = None
 
     def observe(self, observer_info: ObserverInfo):
         self.on_observe(observer_info)
@@ -43,6 +47,9 @@ class DebugObservable(Observable):
             on_async_ack=self.on_async_ack,
             on_raw_ack=self.on_raw_ack,
             stack=self.stack,
+            sample_every=self.sample_every,
+            sample_probability=self.sample_probability,
+            stats=self.stats,
         )
 
         # def action(_, __):
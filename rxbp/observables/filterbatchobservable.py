@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.filterbatchobserver import FilterBatchObserver
+from rxbp.typing import ElementType
+
+
+@dataclass
+class FilterBatchObservable(Observable):
+    source: Observable
+    predicate: Callable[[ElementType], Iterable[bool]]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=FilterBatchObserver(
+                observer=observer_info.observer,
+                predicate=self.predicate,
+            ),
+        ))
@@ -0,0 +1,88 @@
+import asyncio
+from dataclasses import dataclass
+from typing import AsyncIterable, Any
+
+from rx.disposable import Disposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+
+
+def _to_future(ack: Ack, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+    """
+    Translate an asynchronous acknowledgment into a future that completes on the
+    event loop once the acknowledgment is received.
+    """
+
+    future = loop.create_future()
+
+    def set_result(value: Ack):
+        if not future.done():
+            future.set_result(value)
+
+    class FutureSingle(Single):
+        def on_next(self, value: Ack):
+            # the acknowledgment can be received on any thread
+            loop.call_soon_threadsafe(set_result, value)
+
+    ack.subscribe(FutureSingle())
+    return future
+
+
+@dataclass
+class FromAsyncIterableObservable(Observable):
+    """
+    Sends each element of an asynchronous iterable in a batch of its own. The
+    elements are awaited on the event loop; the next element is only awaited
+    after the downstream observer acknowledged the previous batch.
+    """
+
+    async_iterable: AsyncIterable[Any]
+    loop: asyncio.AbstractEventLoop
+
+    async def _run(self, observer: Observer):
+        iterator = self.async_iterable.__aiter__()
+
+        try:
+            while True:
+                try:
+                    value = await iterator.__anext__()
+                except StopAsyncIteration:
+                    observer.on_completed()
+                    return
+                except Exception as exc:
+                    observer.on_error(exc)
+                    return
+
+                # an exception would otherwise end up in the unobserved future of `observe`
+                try:
+                    ack = observer.on_next([value])
+                except Exception as exc:
+                    observer.on_error(exc)
+                    return
+
+                if not isinstance(ack, (ContinueAck, StopAck)):
+                    ack = await _to_future(ack, loop=self.loop)
+
+                if isinstance(ack, StopAck):
+                    return
+
+        finally:
+            # close the asynchronous generator if the iteration stopped early
+            aclose = getattr(iterator, 'aclose', None)
+            if aclose is not None:
+                await aclose()
+
+    def observe(self, observer_info: ObserverInfo):
+        # the observable can be observed from any thread
+        future = asyncio.run_coroutine_threadsafe(
+            self._run(observer_info.observer),
+            loop=self.loop,
+        )
+
+        return Disposable(future.cancel)
@@ -1,10 +1,13 @@
 from dataclasses import dataclass
+from typing import Optional
 
 import rx
 from rx.core.typing import Disposable, Scheduler
 
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
 from rxbp.observable import Observable
 from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.adaptivebatchobserver import AdaptiveBatchObserver
 from rxbp.observers.evictingbufferedobserver import EvictingBufferedObserver
 from rxbp.overflowstrategy import OverflowStrategy
 
@@ -15,15 +18,28 @@ class FromRxEvictingObservable(Observable):
     scheduler: Scheduler
     subscribe_scheduler: Scheduler
     overflow_strategy: OverflowStrategy
+    adaptive_batch_size: Optional[AdaptiveBatchSize] = None
 
     def observe(self, observer_info: ObserverInfo) -> Disposable:
-        observer = EvictingBufferedObserver(
+        buffered_observer = EvictingBufferedObserver(
             observer=observer_info.observer,
             scheduler=self.scheduler,
             subscribe_scheduler=self.subscribe_scheduler,
             strategy=self.overflow_strategy,
         )
 
+        # the elements of the rx Observable are batched at runtime
+        if self.adaptive_batch_size is not None:
+            observer = AdaptiveBatchObserver(
+                observer=buffered_observer,
+                scheduler=self.scheduler,
+                batch_size=self.adaptive_batch_size,
+                get_backlog=lambda: buffered_observer.backlog,
+            )
+
+        else:
+            observer = buffered_observer
+
         return self.batched_source.subscribe(
             on_next=observer.on_next,
             on_error=observer.on_error,
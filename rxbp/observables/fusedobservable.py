@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+from rxbp.observable import Observable
+from rxbp.observables.filterobservable import FilterObservable
+from rxbp.observables.mapobservable import MapObservable
+from rxbp.observables.zipwithindexobservable import ZipWithIndexObservable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.fusedobserver import FusedObserver, MapStage, FilterStage, ZipWithIndexStage
+
+
+@dataclass
+class FusedObservable(Observable):
+    """
+    A chain of stateless operators collapsed into a single observable, such
+    that each batch passes a single observer instead of one per operator.
+    """
+
+    source: Observable
+    stages: List[Any]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=FusedObserver(
+                observer=observer_info.observer,
+                stages=self.stages,
+            ),
+        ))
+
+
+def _to_stages(observable: Observable) -> Optional[Tuple[Observable, List[Any]]]:
+    if isinstance(observable, FusedObservable):
+        return observable.source, observable.stages
+    elif isinstance(observable, MapObservable):
+        return observable.source, [MapStage(func=observable.func)]
+    elif isinstance(observable, FilterObservable):
+        return observable.source, [FilterStage(predicate=observable.predicate)]
+    elif isinstance(observable, ZipWithIndexObservable):
+        return observable.source, [ZipWithIndexStage(selector=observable.selector)]
+    else:
+        return None
+
+
+def fuse_observable(observable: Observable) -> Observable:
+    """
+    Fuse a stateless observable with its source if the source is a stateless
+    observable as well; otherwise return the observable as it is.
+
+    The fused observables keep their state in the observers, therefore bypassing
+    them does not affect other observers subscribed to them.
+    """
+
+    outer = _to_stages(observable)
+    if outer is None:
+        return observable
+
+    inner = _to_stages(outer[0])
+    if inner is None:
+        return observable
+
+    source, stages = inner
+    return FusedObservable(
+        source=source,
+        stages=stages + outer[1],
+    )
@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+from typing import Callable
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.mapbatchobserver import MapBatchObserver
+from rxbp.typing import ElementType
+
+
+@dataclass
+class MapBatchObservable(Observable):
+    source: Observable
+    func: Callable[[ElementType], ElementType]
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=MapBatchObserver(
+                observer=observer_info.observer,
+                func=self.func,
+            ),
+        ))
@@ -0,0 +1,31 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Callable
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.mapparallelobserver import MapParallelObserver
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ValueType
+
+
+@dataclass
+class MapParallelObservable(Observable):
+    source: Observable
+    func: Callable[[ValueType], ValueType]
+    executor: Executor
+    max_in_flight: int
+    scheduler: Scheduler
+    is_ordered: bool
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=MapParallelObserver(
+                observer=observer_info.observer,
+                func=self.func,
+                executor=self.executor,
+                max_in_flight=self.max_in_flight,
+                scheduler=self.scheduler,
+                is_ordered=self.is_ordered,
+            ),
+        ))
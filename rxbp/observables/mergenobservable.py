@@ -0,0 +1,239 @@
+import threading
+from collections import deque
+from typing import List, Optional, Tuple
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.typing import ElementType
+
+
+class MergeNObservable(Observable):
+    """
+    Merges the elements of N observables into a single observable.
+
+    Contrary to chaining binary `MergeObservable`s, every element traverses a
+    single merge. If the downstream observer is ready, a received batch is sent
+    immediately, otherwise it is buffered together with the acknowledgment that
+    back-pressures its source. At most one batch is buffered per source and the
+    buffered batches are sent in round-robin order.
+
+    If `weights` are given, a source is allowed to send up to its weight number
+    of batches per round. A source is enqueued at the tail after each batch,
+    such that it spends its weight interleaved with the other sources; a source
+    that spent its weight is skipped until all ready sources spent theirs.
+    """
+
+    def __init__(
+            self,
+            sources: List[Observable],
+            weights: List[int] = None,
+    ):
+        """
+        :param sources: observables whose elements get merged
+        :param weights: number of batches a source can send per round
+        """
+
+        super().__init__()
+
+        assert weights is None or len(weights) == len(sources), \
+            f'number of weights "{len(weights)}" must match number of sources "{len(sources)}"'
+
+        self.sources = sources
+        self.weights = weights
+
+        self.lock = threading.RLock()
+
+        self.observer: Optional[Observer] = None
+
+        n_sources = len(sources)
+
+        # at most one batch is buffered per source
+        self.buffered: List[Optional[Tuple[ElementType, AckSubject]]] = [None] * n_sources
+
+        # sources with a buffered batch in the order they are served
+        self.ready = deque()
+
+        # remaining number of batches a source can send in the current round
+        self.credits = list(weights) if weights is not None else None
+
+        # set while the downstream observer did not acknowledge the last batch
+        self.is_sending = False
+        self.n_completed = 0
+        self.is_stopped = False
+
+        outer_self = self
+
+        class ResumeSingle(Single):
+            def on_next(self, ack: Ack):
+                if isinstance(ack, ContinueAck):
+                    next_batch = outer_self._next_batch()
+
+                    if next_batch is not None:
+                        outer_self._send_loop(*next_batch)
+
+                else:
+                    outer_self._stop()
+
+        self.resume_single = ResumeSingle()
+
+    def _served(self, index: int):
+        """
+        The lock is held by the caller.
+        """
+
+        if self.weights is not None:
+            self.credits[index] -= 1
+
+    def _pop_ready(self) -> int:
+        """
+        The lock is held by the caller.
+        """
+
+        if self.weights is not None:
+            # skip the sources that spent their weight in the current round
+            for _ in range(len(self.ready)):
+                if 0 < self.credits[self.ready[0]]:
+                    break
+
+                self.ready.rotate(-1)
+
+            else:
+                # all ready sources spent their weight, a new round starts
+                self.credits = list(self.weights)
+
+        return self.ready.popleft()
+
+    def _next_batch(self) -> Optional[Tuple[ElementType, AckSubject]]:
+        """
+        Return the next buffered batch, or return None and signal completion if all
+        sources completed.
+        """
+
+        with self.lock:
+            if self.is_stopped:
+                return None
+
+            if self.ready:
+                index = self._pop_ready()
+                next_batch = self.buffered[index]
+                self.buffered[index] = None
+                self._served(index)
+                return next_batch
+
+            self.is_sending = False
+
+            if self.n_completed < len(self.sources):
+                return None
+
+            self.is_stopped = True
+
+        self.observer.on_completed()
+        return None
+
+    def _stop(self) -> None:
+        with self.lock:
+            self.is_stopped = True
+            acks = [buffered[1] for buffered in self.buffered if buffered is not None]
+            self.buffered = [None] * len(self.buffered)
+            self.ready.clear()
+
+        for ack in acks:
+            ack.on_next(stop_ack)
+
+    def _send_loop(self, elem: ElementType, upstream_ack: Optional[AckSubject]) -> Ack:
+        while True:
+            ack = self.observer.on_next(elem)
+
+            if isinstance(ack, StopAck):
+                self._stop()
+
+                if upstream_ack is not None:
+                    upstream_ack.on_next(stop_ack)
+                return stop_ack
+
+            # request the next batch from the source of the batch just sent
+            if upstream_ack is not None:
+                upstream_ack.on_next(continue_ack)
+
+            if not isinstance(ack, ContinueAck):
+                ack.subscribe(self.resume_single)
+                return continue_ack
+
+            next_batch = self._next_batch()
+
+            if next_batch is None:
+                return continue_ack
+
+            elem, upstream_ack = next_batch
+
+    def _on_next(self, index: int, elem: ElementType):
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            if self.is_sending:
+                upstream_ack = AckSubject()
+                self.buffered[index] = (elem, upstream_ack)
+                self.ready.append(index)
+                return upstream_ack
+
+            self.is_sending = True
+            self._served(index)
+
+        return self._send_loop(elem, None)
+
+    def _on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+        self._stop()
+        self.observer.on_error(exc)
+
+    def _on_completed(self):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.n_completed += 1
+
+            # remaining batches are sent before completing
+            if self.n_completed < len(self.sources) or self.is_sending:
+                return
+
+            self.is_stopped = True
+
+        self.observer.on_completed()
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+
+        outer_self = self
+
+        class MergeNObserver(Observer):
+            def __init__(self, index: int):
+                self.index = index
+
+            def on_next(self, elem: ElementType) -> Ack:
+                return outer_self._on_next(self.index, elem)
+
+            def on_error(self, exc: Exception):
+                outer_self._on_error(exc)
+
+            def on_completed(self):
+                outer_self._on_completed()
+
+        disposables = [
+            source.observe(observer_info.copy(observer=MergeNObserver(index)))
+            for index, source in enumerate(self.sources)
+        ]
+
+        return CompositeDisposable(*disposables)
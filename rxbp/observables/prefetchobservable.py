@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.prefetchobserver import PrefetchObserver
+from rxbp.scheduler import Scheduler
+
+
+@dataclass
+class PrefetchObservable(Observable):
+    source: Observable
+    scheduler: Scheduler
+    prefetch: int
+    replenish: int
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=PrefetchObserver(
+                observer=observer_info.observer,
+                scheduler=self.scheduler,
+                prefetch=self.prefetch,
+                replenish=self.replenish,
+            ),
+        ))
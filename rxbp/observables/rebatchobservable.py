@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from rxbp.observable import Observable
+from rxbp.observerinfo import ObserverInfo
+from rxbp.observers.rebatchobserver import RebatchObserver
+
+
+@dataclass
+class RebatchObservable(Observable):
+    source: Observable
+    size: int
+
+    def observe(self, observer_info: ObserverInfo):
+        return self.source.observe(observer_info.copy(
+            observer=RebatchObserver(
+                observer=observer_info.observer,
+                size=self.size,
+            ),
+        ))
@@ -6,6 +6,7 @@ from rxbp.observable import Observable
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc
 
 
 class ReduceObservable(Observable):
@@ -30,9 +31,15 @@ class ReduceObservable(Observable):
             ):
                 self.func = func
                 self.acc = initial
+                self.is_vectorized = is_ufunc(func)
 
             def on_next(self, elem: ElementType):
                 try:
+                    # reduce the whole numpy array at once with a numpy ufunc, e.g. `np.add`
+                    if self.is_vectorized and is_ndarray(elem):
+                        self.acc = self.func.reduce(elem, initial=self.acc)
+                        return continue_ack
+
                     if isinstance(elem, list):
                         materialized_values = elem
                     else:
@@ -0,0 +1,260 @@
+import itertools
+import threading
+from traceback import FrameSummary
+from typing import List, Optional, Any
+
+from rx.disposable import CompositeDisposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack, StopAck
+from rxbp.observable import Observable
+from rxbp.observer import Observer
+from rxbp.observerinfo import ObserverInfo
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray
+from rxbp.utils.tooperatorexception import to_operator_exception
+
+
+class ZipNObservable(Observable):
+    """
+    An observable that zips the elements of N observables into flat tuples.
+
+    Contrary to chaining binary `ZipObservable`s, a single lock protects the
+    state of all sources. The zip operation starts as soon as a batch is
+    received from each source, and all sources whose batch got exhausted are
+    acknowledged in one step by the acknowledgment returned by the downstream
+    observer. The remaining elements of the other sources are kept until the
+    next zip operation.
+    """
+
+    def __init__(
+            self,
+            sources: List[Observable],
+            stack: List[FrameSummary],
+    ):
+        """
+        :param sources: observables whose elements are zipped
+        :param stack: stack of the zip operator, added to the exceptions raised while zipping
+        """
+
+        super().__init__()
+
+        self.sources = sources
+        self.stack = stack
+
+        self.lock = threading.RLock()
+
+        self.observer: Optional[Observer] = None
+
+        n_sources = len(sources)
+
+        # remaining elements of each source, None if a new batch is requested
+        self.batches: List[Optional[Any]] = [None] * n_sources
+
+        # acknowledgments that back-pressure the sources that have remaining elements
+        self.acks: List[Optional[AckSubject]] = [None] * n_sources
+
+        self.is_completed = [False] * n_sources
+        self.n_requested = n_sources
+        self.is_stopped = False
+
+    def _zip_batches(self, batches: List[Any]):
+        """
+        Zip the batches and return the zipped elements together with the
+        remaining elements of each batch.
+        """
+
+        # zip numpy arrays without iterating over them element by element
+        if all(is_ndarray(batch) for batch in batches):
+            n_zipped = min(len(batch) for batch in batches)
+            zipped_elements = list(zip(*(batch[:n_zipped] for batch in batches)))
+
+            # the remaining elements are kept as views on the original numpy arrays
+            remaining = [batch[n_zipped:] if n_zipped < len(batch) else None for batch in batches]
+            return zipped_elements, remaining
+
+        iterators = [iter(batch) for batch in batches]
+        n_sources = len(iterators)
+
+        zipped_elements = []
+        while True:
+            values = []
+            for iterator in iterators:
+                try:
+                    values.append(next(iterator))
+                except StopIteration:
+                    break
+
+            if len(values) < n_sources:
+                break
+
+            zipped_elements.append(tuple(values))
+
+        # the values taken from the sources before the exhausted source are put back
+        n_taken = len(values)
+        remaining = [itertools.chain([value], iterator) for value, iterator in zip(values, iterators)]
+        remaining.append(None)
+
+        # check if the sources after the exhausted source have remaining elements
+        for iterator in iterators[n_taken + 1:]:
+            try:
+                value = next(iterator)
+                remaining.append(itertools.chain([value], iterator))
+            except StopIteration:
+                remaining.append(None)
+
+        return zipped_elements, remaining
+
+    def _stop_sources(self):
+        """
+        Stop the zip observable and return the acknowledgments of the back-pressured
+        sources; the lock is held by the caller.
+        """
+
+        self.is_stopped = True
+        acks = [ack for ack in self.acks if ack is not None]
+        self.acks = [None] * len(self.acks)
+        return acks
+
+    def _on_next(self, index: int, elem: ElementType):
+        upstream_ack = AckSubject()
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            # numpy arrays are kept as they are such that they can be zipped as a whole
+            self.batches[index] = elem if is_ndarray(elem) else iter(elem)
+            self.acks[index] = upstream_ack
+            self.n_requested -= 1
+
+            # wait on the other sources
+            if 0 < self.n_requested:
+                return upstream_ack
+
+            # all sources are back-pressured, therefore no other `on_next` call can
+            # interfere with the zip operation
+            batches = list(self.batches)
+
+        try:
+            zipped_elements, remaining = self._zip_batches(batches)
+        except Exception as exc:
+            with self.lock:
+                acks = self._stop_sources()
+
+            # the exception is linked to the zip operator like in the binary `ZipObservable`
+            self.observer.on_error(Exception(to_operator_exception(
+                message=f'zipping the batches failed with "{exc!r}"',
+                stack=self.stack,
+            )))
+
+            for ack in acks:
+                ack.on_next(stop_ack)
+            return stop_ack
+
+        if 0 < len(zipped_elements):
+            downstream_ack = self.observer.on_next(zipped_elements)
+        else:
+            downstream_ack = continue_ack
+
+        if isinstance(downstream_ack, StopAck):
+            with self.lock:
+                acks = self._stop_sources()
+
+            for ack in acks:
+                if ack is not upstream_ack:
+                    ack.on_next(stop_ack)
+            return stop_ack
+
+        with self.lock:
+            requested = [idx for idx, batch in enumerate(remaining) if batch is None]
+
+            # a completed source cannot provide any further element
+            if any(self.is_completed[idx] for idx in requested):
+                acks = self._stop_sources()
+                is_completed = True
+
+            else:
+                acks = [self.acks[idx] for idx in requested]
+
+                for idx in requested:
+                    self.acks[idx] = None
+
+                self.batches = remaining
+                self.n_requested = len(requested)
+                is_completed = False
+
+        if is_completed:
+            self.observer.on_completed()
+
+            for ack in acks:
+                if ack is not upstream_ack:
+                    ack.on_next(stop_ack)
+            return stop_ack
+
+        # request new elements from all exhausted sources at once
+        for idx, ack in zip(requested, acks):
+            if idx != index:
+                downstream_ack.subscribe(ack)
+
+        if index in requested:
+            return downstream_ack
+        else:
+            return upstream_ack
+
+    def _on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            acks = self._stop_sources()
+
+        self.observer.on_error(exc)
+
+        for ack in acks:
+            ack.on_next(stop_ack)
+
+    def _on_completed(self, index: int):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.is_completed[index] = True
+
+            # the remaining elements of the source are zipped first
+            if self.batches[index] is not None:
+                return
+
+            acks = self._stop_sources()
+
+        self.observer.on_completed()
+
+        for ack in acks:
+            ack.on_next(stop_ack)
+
+    def observe(self, observer_info: ObserverInfo):
+        self.observer = observer_info.observer
+
+        outer_self = self
+
+        class ZipNObserver(Observer):
+            def __init__(self, index: int):
+                self.index = index
+
+            def on_next(self, elem: ElementType) -> Ack:
+                return outer_self._on_next(self.index, elem)
+
+            def on_error(self, exc: Exception):
+                outer_self._on_error(exc)
+
+            def on_completed(self):
+                outer_self._on_completed(self.index)
+
+        disposables = [
+            source.observe(observer_info.copy(observer=ZipNObserver(index)))
+            for index, source in enumerate(self.sources)
+        ]
+
+        return CompositeDisposable(*disposables)
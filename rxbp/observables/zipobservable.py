@@ -17,6 +17,7 @@ from rxbp.states.measuredstates.zipstates import ZipStates
 from rxbp.states.rawstates.rawterminationstates import RawTerminationStates
 from rxbp.states.rawstates.rawzipstates import RawZipStates
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray
 from rxbp.utils.tooperatorexception import to_operator_exception
 
 
@@ -77,8 +78,12 @@ class ZipObservable(Observable):
         this function is called on `on_next` call from left or right observable
         """
 
-        # if elem is a list, make an iterator out of it
-        iterable = iter(elem)
+        # if elem is a list, make an iterator out of it; numpy arrays are
+        # kept as they are such that they can be zipped as a whole
+        if is_ndarray(elem):
+            iterable = elem
+        else:
+            iterable = iter(elem)
 
         # in case the zip process is started and the output observer returns a synchronous acknowledgment,
         # then `upstream_ack` is not actually needed; nevertheless, it is created here, because it makes
@@ -118,68 +123,99 @@ class ZipObservable(Observable):
         else:
             raise Exception(f'unknown state "{meas_state}", is_left {is_left}')
 
-        # in case left and right batch don't match in number of elements,
-        # n1 will not be None after zipping
-        n1 = [None]
+        left_batch = meas_state.left_iter
+        right_batch = meas_state.right_iter
 
-        def gen_zipped_elements():
-            """ generate a sequence of zipped elements """
-            while True:
-                n1[0] = None
-                try:
-                    n1[0] = next(meas_state.left_iter)
-                    n2 = next(meas_state.right_iter)
-                except StopIteration:
-                    break
+        # zip two numpy arrays without iterating over them element by element
+        if is_ndarray(left_batch) and is_ndarray(right_batch):
+            n_zipped = min(len(left_batch), len(right_batch))
+            zipped_elements = list(zip(left_batch[:n_zipped], right_batch[:n_zipped]))
 
-                # yield self.selector(n1[0], n2)
-                yield (n1[0], n2)
+            # the remaining elements are kept as views on the original numpy arrays
+            if n_zipped < len(left_batch):
+                new_left_iter = left_batch[n_zipped:]
+                new_right_iter = None
+                request_new_elem_from_left = False
+                request_new_elem_from_right = True
 
-        try:
-            # zip left and right batch
-            zipped_elements = list(gen_zipped_elements())
+            elif n_zipped < len(right_batch):
+                new_left_iter = None
+                new_right_iter = right_batch[n_zipped:]
+                request_new_elem_from_left = True
+                request_new_elem_from_right = False
 
-        except Exception as exc:
-            # self.observer.on_error(exc)
-            other_upstream_ack.on_next(stop_ack)
-            # return stop_ack
-            raise Exception(to_operator_exception(
-                message='',
-                stack=self.stack,
-            ))
+            else:
+                new_left_iter = None
+                new_right_iter = None
+                request_new_elem_from_left = True
+                request_new_elem_from_right = True
 
-        if 0 < len(zipped_elements):
-            downstream_ack = self.observer.on_next(zipped_elements)
         else:
-            downstream_ack = continue_ack
+            left_iter = iter(left_batch)
+            right_iter = iter(right_batch)
+
+            # in case left and right batch don't match in number of elements,
+            # n1 will not be None after zipping
+            n1 = [None]
+
+            def gen_zipped_elements():
+                """ generate a sequence of zipped elements """
+                while True:
+                    n1[0] = None
+                    try:
+                        n1[0] = next(left_iter)
+                        n2 = next(right_iter)
+                    except StopIteration:
+                        break
+
+                    # yield self.selector(n1[0], n2)
+                    yield (n1[0], n2)
 
-        if isinstance(downstream_ack, StopAck):
-            other_upstream_ack.on_next(stop_ack)
-            return stop_ack
+            try:
+                # zip left and right batch
+                zipped_elements = list(gen_zipped_elements())
 
-        # request new element from left source
-        if n1[0] is None:
-            new_left_iter = None
-            request_new_elem_from_left = True
+            except Exception as exc:
+                # self.observer.on_error(exc)
+                other_upstream_ack.on_next(stop_ack)
+                # return stop_ack
+                raise Exception(to_operator_exception(
+                    message='',
+                    stack=self.stack,
+                ))
+
+            # request new element from left source
+            if n1[0] is None:
+                new_left_iter = None
+                request_new_elem_from_left = True
+
+                # request new element also from right source?
+                try:
+                    val = next(right_iter)
+                    new_right_iter = itertools.chain([val], right_iter)
+                    request_new_elem_from_right = False
 
-            # request new element also from right source?
-            try:
-                val = next(meas_state.right_iter)
-                new_right_iter = itertools.chain([val], meas_state.right_iter)
-                request_new_elem_from_right = False
+                # request new element from left and right source
+                except StopIteration:
+                    new_right_iter = None
+                    request_new_elem_from_right = True
 
-            # request new element from left and right source
-            except StopIteration:
+            # request new element only from right source
+            else:
+                new_left_iter = itertools.chain(n1, left_iter)
                 new_right_iter = None
+
+                request_new_elem_from_left = False
                 request_new_elem_from_right = True
 
-        # request new element only from right source
+        if 0 < len(zipped_elements):
+            downstream_ack = self.observer.on_next(zipped_elements)
         else:
-            new_left_iter = itertools.chain(n1, meas_state.left_iter)
-            new_right_iter = None
+            downstream_ack = continue_ack
 
-            request_new_elem_from_left = False
-            request_new_elem_from_right = True
+        if isinstance(downstream_ack, StopAck):
+            other_upstream_ack.on_next(stop_ack)
+            return stop_ack
 
         # define next state after zipping
         # -------------------------------
@@ -2,7 +2,8 @@ import threading
 import types
 from abc import abstractmethod, ABC
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Any, Tuple
+from collections import deque
+from typing import List, Dict, Optional, Any, Tuple, Deque, Callable
 
 import rx
 from rx.core.notification import OnNext, OnCompleted, OnError, Notification
@@ -18,6 +19,8 @@ from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.observablesubjects.observablesubjectbase import ObservableSubjectBase
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
+from rxbp.lagmetrics import LagMetrics
+from rxbp.lagpolicy import BACKPRESSURE, DROP_OLDEST, lag_policies
 from rxbp.scheduler import Scheduler
 from rxbp.typing import ElementType
 
@@ -26,51 +29,241 @@ from rxbp.typing import ElementType
 class CacheServeFirstObservableSubject(ObservableSubjectBase):
     """ A observable Subject that does not back-pressure on a `on_next` call
     and buffers the last elements according to the slowest subscriber.
+
+    The maximum lag bounds the number of elements the slowest subscriber lags
+    behind the fastest one, or the total size of these elements if `size_func`
+    is given. Once exceeded, the lag policy is applied (see `rxbp.lagpolicy`).
+    The lag metrics are published to `lag_metrics` if given.
     """
     scheduler: Scheduler
+    max_lag: int = None
+    lag_policy: str = None
+    size_func: Callable[[Any], int] = None
+    lag_metrics: LagMetrics = None
 
     def __post_init__(self):
-        self.shared_state = self.SharedState()
+        assert self.max_lag is None or 0 < self.max_lag, f'maximum lag "{self.max_lag}" must be positive'
+        assert self.lag_policy is None or self.lag_policy in lag_policies, \
+            f'lag policy "{self.lag_policy}" must be one of {lag_policies}'
+
+        self.shared_state = self.SharedState(
+            max_lag=self.max_lag,
+            lag_policy=self.lag_policy or BACKPRESSURE,
+            size_func=self.size_func,
+        )
+
+        if self.lag_metrics is not None:
+            self.lag_metrics.attach(self.get_lag_snapshot)
+
+    def get_lag_snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current lag of each subscription together with the batches dropped
+        for it, the largest lag observed so far and the number of detached subscriptions.
+        """
+
+        return self.shared_state.get_lag_snapshot()
 
     class SharedState:
         """
         The shared state needs to be accessed via a lock
         """
 
-        def __init__(self):
+        def __init__(
+                self,
+                max_lag: int = None,
+                lag_policy: str = BACKPRESSURE,
+                size_func: Callable[[Any], int] = None,
+        ):
+
+            self.max_lag = max_lag
+            self.lag_policy = lag_policy
+            self.size_func = size_func
 
             self.lock = threading.RLock()
 
             self.state = CacheServeFirstObservableSubject.NormalState()
 
-            # notification buffer
-            # self.first_idx = -1
-            self.queue: List[Notification] = []
+            # notification buffer, the first notification has the sequence number `first_index`
+            self.queue: Deque[Notification] = deque()
+            self.first_index = 0
+
+            # total size of the notifications added before the corresponding notification
+            # in the buffer, used to determine the lag of an inner subscription in O(1)
+            self.cum_sizes: Deque[int] = deque()
+            self.total_size = 0
+
+            # set while the upstream is back-pressured because the lag exceeds the buffer size
+            self.is_lag_exceeded = False
+
+            # inner subscriptions detached due to their lag and the error they will receive
+            self.detached: Dict['CacheServeFirstObservableSubject.InnerSubscription', Exception] = {}
+
+            # lag metrics
+            self.largest_lag = 0
+            self.n_detached = 0
+            self.n_dropped_batches: Dict['CacheServeFirstObservableSubject.InnerSubscription', int] = {}
 
             # contains inner subscriptions that are currently inactive, e.g. they sent
             # all elements in the buffer
             self.inactive_subscriptions = []
 
-            # used for deque the buffer
+            # sequence number of the next notification sent to an inner subscription; the sequence
+            # numbers increase monotonically, therefore they are not updated when the buffer is dequeued
             self.current_index: Dict['CacheServeFirstObservableSubject.InnerSubscription', int] = {}
 
+            # number of inner subscriptions per sequence number, used to dequeue the buffer
+            self.n_subscriptions_at: Dict[int, int] = {}
+
             # the inner subscription reaching the end of the buffer requests a new element
             self.current_ack: Optional[AckSubject] = None
 
             self.is_disposed = False
 
+        def _enter_index(self, index: int):
+            self.n_subscriptions_at[index] = self.n_subscriptions_at.get(index, 0) + 1
+
+        def _leave_index(self, index: int):
+            """
+            Dequeue the buffer if no inner subscription depends on the first elements
+            anymore; the lock is held by the caller.
+            """
+
+            n_subscriptions = self.n_subscriptions_at[index] - 1
+
+            if 0 < n_subscriptions:
+                self.n_subscriptions_at[index] = n_subscriptions
+                return
+
+            del self.n_subscriptions_at[index]
+
+            # only the first element can become obsolete, each element is dequeued once
+            if index == self.first_index:
+                while self.queue and self.first_index not in self.n_subscriptions_at:
+                    self.queue.popleft()
+                    self.cum_sizes.popleft()
+                    self.first_index += 1
+
+                # resume the back-pressured upstream if some inner subscription waits for an element
+                if self.is_lag_exceeded and not self._is_buffer_exceeded():
+                    self.is_lag_exceeded = False
+
+                    if self.inactive_subscriptions:
+                        self.current_ack.on_next(continue_ack)
+
+        def _lag_of(self, index: int) -> int:
+            offset = index - self.first_index
+
+            if len(self.queue) <= offset:
+                return 0
+
+            return self.total_size - self.cum_sizes[offset]
+
+        def _is_buffer_exceeded(self) -> bool:
+            """
+            The buffer always keeps the last notification, even if its size exceeds the
+            buffer size.
+            """
+
+            return 1 < len(self.queue) and self.max_lag < self._lag_of(self.first_index)
+
+        def _append(self, notification: Notification, size: int):
+            self.queue.append(notification)
+            self.cum_sizes.append(self.total_size)
+            self.total_size += size
+
+        def _move_index(self, subscription, index: int):
+            self.current_index[subscription] = index
+            self._enter_index(index)
+
+        def _handle_overflow(self):
+            """
+            Apply the lag policy on the inner subscriptions lagging behind more than
+            the maximum lag; the lock is held by the caller.
+            """
+
+            if not self._is_buffer_exceeded():
+                return
+
+            if self.lag_policy == BACKPRESSURE:
+                self.is_lag_exceeded = True
+                return
+
+            last_index = self.first_index + len(self.queue) - 1
+
+            lagging = [
+                (subscription, index) for subscription, index in self.current_index.items()
+                if index < last_index and self.max_lag < self._lag_of(index)
+            ]
+
+            for subscription, index in lagging:
+                if self.lag_policy == DROP_OLDEST:
+                    next_index = index
+                    while next_index < last_index and self.max_lag < self._lag_of(next_index):
+                        next_index += 1
+
+                    self.n_dropped_batches[subscription] = \
+                        self.n_dropped_batches.get(subscription, 0) + next_index - index
+                    self._move_index(subscription, next_index)
+
+                else:
+                    del self.current_index[subscription]
+                    self.detached[subscription] = Exception(
+                        f'subscriber lags behind more than {self.max_lag} and got detached',
+                    )
+                    self.n_detached += 1
+
+                self._leave_index(index)
+
+            # stop the upstream if all inner subscriptions got detached
+            if not self.current_index:
+                self.current_ack.on_next(stop_ack)
+
+        def get_lag_snapshot(self) -> Dict[str, Any]:
+            with self.lock:
+                if self.current_index is None:
+                    subscriptions = []
+
+                else:
+                    subscriptions = [
+                        {
+                            'lag': self._lag_of(index),
+                            'dropped_batches': self.n_dropped_batches.get(subscription, 0),
+                        }
+                        for subscription, index in self.current_index.items()
+                    ]
+
+                return {
+                    'subscriptions': subscriptions,
+                    'largest_lag': self.largest_lag,
+                    'n_detached': self.n_detached,
+                }
+
         def add_inner_subscription(self, subscription):
             with self.lock:
                 self.inactive_subscriptions.append(subscription)
-                self.current_index[subscription] = len(self.queue)
+
+                index = self.first_index + len(self.queue)
+                self.current_index[subscription] = index
+                self._enter_index(index)
 
         def dispose_subscription(self, subscription: 'CacheServeFirstObservableSubject.InnerSubscription'):
+            if self.is_disposed:
+                return
+
             with self.lock:
-                del self.current_index[subscription]
+                self.detached.pop(subscription, None)
+                self.n_dropped_batches.pop(subscription, None)
+
+                # subscription got detached or is already disposed
+                if subscription not in self.current_index:
+                    return
+
+                index = self.current_index.pop(subscription)
+                self._leave_index(index)
                 n_others = len(self.current_index)
 
                 if subscription in self.inactive_subscriptions:
-                    del self.inactive_subscriptions[subscription]
+                    self.inactive_subscriptions.remove(subscription)
 
             if n_others == 0:
                 self.current_ack.on_next(stop_ack)
@@ -82,6 +275,10 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
                 self.queue = None
                 self.inactive_subscriptions = None
                 self.current_index = None
+                self.n_subscriptions_at = None
+                self.cum_sizes = None
+                self.detached = None
+                self.n_dropped_batches = None
                 self.current_ack = None
 
                 self.add_inner_subscription = types.MethodType(lambda _: None, self)
@@ -104,32 +301,31 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
             with self.lock:
                 if subscription not in self.current_index:
+
+                    # a detached subscription receives an error instead of the next element
+                    if subscription in self.detached:
+                        return True, OnError(self.detached.pop(subscription))
+
                     return False, None
 
-                last_index = len(self.queue)
                 index = self.current_index[subscription]
+                offset = index - self.first_index
 
-                has_elem = index < last_index
+                has_elem = offset < len(self.queue)
 
                 # has items in buffer
                 if has_elem:
-                    notification = self.queue[index]
+                    notification = self.queue[offset]
 
                     # update current index
-                    self.current_index[subscription] += 1
-
-                    # dequeue buffer if no subscription depend on first element
-                    if 0 < min(self.current_index.values()):
-                        self.queue.pop(0)
-
-                        for key in self.current_index.keys():
-                            self.current_index[key] -= 1
+                    self._move_index(subscription, index + 1)
+                    self._leave_index(index)
 
                 # has no items in buffer
                 else:
                     self.inactive_subscriptions.append(subscription)
 
-                    if len(self.inactive_subscriptions) == 1:
+                    if len(self.inactive_subscriptions) == 1 and not self.is_lag_exceeded:
                         self.current_ack.on_next(continue_ack)
 
                     notification = None
@@ -137,13 +333,33 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             return has_elem, notification
 
         def on_next(self, elem: ElementType, ack: AckSubject) -> Tuple[List, int]:
+            if self.size_func is None:
+                size = len(elem)
+            else:
+                size = sum(self.size_func(e) for e in elem)
+
             with self.lock:
-                self.queue.append(OnNext(elem))
+                index = self.first_index + len(self.queue)
+                self._append(OnNext(elem), size)
                 self.current_ack = ack
 
                 inactive_subscriptions = self.inactive_subscriptions
                 self.inactive_subscriptions = []
 
+                # the inactive subscriptions get the element sent directly
+                for subscription in inactive_subscriptions:
+                    if subscription in self.current_index:
+                        self._move_index(subscription, index + 1)
+                        self._leave_index(index)
+
+                lag = self._lag_of(self.first_index)
+
+                if self.largest_lag < lag:
+                    self.largest_lag = lag
+
+                if self.max_lag is not None:
+                    self._handle_overflow()
+
             return inactive_subscriptions
 
         def on_completed(self) -> List:
@@ -153,7 +369,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
                 state.prev_state = self.state
                 self.state = state
 
-                self.queue.append(OnCompleted())
+                self._append(OnCompleted(), 0)
 
                 inactive_subscriptions = self.inactive_subscriptions
                 self.inactive_subscriptions = []
@@ -167,7 +383,7 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
                 state.prev_state = self.state
                 self.state = state
 
-                self.queue.append(OnError(exception))
+                self._append(OnError(exception), 0)
 
                 inactive_subscriptions = self.inactive_subscriptions
                 self.inactive_subscriptions = []
@@ -293,6 +509,11 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
             # a while loop instead of recursive function calls is faster and avoids a stack overflow error
             while True:
 
+                # subscription got detached
+                if isinstance(notification, OnError):
+                    self.observer.on_error(notification.exception)
+                    break
+
                 # subscription is disposed
                 if self not in self.shared_state.current_index:
                     break
@@ -412,8 +633,11 @@ class CacheServeFirstObservableSubject(ObservableSubjectBase):
 
         continue_acks = [ack for ack in inner_ack_list if isinstance(ack, ContinueAck)]
 
-        # return any Continue
-        if 0 < len(continue_acks):
+        # return any Continue unless the lag exceeds the buffer size
+        with self.shared_state.lock:
+            is_lag_exceeded = self.shared_state.is_lag_exceeded
+
+        if 0 < len(continue_acks) and not is_lag_exceeded:
             return continue_ack
 
         else:
@@ -6,9 +6,9 @@ from typing import List, Callable
 import rx
 from rx.disposable import Disposable
 
-from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
-from rxbp.acknowledgement.operators.reduceack import reduce_ack
+from rxbp.acknowledgement.countdownack import CountdownAck
 from rxbp.acknowledgement.single import Single
 from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.observablesubjects.observablesubjectbase import ObservableSubjectBase
@@ -57,8 +57,25 @@ class PublishObservableSubject(ObservableSubjectBase):
         self.lock = threading.RLock()
 
     @dataclass
-    class InnerSubscription:
+    class InnerSubscription(Single):
+        """
+        Counts down the aggregated acknowledgment of the last batch once the
+        observer acknowledges it.
+        """
+
         next_observer: Observer
+        subject: 'PublishObservableSubject'
+
+        # at most one batch at a time is sent to the observer
+        countdown: CountdownAck = None
+
+        def on_next(self, ack: Ack):
+            if isinstance(ack, StopAck):
+                is_stopped = self.subject._remove_subscription(self)
+                self.countdown.count_down(stop_ack if is_stopped else continue_ack)
+
+            else:
+                self.countdown.count_down()
 
     def observe(
             self,
@@ -67,6 +84,7 @@ class PublishObservableSubject(ObservableSubjectBase):
 
         inner_subscription = self.InnerSubscription(
             next_observer=observer_info.observer,
+            subject=self,
         )
 
         with self.lock:
@@ -123,78 +141,55 @@ class PublishObservableSubject(ObservableSubjectBase):
         if len(subscriptions) == 0:
             return continue_ack
 
-        def gen_acks():
-            for subscription in subscriptions:
+        # the aggregated acknowledgment is only created once an observer returns an
+        # asynchronous acknowledgment
+        countdown = None
+        is_stopped = False
 
-                # synchronize on_next call to conform with Observer convention
-                with self.lock:
-                    ack = subscription.next_observer.on_next(materialized_values)
-
-                if isinstance(ack, StopAck):
-                    with self.lock:
-                        try:
-                            self.subscriptions.remove(subscription)
-                        except ValueError:
-                            pass
-
-                        n_subscriptions = len(self.subscriptions)
-
-                    if n_subscriptions == 0:
-                        return stop_ack
-
-                elif isinstance(ack, AckSubject):
-                    @dataclass
-                    class SubscriptionSingle(Single):
-                        subscriptions: List['PublishObservableSubject.InnerSubscription']
-                        subscription: 'PublishObservableSubject.InnerSubscription'
-                        out_ack: AckSubject
-                        lock: threading.RLock
-
-                        def on_next(self, elem):
-                            if isinstance(ack, StopAck):
-                                with self.lock:
-                                    try:
-                                        self.subscriptions.remove(subscription)
-                                    except ValueError:
-                                        pass
-
-                                    n_subscriptions = len(self.subscriptions)
-
-                                if n_subscriptions == 0:
-                                    self.out_ack.on_next(stop_ack)
-                                    return
-
-                            else:
-                                self.out_ack.on_next(elem)
-
-                    out_ack = AckSubject()
-                    ack.subscribe(SubscriptionSingle(
-                        subscriptions=self.subscriptions,
-                        subscription=subscription,
-                        out_ack=out_ack,
-                        lock=self.lock,
-                    ))
-                    yield out_ack
-
-                else:
-                    yield ack
-
-        acks = list(gen_acks())
-
-        async_ack = [ack for ack in acks if not isinstance(ack, ContinueAck)]
-
-        if len(async_ack) == 0:
-            return continue_ack
+        for index, subscription in enumerate(subscriptions):
+
+            # synchronize on_next call to conform with Observer convention
+            with self.lock:
+                ack = subscription.next_observer.on_next(materialized_values)
+
+            if isinstance(ack, ContinueAck):
+                if countdown is not None:
+                    countdown.count_down()
+
+            elif isinstance(ack, StopAck):
+                is_stopped = self._remove_subscription(subscription)
+
+                if countdown is not None:
+                    countdown.count_down(stop_ack if is_stopped else continue_ack)
 
-        elif len(async_ack) == 1:
-            return async_ack[0]
+            else:
+                if countdown is None:
+                    countdown = CountdownAck(count=len(subscriptions) - index)
+
+                subscription.countdown = countdown
+                ack.subscribe(subscription)
+
+        if countdown is not None:
+            return countdown
+
+        elif is_stopped:
+            return stop_ack
 
         else:
-            return reduce_ack(
-                sources=async_ack,
-                func=lambda acc, v: v if isinstance(v, StopAck) else acc,
-                initial=continue_ack,
-            )
+            return continue_ack
+
+    def _remove_subscription(self, subscription: 'PublishObservableSubject.InnerSubscription') -> bool:
+        """
+        Remove the subscription and return True if no subscription is left.
+        """
+
+        with self.lock:
+            try:
+                self.subscriptions.remove(subscription)
+            except ValueError:
+                pass
+
+            return len(self.subscriptions) == 0
 
     def on_error(self, exc):
         state = self.ExceptionState(exc=exc)
@@ -0,0 +1,167 @@
+import threading
+from typing import Any, List, Optional, Callable
+
+from rx.core.typing import Disposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+
+
+class AdaptiveBatchObserver:
+    """
+    An rx Observer that collects the elements emitted by an rx Observable into
+    batches and sends them to an rxbp Observer. The size of the batches adapts to
+    the arrival rate of the elements and to the speed of the consumer, see
+    `AdaptiveBatchSize`.
+    """
+
+    def __init__(
+            self,
+            observer: Observer,
+            scheduler: Scheduler,
+            batch_size: AdaptiveBatchSize,
+            get_backlog: Callable[[], int] = None,
+    ):
+        """
+        :param get_backlog: returns the number of batches sent to the rxbp Observer, but
+        not yet consumed downstream; the rxbp Observer is usually a buffer that
+        acknowledges immediately, in which case the acknowledgment latency tells
+        nothing about the consumer
+        """
+
+        self.observer = observer
+        self.scheduler = scheduler
+        self.batch_size = batch_size
+        self.get_backlog = get_backlog
+
+        self.lock = threading.RLock()
+
+        self.current_size = batch_size.min_size
+        self.pending: List[Any] = []
+        self.first_arrival = None
+        self.is_stopped = False
+
+        # identifies the current batch such that outdated linger timers are ignored
+        self.batch_index = 0
+        self.timer: Optional[Disposable] = None
+
+        # acknowledgment latency of the last asynchronous acknowledgment
+        self.sent_at = None
+        self.is_ack_pending = False
+        self.ack_latency = 0.0
+
+        outer_self = self
+
+        class LatencySingle(Single):
+            def on_next(self, ack: Ack):
+                with outer_self.lock:
+                    outer_self.ack_latency = (outer_self.scheduler.now - outer_self.sent_at).total_seconds()
+                    outer_self.is_ack_pending = False
+
+                    if isinstance(ack, StopAck):
+                        outer_self._stop()
+
+        self.latency_single = LatencySingle()
+
+    def _stop(self):
+        self.is_stopped = True
+        self.pending = []
+
+        if self.timer is not None:
+            self.timer.dispose()
+            self.timer = None
+
+    def _adapt(self, is_lingered: bool, fill_time: float):
+        max_linger = self.batch_size.max_linger
+
+        # the previous batch is not consumed yet
+        has_backlog = self.get_backlog is not None and 0 < self.get_backlog()
+
+        is_downstream_slow = has_backlog or self.is_ack_pending or max_linger < self.ack_latency
+        is_arrival_fast = not is_lingered and fill_time < max_linger / 2
+
+        if is_downstream_slow or is_arrival_fast:
+            self.current_size = min(2 * self.current_size, self.batch_size.max_size)
+        elif is_lingered:
+            self.current_size = max(self.current_size // 2, self.batch_size.min_size)
+
+    def _flush(self, is_lingered: bool):
+        """
+        Send the pending elements downstream; the lock is held by the caller.
+        """
+
+        batch = self.pending
+        self.pending = []
+        self.batch_index += 1
+
+        if self.timer is not None:
+            self.timer.dispose()
+            self.timer = None
+
+        now = self.scheduler.now
+        self._adapt(is_lingered=is_lingered, fill_time=(now - self.first_arrival).total_seconds())
+
+        ack = self.observer.on_next(batch)
+
+        if isinstance(ack, ContinueAck):
+            self.ack_latency = 0.0
+
+        elif isinstance(ack, StopAck):
+            self._stop()
+
+        else:
+            self.sent_at = now
+            self.is_ack_pending = True
+            ack.subscribe(self.latency_single)
+
+    def _start_timer(self):
+        batch_index = self.batch_index
+
+        def action(_, __):
+            with self.lock:
+                if not self.is_stopped and batch_index == self.batch_index and self.pending:
+                    self._flush(is_lingered=True)
+
+        self.timer = self.scheduler.schedule_relative(self.batch_size.max_linger, action)
+
+    def on_next(self, value: Any):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self.pending.append(value)
+
+            if len(self.pending) == 1:
+                self.first_arrival = self.scheduler.now
+
+            if self.current_size <= len(self.pending):
+                self._flush(is_lingered=False)
+
+            elif len(self.pending) == 1:
+                self._start_timer()
+
+    def on_error(self, exc: Exception):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            self._stop()
+
+        self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            if self.pending:
+                self._flush(is_lingered=False)
+
+            self._stop()
+
+        self.observer.on_completed()
@@ -0,0 +1,199 @@
+import threading
+from dataclasses import dataclass
+from typing import Optional, List
+
+from rx.core.typing import Disposable
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch, concat_batches
+
+
+@dataclass
+class BatchObserver(Observer):
+    """
+    Coalesces the received batches into batches of up to `max_size` elements.
+
+    The received elements are sent downstream once `max_size` elements are
+    collected, or once `max_delay` seconds elapsed since the first element of
+    the current batch was received. A batch is sent downstream only after the
+    previous batch is acknowledged.
+    """
+
+    observer: Observer
+    max_size: int
+    max_delay: Optional[float]
+    scheduler: Scheduler
+
+    def __post_init__(self):
+        self.lock = threading.RLock()
+
+        self.batches: List[ElementType] = []
+        self.n_elements = 0
+
+        # identifies the current batch such that outdated timers are ignored
+        self.batch_index = 0
+        self.timer: Optional[Disposable] = None
+
+        # acknowledgment of the last batch sent downstream
+        self.last_ack: Ack = continue_ack
+        self.is_stopped = False
+
+    def _take_batch(self) -> ElementType:
+        """
+        Remove the collected elements; the lock is held by the caller.
+        """
+
+        batch = concat_batches(self.batches)
+
+        self.batches = []
+        self.n_elements = 0
+        self.batch_index += 1
+
+        if self.timer is not None:
+            self.timer.dispose()
+            self.timer = None
+
+        return batch
+
+    def _start_timer(self):
+        batch_index = self.batch_index
+
+        def action(_, __):
+            with self.lock:
+                if self.is_stopped or batch_index != self.batch_index or self.n_elements == 0:
+                    return
+
+                batch = self._take_batch()
+                prev_ack, ack_subject = self._chain_ack()
+
+            _ = self._send(batch, prev_ack, ack_subject)
+
+        self.timer = self.scheduler.schedule_relative(self.max_delay, action)
+
+    def _chain_ack(self):
+        """
+        Reserve the position of the next batch sent downstream; the lock is
+        held by the caller such that batches are sent in the order they are taken.
+        """
+
+        prev_ack = self.last_ack
+        ack_subject = AckSubject()
+        self.last_ack = ack_subject
+        return prev_ack, ack_subject
+
+    def _send(self, batch: ElementType, prev_ack: Ack, ack_subject: AckSubject) -> Ack:
+        """
+        Send a batch downstream once the previous batch is acknowledged.
+        """
+
+        def on_next(ack: Ack):
+            ack.subscribe(ack_subject)
+
+            # skip the acknowledgment subject in the synchronous case
+            if ack.is_sync:
+                with self.lock:
+                    if self.last_ack is ack_subject:
+                        self.last_ack = ack
+
+            return ack
+
+        if isinstance(prev_ack, ContinueAck):
+            return on_next(self.observer.on_next(batch))
+
+        elif isinstance(prev_ack, StopAck):
+            ack_subject.on_next(stop_ack)
+            return stop_ack
+
+        else:
+            outer_self = self
+
+            class SendSingle(Single):
+                def on_next(self, ack: Ack):
+                    if isinstance(ack, ContinueAck):
+                        on_next(outer_self.observer.on_next(batch))
+                    else:
+                        ack_subject.on_next(stop_ack)
+
+            prev_ack.subscribe(SendSingle())
+            return ack_subject
+
+    def on_next(self, elem: ElementType):
+        try:
+            materialized = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        if len(materialized) == 0:
+            return continue_ack
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            self.batches.append(materialized)
+            self.n_elements += len(materialized)
+
+            if self.n_elements < self.max_size:
+                if self.max_delay is not None and self.timer is None:
+                    self._start_timer()
+
+                return continue_ack
+
+            batch = self._take_batch()
+            n_full = len(batch) - len(batch) % self.max_size
+
+            # the remaining elements are sent together with the next elements
+            if n_full < len(batch):
+                self.batches.append(batch[n_full:])
+                self.n_elements += len(batch) - n_full
+
+                if self.max_delay is not None:
+                    self._start_timer()
+
+            chunks = [(batch[idx:idx + self.max_size], *self._chain_ack()) for idx in range(0, n_full, self.max_size)]
+
+        ack = continue_ack
+        for chunk, prev_ack, ack_subject in chunks:
+            ack = self._send(chunk, prev_ack, ack_subject)
+
+        return ack
+
+    def on_error(self, exc):
+        with self.lock:
+            self.is_stopped = True
+            _ = self._take_batch()
+
+        self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_stopped = True
+            n_elements = self.n_elements
+            batch = self._take_batch()
+
+            if 0 < n_elements:
+                prev_ack, ack_subject = self._chain_ack()
+            else:
+                last_ack = self.last_ack
+
+        if 0 < n_elements:
+            ack = self._send(batch, prev_ack, ack_subject)
+        else:
+            ack = last_ack
+
+        outer_self = self
+
+        class CompleteSingle(Single):
+            def on_next(self, ack: Ack):
+                if isinstance(ack, ContinueAck):
+                    outer_self.observer.on_completed()
+
+        ack.subscribe(CompleteSingle())
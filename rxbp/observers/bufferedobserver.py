@@ -1,11 +1,12 @@
+import math
 import threading
+from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
 from rxbp.acknowledgement.acksubject import AckSubject
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.acknowledgement.ack import Ack
-from rxbp.acknowledgement.operators.observeon import _observe_on
 from rxbp.acknowledgement.single import Single
 from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.observer import Observer
@@ -17,6 +18,17 @@ from rxbp.typing import ElementType
 
 @dataclass
 class BufferedObserver(Observer):
+    """
+    Buffers up to `buffer_size` batches without back-pressuring the upstream
+    Observable and sends them downstream on the `scheduler`.
+
+    A non-empty queue means that the drain loop is active. The drain loop
+    sends as many batches synchronously as allowed by the execution model of
+    the scheduler. If the upstream Observable calls `on_next` on the same
+    thread the drain loop last ran on, then the batch is sent downstream
+    directly without going through the scheduler.
+    """
+
     underlying: Observer
     scheduler: Scheduler
     subscribe_scheduler: Scheduler
@@ -25,111 +37,150 @@ class BufferedObserver(Observer):
     def __post_init__(self):
         self.em = self.scheduler.get_execution_model()
 
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
 
         self.state: RawBufferedStates.State = RawBufferedStates.InitialState(meas_state=None, last_ack=continue_ack)
-        self.queue = []
-        self.back_pressure = None
+        self.queue = deque()
+        self.back_pressure: Optional[AckSubject] = None
 
-    def _start_loop(self, last_ack: Optional[Ack], next_index: int):
-        def schedule_ack(ack: Ack, next: ElementType):
-            outer_self = self
+        self.max_buffer_size = math.inf if self.buffer_size is None else self.buffer_size
 
-            class ResultSingle(Single):
-                def on_next(self, ack: Ack):
-                    if isinstance(ack, ContinueAck):
-                        last_ack = outer_self.underlying.on_next(next)
+        # the acknowledgment of the last batch sent downstream
+        self.last_ack: Ack = continue_ack
 
-                        with outer_self.lock:
-                            outer_self.queue.pop(0)
-                            len_queue = len(outer_self.queue)
-                            return_ack = outer_self.back_pressure
-                            curr_state = outer_self.state
+        # the thread the drain loop ran on the last time, used by the fast path
+        self.consumer_thread: Optional[int] = None
+        self.is_draining = False
 
-                        if len_queue == 0:
-                            is_completed = outer_self._complete(
-                                curr_state=curr_state.get_measured_state(False),
-                                prev_state=curr_state.get_measured_state(True),
-                            )
+        outer_self = self
 
-                            if not is_completed and isinstance(return_ack, AckSubject):
-                                return_ack.on_next(continue_ack)
+        # a single instance is reused for every asynchronous acknowledgment
+        class ResumeSingle(Single):
+            def on_next(self, ack: Ack):
+                if isinstance(ack, ContinueAck):
+                    outer_self.scheduler.schedule(outer_self._drain_action)
+                else:
+                    outer_self._stop()
 
-                        else:
-                            next_index = outer_self.em.next_frame_index(0)
-                            outer_self._start_loop(last_ack=last_ack, next_index=next_index)
+        self.resume_single = ResumeSingle()
 
-                    else:
-                        outer_self.state = RawBufferedStates.OnErrorOrDownStreamStopped()
+    @property
+    def backlog(self) -> int:
+        """
+        Number of buffered batches not yet sent downstream.
+        """
 
-            _observe_on(ack, self.scheduler).subscribe(ResultSingle())
+        return len(self.queue)
 
-        while True:
-            next = self.queue[0]
+    def _stop(self):
+        with self.lock:
+            self.state = RawBufferedStates.OnErrorOrDownStreamStopped()
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
 
-            if next_index == 0:
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
 
-                if isinstance(last_ack, ContinueAck):
-                    last_ack = self.underlying.on_next(next)
+    def _drain_action(self, _, __):
+        self.consumer_thread = threading.get_ident()
+        self._drain()
+
+    def _drain(self):
+        self.is_draining = True
+
+        try:
+            sync_index = 0
 
-                    with self.lock:
-                        self.queue.pop(0)
-                        len_queue = len(self.queue)
+            while True:
+                # the queue is only emptied by the drain loop itself
+                last_ack = self.underlying.on_next(self.queue[0])
+
+                with self.lock:
+                    self.queue.popleft()
+                    len_queue = len(self.queue)
+                    self.last_ack = last_ack
+
+                    # release the upstream as soon as there is space in the buffer
+                    if len_queue <= self.max_buffer_size:
                         upstream_ack = self.back_pressure
-                        curr_state = self.state
+                        self.back_pressure = None
+                    else:
+                        upstream_ack = None
 
-                    if len_queue == 0:
-                        is_completed = self._complete(
-                            curr_state=curr_state.get_measured_state(False),
-                            prev_state=curr_state.get_measured_state(True),
-                        )
+                    curr_state = self.state
 
-                        if is_completed:
-                            return
+                if isinstance(last_ack, StopAck):
+                    self._stop()
 
-                        elif isinstance(upstream_ack, AckSubject):
-                            upstream_ack.on_next(continue_ack)
+                    if upstream_ack is not None:
+                        upstream_ack.on_next(stop_ack)
+                    return
 
-                        else:
-                            return
+                if len_queue == 0:
+                    is_completed = self._complete(
+                        curr_state=curr_state.get_measured_state(False),
+                        prev_state=curr_state.get_measured_state(True),
+                    )
 
-                    next_index = self.em.next_frame_index(next_index)
+                    if not is_completed and upstream_ack is not None:
+                        upstream_ack.on_next(continue_ack)
 
-                elif isinstance(last_ack, StopAck):
-                    self.state = RawBufferedStates.OnErrorOrDownStreamStopped()
                     return
 
+                if upstream_ack is not None:
+                    upstream_ack.on_next(continue_ack)
+
+                if isinstance(last_ack, ContinueAck):
+                    sync_index = self.em.next_frame_index(sync_index)
+
+                    # schedule next batch from time to time
+                    if sync_index == 0:
+                        self.scheduler.schedule(self._drain_action)
+                        return
+
                 else:
-                    schedule_ack(last_ack, next=next)
+                    last_ack.subscribe(self.resume_single)
                     return
 
-            # schedule next element from time to time
-            else:
-                schedule_ack(last_ack, next=next)
-                return
+        finally:
+            self.is_draining = False
 
-    def on_next(self, elem: ElementType):
-        if self.back_pressure is None:
-            if len(self.queue) < self.buffer_size:
-                return_ack = continue_ack
+    def _start_loop(self):
+        last_ack = self.last_ack
 
+        if isinstance(last_ack, ContinueAck):
+
+            # fast path: the upstream runs on the same thread as the drain loop
+            if not self.is_draining and self.consumer_thread == threading.get_ident():
+                self._drain()
             else:
-                return_ack = AckSubject()
-                self.back_pressure = return_ack
+                self.scheduler.schedule(self._drain_action)
+
+        elif isinstance(last_ack, StopAck):
+            self._stop()
 
         else:
-            return_ack = self.back_pressure
+            last_ack.subscribe(self.resume_single)
 
+    def on_next(self, elem: ElementType):
         with self.lock:
             len_queue = len(self.queue)
             self.queue.append(elem)
 
-        prev_meas_state = self.state.get_measured_state(bool(len_queue))
+            if len_queue < self.max_buffer_size:
+                return_ack = continue_ack
 
-        if isinstance(prev_meas_state, BufferedStates.WaitingState):
-            last_ack = prev_meas_state.last_ack
+            else:
+                if self.back_pressure is None:
+                    self.back_pressure = AckSubject()
+                return_ack = self.back_pressure
 
-            self._start_loop(last_ack=last_ack, next_index=1)
+            prev_state = self.state
+
+        prev_meas_state = prev_state.get_measured_state(bool(len_queue))
+
+        if isinstance(prev_meas_state, BufferedStates.WaitingState):
+            self._start_loop()
 
             return return_ack
 
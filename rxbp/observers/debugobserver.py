@@ -1,6 +1,8 @@
+import random
+import time
 from dataclasses import dataclass
 from traceback import FrameSummary
-from typing import Optional, Callable, Any, List
+from typing import Optional, Callable, Any, List, Sized
 
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.acknowledgement.ack import Ack
@@ -9,6 +11,7 @@ from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.observer import Observer
 from rxbp.observerinfo import ObserverInfo
 from rxbp.typing import ElementType
+from rxbp.utils.operatorprofiler import OperatorStats
 from rxbp.utils.tooperatorexception import to_operator_exception
 
 
@@ -23,9 +26,26 @@ class DebugObserver(Observer):
     on_async_ack: Callable[[Ack], None]
     on_raw_ack: Callable[[Ack], None]
     stack: List[FrameSummary]
+    sample_every: int = None
+    sample_probability: float = None
+    stats: OperatorStats = None
 
-    # def __post_init__(self):
-    #     self.has_scheduled_next = False
+    def __post_init__(self):
+        # self.has_scheduled_next = False
+
+        self.n_batches = 0
+
+    def _is_sampled(self) -> bool:
+        if self.sample_every is not None:
+            n_batches = self.n_batches
+            self.n_batches = n_batches + 1
+            return n_batches % self.sample_every == 0
+
+        elif self.sample_probability is not None:
+            return random.random() < self.sample_probability
+
+        else:
+            return True
 
     def on_next(self, elem: ElementType):
         # if not self.has_scheduled_next:
@@ -34,16 +54,62 @@ class DebugObserver(Observer):
         #         stack=self.stack,
         #     ))
 
+        # batches not sampled are passed through without being materialized
+        if not self._is_sampled():
+            if self.stats is None:
+                return self.source.on_next(elem)
+
+            # the profiler counts every batch, but only times the sampled ones; the
+            # size of a batch that is not sized is unknown without materializing it
+            try:
+                ack = self.source.on_next(elem)
+
+            except Exception as exc:
+                self.on_error(exc)
+                self.source.on_error(exc)
+                return stop_ack
+
+            self.stats.record_untimed_batch(
+                time_=time.perf_counter(),
+                size=len(elem) if isinstance(elem, Sized) else None,
+                is_async_ack=not isinstance(ack, (ContinueAck, StopAck)),
+            )
+            return ack
+
         try:
-            materialized = list(elem)
+            if isinstance(elem, list):
+                materialized = elem
+            else:
+                materialized = list(elem)
 
             if len(materialized) == 0:
+                # empty batches are counted whether sampled or not
+                if self.stats is not None:
+                    self.stats.record_untimed_batch(
+                        time_=time.perf_counter(),
+                        size=0,
+                        is_async_ack=False,
+                    )
+
                 return continue_ack
 
             for elem in materialized:
                 self.on_next_func(elem)
 
-            ack = self.source.on_next(materialized)
+            if self.stats is None:
+                ack = self.source.on_next(materialized)
+
+            else:
+                start_time = time.perf_counter()
+                ack = self.source.on_next(materialized)
+                end_time = time.perf_counter()
+
+                self.stats.record_batch(
+                    start_time=start_time,
+                    end_time=end_time,
+                    size=len(materialized),
+                    is_async_ack=not isinstance(ack, (ContinueAck, StopAck)),
+                )
 
         except Exception as exc:
             self.on_error(exc)
@@ -58,6 +124,9 @@ class DebugObserver(Observer):
 
             class ResultSingle(Single):
                 def on_next(_, elem):
+                    if self.stats is not None:
+                        self.stats.record_async_ack(end_time)
+
                     self.on_async_ack(elem)
 
                 def on_error(self, exc: Exception):
@@ -1,49 +1,18 @@
 import threading
-from typing import List, Any, Optional
+from collections import deque
+from typing import Optional, Deque
 
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.acknowledgement.ack import Ack
 from rxbp.acknowledgement.operators.observeon import _observe_on
 from rxbp.acknowledgement.single import Single
-from rxbp.acknowledgement.stopack import StopAck
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.internal.ringbuffer import RingBuffer
 from rxbp.observer import Observer
 from rxbp.overflowstrategy import OverflowStrategy, DropOld, ClearBuffer
 from rxbp.scheduler import Scheduler
 
 
-class AtomicAny:
-    def __init__(self, lock, init_val):
-        self._lock = lock
-        self._val = init_val
-
-    def get(self):
-        return self._val
-
-    def compare_and_set(self, current, update) -> bool:
-        meas = self.get_and_set(update)
-        return current == meas
-
-    def get_and_set(self, update) -> Any:
-        with self._lock:
-            meas = self._val
-            self._val = update
-        return meas
-
-
-class AtomicInt(AtomicAny):
-    def get_and_increment(self, num: int):
-        with self._lock:
-            meas = self._val
-            self._val = meas + num
-        return meas
-
-    def decrement_and_get(self, num: int):
-        with self._lock:
-            self._val = self._val - num
-            meas = self._val
-        return meas
-
-
 class EvictingBufferedObserver(Observer):
     def __init__(self, observer: Observer, scheduler: Scheduler, subscribe_scheduler,
                  strategy: OverflowStrategy):
@@ -51,72 +20,82 @@ class EvictingBufferedObserver(Observer):
         self.scheduler = scheduler
         self.subscribe_scheduler = subscribe_scheduler
         self.em = scheduler.get_execution_model()
-        # self.buffer_size = strategy
+        self.strategy = strategy
 
         self.last_iteration_ack: Optional[Ack] = None
 
         self.upstream_is_complete = False
         self.downstream_is_complete = False
 
-        # self.items_to_push = 0
         self.error_thrown = None
 
-        self.lock = threading.RLock()
-
-        self.items_to_push = AtomicInt(lock=self.lock, init_val = 0)
-        self.queue = self.Buffer(lock=self.lock, strategy=strategy)
-
-    class Buffer:
-        def __init__(self, lock, strategy: OverflowStrategy):
-            self.lock = lock
-            self.strategy = strategy
-
-            self.buffer_ref = AtomicAny(lock=lock, init_val=(0, []))
-
-        def drain(self) -> List:
-            current = self.buffer_ref.get_and_set((0, []))
-            return current[1]
-
-        def offer(self, a) -> int:
-            current = self.buffer_ref.get()
-            length, queue = current
-
-            if length < self.strategy.buffer_size:
-                update = (length + 1, queue + [a])
-                if not self.buffer_ref.compare_and_set(current, update):
-                    return self.offer(a)
-                else:
-                    return 0
-            else:
-                if isinstance(self.strategy, DropOld):
-                    update = (length, queue[1:] + [a])
-                    if not self.buffer_ref.compare_and_set(current, update):
-                        return self.offer(a)
-                    else:
-                        return 1
-                elif isinstance(self.strategy, ClearBuffer):
-                    update = (1, [a])
-                    if not self.buffer_ref.compare_and_set(current, update):
-                        return self.offer(a)
-                    else:
-                        return length
-                else:
-                    raise Exception('illegal case')
+        self.lock = threading.Lock()
+
+        # number of batches offered to the buffer, but not yet processed by the consumer;
+        # only accessed while holding the lock
+        self.items_to_push = 0
+
+        if isinstance(strategy, DropOld):
+            clear_on_overflow = False
+        elif isinstance(strategy, ClearBuffer):
+            clear_on_overflow = True
+        else:
+            raise Exception(f'illegal overflow strategy "{strategy}"')
+
+        self.queue = RingBuffer(capacity=strategy.buffer_size, clear_on_overflow=clear_on_overflow)
+
+    @property
+    def backlog(self) -> int:
+        """
+        Number of batches offered to the buffer, but not yet processed by the consumer.
+        """
+
+        return self.items_to_push
+
+    @property
+    def dropped_batches(self) -> int:
+        """
+        Number of batches evicted from the buffer by this observer.
+        """
+
+        return self.queue.dropped
+
+    @property
+    def dropped_elements(self) -> int:
+        """
+        Number of elements in the batches evicted from the buffer by this observer.
+        """
+
+        return self.queue.dropped_elements
 
     def on_next(self, elem):
         if self.upstream_is_complete or self.downstream_is_complete:
-            return StopAck()
+            return stop_ack
         else:
-            dropped = self.queue.offer(elem)
-            increment = 1 - dropped
-            self.push_to_consumer(increment)
+            with self.lock:
+                dropped_elements = self.queue.dropped_elements
+                dropped = self.queue.offer(elem)
+                dropped_elements = self.queue.dropped_elements - dropped_elements
+                current_nr = self.items_to_push
+                self.items_to_push += 1 - dropped
+
+            # the strategy is the handle the caller of `from_rx` holds on the counters
+            if dropped:
+                self.strategy.count_dropped(n_batches=dropped, n_elements=dropped_elements)
+
+            self._schedule_consumer(current_nr)
             return continue_ack
 
     def _on_completed_or_error(self, ex=None):
         if not self.upstream_is_complete and not self.downstream_is_complete:
             self.error_thrown = ex
             self.upstream_is_complete = True
-            self.push_to_consumer(1)
+
+            with self.lock:
+                current_nr = self.items_to_push
+                self.items_to_push += 1
+
+            self._schedule_consumer(current_nr)
 
     def on_error(self, ex):
         self._on_completed_or_error(ex)
@@ -124,18 +103,20 @@ class EvictingBufferedObserver(Observer):
     def on_completed(self):
         self._on_completed_or_error(None)
 
-    def push_to_consumer(self, increment: int):
-        if increment != 0:
-            current_nr = self.items_to_push.get_and_increment(increment)
-        else:
-            current_nr = self.items_to_push.get()
-
+    def _schedule_consumer(self, current_nr: int):
+        # the consumer run loop is only started if it is not already running
         if current_nr == 0:
             def action(_, __):
                 self.consumer_run_loop()
 
             self.scheduler.schedule(action)
 
+    def _drain(self) -> Deque:
+        with self.lock:
+            elements = self.queue.drain()
+
+        return deque(elements)
+
     def consumer_run_loop(self):
         def signal_next(next):
             try:
@@ -156,7 +137,7 @@ class EvictingBufferedObserver(Observer):
             except:
                 raise NotImplementedError
 
-        def go_async(current_queue: List, next_val, next_size: int, ack: Ack, processed: int):
+        def go_async(current_queue: Deque, next_val, next_size: int, ack: Ack, processed: int):
             class AckSingle(Single):
                 def on_error(self, exc: Exception):
                     raise NotImplementedError
@@ -172,7 +153,7 @@ class EvictingBufferedObserver(Observer):
 
             _observe_on(ack, self.scheduler).subscribe(AckSingle())
 
-        def fast_loop(prev_queue: List, prev_ack: Ack, last_processed:int, start_index: int):
+        def fast_loop(prev_queue: Deque, prev_ack: Ack, last_processed:int, start_index: int):
             ack = continue_ack if prev_ack is None else prev_ack
             is_first_iteration = isinstance(ack, ContinueAck)
             processed = last_processed
@@ -182,13 +163,12 @@ class EvictingBufferedObserver(Observer):
             while not self.downstream_is_complete:
                 try:
                     if len(current_queue) == 0:
-                        current_queue = self.queue.drain()
+                        current_queue = self._drain()
 
                     if len(current_queue) == 0:
                         has_next = False
                     else:
-                        next_val = current_queue[0]
-                        current_queue = current_queue[1:]
+                        next_val = current_queue.popleft()
                         has_next = True
 
                     # fetch size
@@ -217,7 +197,7 @@ class EvictingBufferedObserver(Observer):
                             go_async(current_queue, next_val, next_size, ack, processed)
                             return
                     elif self.upstream_is_complete:
-                        current_queue = self.queue.drain()
+                        current_queue = self._drain()
 
                         if len(current_queue) == 0:
                             self.downstream_is_complete = True
@@ -228,7 +208,10 @@ class EvictingBufferedObserver(Observer):
                             return
                     else:
                         self.last_iteration_ack = ack
-                        remaining = self.items_to_push.decrement_and_get(processed)
+
+                        with self.lock:
+                            self.items_to_push -= processed
+                            remaining = self.items_to_push
 
                         processed = 0
 
@@ -238,8 +221,6 @@ class EvictingBufferedObserver(Observer):
                     raise NotImplementedError
 
         try:
-            fast_loop(prev_queue=[], prev_ack=self.last_iteration_ack, last_processed=0, start_index=0)
+            fast_loop(prev_queue=deque(), prev_ack=self.last_iteration_ack, last_processed=0, start_index=0)
         except:
             raise NotImplementedError
-
-
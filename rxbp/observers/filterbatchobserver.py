@@ -0,0 +1,40 @@
+import itertools
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray, materialize_batch
+
+
+@dataclass
+class FilterBatchObserver(Observer):
+    observer: Observer
+    predicate: Callable[[ElementType], Iterable[bool]]
+
+    def on_next(self, elem: ElementType):
+        try:
+            batch = materialize_batch(elem)
+            mask = self.predicate(batch)
+
+            if is_ndarray(batch):
+                filtered = batch[mask]
+            else:
+                filtered = list(itertools.compress(batch, mask))
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
+
+        # no need to send empty batches downstream
+        if len(filtered) == 0:
+            return continue_ack
+
+        return self.observer.on_next(filtered)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
@@ -3,6 +3,7 @@ from typing import Callable, Any
 
 from rxbp.observer import Observer
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc
 
 
 @dataclass
@@ -10,7 +11,14 @@ class FilterObserver(Observer):
     observer: Observer
     predicate: Callable[[Any], bool]
 
+    def __post_init__(self):
+        self.is_vectorized = is_ufunc(self.predicate)
+
     def on_next(self, elem: ElementType):
+        # a numpy ufunc predicate returns a boolean mask for the whole numpy array
+        if self.is_vectorized and is_ndarray(elem):
+            return self.observer.on_next(elem[self.predicate(elem)])
+
         def gen_filtered_iterable():
             for e in elem:
                 if self.predicate(e):
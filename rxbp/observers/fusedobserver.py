@@ -0,0 +1,94 @@
+import functools
+import itertools
+from dataclasses import dataclass
+from typing import Any, Callable, List
+
+from rxbp.observer import Observer
+from rxbp.typing import ElementType, ValueType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc
+
+
+@dataclass(frozen=True)
+class MapStage:
+    func: Callable[[ValueType], ValueType]
+
+    def init_operation(self) -> Callable[[ElementType], ElementType]:
+        func = self.func
+
+        if is_ufunc(func):
+            def operation(batch: ElementType):
+                # a numpy ufunc is applied to the whole numpy array at once
+                if is_ndarray(batch):
+                    return func(batch)
+                return map(func, batch)
+
+            return operation
+
+        return functools.partial(map, func)
+
+
+@dataclass(frozen=True)
+class FilterStage:
+    predicate: Callable[[ValueType], bool]
+
+    def init_operation(self) -> Callable[[ElementType], ElementType]:
+        predicate = self.predicate
+
+        if is_ufunc(predicate):
+            def operation(batch: ElementType):
+                # a numpy ufunc predicate returns a boolean mask for the whole numpy array
+                if is_ndarray(batch):
+                    return batch[predicate(batch)]
+                return filter(predicate, batch)
+
+            return operation
+
+        return functools.partial(filter, predicate)
+
+
+@dataclass(frozen=True)
+class ZipWithIndexStage:
+    selector: Callable[[ValueType, int], Any]
+
+    def init_operation(self) -> Callable[[ElementType], ElementType]:
+        selector = self.selector
+
+        # `map` stops at the end of the batch before taking the next index,
+        # therefore the counter continues with the next batch
+        counter = itertools.count()
+
+        def operation(batch: ElementType):
+            return map(selector, batch, counter)
+
+        return operation
+
+
+@dataclass
+class FusedObserver(Observer):
+    """
+    Applies a chain of stateless stages to each received batch before sending
+    it to the next observer.
+
+    Like the observers of the individual operators, the stages are applied
+    lazily when the resulting batch is iterated.
+    """
+
+    observer: Observer
+    stages: List[Any]
+
+    def __post_init__(self):
+        # the state of a stage, e.g. the index counter, is local to the observer
+        self.operations = [stage.init_operation() for stage in self.stages]
+
+    def on_next(self, elem: ElementType):
+        batch = elem
+        for operation in self.operations:
+            batch = operation(batch)
+
+        return self.observer.on_next(batch)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
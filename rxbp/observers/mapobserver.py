@@ -4,6 +4,7 @@ from dataclass_abc import dataclass_abc
 
 from rxbp.observer import Observer
 from rxbp.typing import ElementType, ValueType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc
 
 
 @dataclass_abc
@@ -11,7 +12,14 @@ class MapObserver(Observer): #OnErrorMixin, OnCompletedMixin, Observer):
     source: Observer
     func: Callable[[ValueType], ValueType]
 
+    def __post_init__(self):
+        self.is_vectorized = is_ufunc(self.func)
+
     def on_next(self, elem: ElementType):
+        # a numpy ufunc is applied to the whole numpy array at once
+        if self.is_vectorized and is_ndarray(elem):
+            return self.source.on_next(self.func(elem))
+
         # `map` does not consume elements from the iterator/list,
         # therefore it is not its responsibility to catch an exception
         def map_gen():
@@ -24,4 +32,4 @@ class MapObserver(Observer): #OnErrorMixin, OnCompletedMixin, Observer):
         return self.source.on_error(exc)
 
     def on_completed(self):
-        return self.source.on_completed()
\ No newline at end of file
+        return self.source.on_completed()
@@ -0,0 +1,218 @@
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType, ValueType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc, materialize_batch
+
+
+def _map_batch(func: Callable[[ValueType], ValueType], batch: ElementType) -> ElementType:
+    # module-level function such that it can be pickled by a process pool
+    if is_ufunc(func) and is_ndarray(batch):
+        return func(batch)
+
+    return [func(value) for value in batch]
+
+
+@dataclass
+class MapParallelObserver(Observer):
+    """
+    Maps each received batch on the `executor` and sends the mapped batches
+    downstream in the order they were received, or in the order they are
+    completed if `is_ordered` is False.
+
+    Up to `max_in_flight` batches are mapped concurrently; while the window is
+    full, the upstream Observable is back-pressured by an asynchronous
+    acknowledgment. The mapped batches are sent downstream on the `scheduler`.
+    """
+
+    observer: Observer
+    func: Callable[[ValueType], ValueType]
+    executor: Executor
+    max_in_flight: int
+    scheduler: Scheduler
+    is_ordered: bool = True
+
+    def __post_init__(self):
+        self.lock = threading.Lock()
+
+        # futures of the batches in the order they were received
+        self.in_flight = deque()
+
+        # futures in the order they completed, only used if the order is not preserved
+        self.completed = deque()
+
+        self.back_pressure: Optional[AckSubject] = None
+
+        # set while the drain loop runs or waits on a downstream acknowledgment
+        self.is_draining = False
+        self.is_completed = False
+        self.is_stopped = False
+
+        outer_self = self
+
+        class ResumeSingle(Single):
+            def on_next(self, ack: Ack):
+                if isinstance(ack, ContinueAck):
+                    outer_self.scheduler.schedule(outer_self._drain_action)
+                else:
+                    outer_self._stop()
+
+        self.resume_single = ResumeSingle()
+
+    def _stop(self):
+        with self.lock:
+            self.is_stopped = True
+            in_flight = list(self.in_flight)
+            self.in_flight.clear()
+            self.completed.clear()
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        for future in in_flight:
+            future.cancel()
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
+
+    def _has_next(self) -> bool:
+        """
+        Check if the next batch can be sent downstream; the lock is held by the caller.
+        """
+
+        if self.is_ordered:
+            return bool(self.in_flight) and self.in_flight[0].done()
+        else:
+            return bool(self.completed)
+
+    def _pop_next(self) -> Future:
+        if self.is_ordered:
+            return self.in_flight.popleft()
+        else:
+            future = self.completed.popleft()
+            self.in_flight.remove(future)
+            return future
+
+    def _on_future_done(self, future: Future):
+        with self.lock:
+            if self.is_stopped:
+                return
+
+            if not self.is_ordered:
+                self.completed.append(future)
+
+            if self.is_draining or not self._has_next():
+                return
+
+            self.is_draining = True
+
+        self.scheduler.schedule(self._drain_action)
+
+    def _drain_action(self, _, __):
+        self._drain()
+
+    def _drain(self):
+        while True:
+            with self.lock:
+                if self.is_stopped:
+                    return
+
+                if not self._has_next():
+                    self.is_draining = False
+                    is_completed = self.is_completed and not self.in_flight
+                    break
+
+                future = self._pop_next()
+
+                # release the upstream as soon as there is space in the window
+                if len(self.in_flight) < self.max_in_flight:
+                    upstream_ack = self.back_pressure
+                    self.back_pressure = None
+                else:
+                    upstream_ack = None
+
+            try:
+                batch = future.result()
+            except Exception as exc:
+                self._stop()
+
+                # the upstream acknowledgment is already taken from the back-pressure
+                if upstream_ack is not None:
+                    upstream_ack.on_next(stop_ack)
+
+                self.observer.on_error(exc)
+                return
+
+            ack = self.observer.on_next(batch)
+
+            if isinstance(ack, StopAck):
+                self._stop()
+
+                if upstream_ack is not None:
+                    upstream_ack.on_next(stop_ack)
+                return
+
+            if upstream_ack is not None:
+                upstream_ack.on_next(continue_ack)
+
+            if not isinstance(ack, ContinueAck):
+                ack.subscribe(self.resume_single)
+                return
+
+        if is_completed:
+            self.observer.on_completed()
+
+    def on_next(self, elem: ElementType):
+        # a batch needs to be materialized in order to send it to another process
+        try:
+            batch = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        future = self.executor.submit(_map_batch, self.func, batch)
+
+        with self.lock:
+            if self.is_stopped:
+                future.cancel()
+                return stop_ack
+
+            self.in_flight.append(future)
+
+            if len(self.in_flight) < self.max_in_flight:
+                return_ack = continue_ack
+            else:
+                if self.back_pressure is None:
+                    self.back_pressure = AckSubject()
+                return_ack = self.back_pressure
+
+        # the callback is called immediately if the future is already done
+        future.add_done_callback(self._on_future_done)
+
+        return return_ack
+
+    def on_error(self, exc):
+        with self.lock:
+            is_stopped = self.is_stopped
+
+        if not is_stopped:
+            self._stop()
+            self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_completed = True
+
+            if self.is_draining or self.is_stopped or self.in_flight:
+                return
+
+        self.observer.on_completed()
@@ -7,6 +7,7 @@ from rxbp.observer import Observer
 from rxbp.scheduler import Scheduler
 from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch
 
 
 @dataclass
@@ -35,14 +36,11 @@ class ObserveOnObserver(Observer):
     def on_next(self, elem: ElementType):
         ack_subject = AckSubject()
 
-        if isinstance(elem, list):
-            elem = elem
-        else:
-            try:
-                elem = list(elem)
-            except Exception as exc:
-                self.observer.on_error(exc)
-                return stop_ack
+        try:
+            elem = materialize_batch(elem)
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
 
         def action(_, __):
             inner_ack = self.observer.on_next(elem)
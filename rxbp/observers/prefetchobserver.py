@@ -0,0 +1,181 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observer import Observer
+from rxbp.scheduler import Scheduler
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch
+
+
+@dataclass
+class PrefetchObserver(Observer):
+    """
+    Allows up to `prefetch` batches to be in flight between the upstream
+    Observable and the downstream observer, which receives the batches on
+    the `scheduler`.
+
+    Each received batch consumes a credit and is acknowledged immediately as
+    long as credits remain. The credits are only returned in chunks of
+    `replenish` batches acknowledged by the downstream observer, such that an
+    exhausted upstream is not released for every single batch.
+    """
+
+    observer: Observer
+    scheduler: Scheduler
+    prefetch: int
+    replenish: int
+
+    def __post_init__(self):
+        self.em = self.scheduler.get_execution_model()
+
+        self.lock = threading.Lock()
+
+        self.queue = deque()
+        self.back_pressure: Optional[AckSubject] = None
+
+        # number of batches the upstream can send without being back-pressured
+        self.credits = self.prefetch
+
+        # number of batches acknowledged downstream since the credits were last returned
+        self.n_acknowledged = 0
+
+        # set while the drain loop is scheduled, runs or waits on a downstream acknowledgment
+        self.is_draining = False
+        self.is_completed = False
+        self.is_stopped = False
+
+        outer_self = self
+
+        class ResumeSingle(Single):
+            def on_next(self, ack: Ack):
+                if isinstance(ack, ContinueAck):
+                    outer_self._acknowledged()
+                    outer_self.scheduler.schedule(outer_self._drain_action)
+                else:
+                    outer_self._stop()
+
+        self.resume_single = ResumeSingle()
+
+    def _stop(self):
+        with self.lock:
+            self.is_stopped = True
+            self.queue.clear()
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
+
+    def _acknowledged(self):
+        with self.lock:
+            self.n_acknowledged += 1
+
+            if self.n_acknowledged < self.replenish:
+                return
+
+            self.credits += self.n_acknowledged
+            self.n_acknowledged = 0
+
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(continue_ack)
+
+    def _drain_action(self, _, __):
+        self._drain()
+
+    def _drain(self):
+        sync_index = 0
+
+        while True:
+            with self.lock:
+                if self.is_stopped:
+                    return
+
+                if not self.queue:
+                    self.is_draining = False
+
+                    if not self.is_completed:
+                        return
+
+                    self.is_stopped = True
+                    break
+
+                elem = self.queue.popleft()
+
+            ack = self.observer.on_next(elem)
+
+            if isinstance(ack, StopAck):
+                self._stop()
+                return
+
+            if not isinstance(ack, ContinueAck):
+                ack.subscribe(self.resume_single)
+                return
+
+            self._acknowledged()
+
+            sync_index = self.em.next_frame_index(sync_index)
+
+            # schedule next batch from time to time
+            if sync_index == 0:
+                self.scheduler.schedule(self._drain_action)
+                return
+
+        self.observer.on_completed()
+
+    def on_next(self, elem: ElementType):
+        # the upstream continues before the batch is sent downstream
+        try:
+            batch = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            self.queue.append(batch)
+            self.credits -= 1
+
+            if 0 < self.credits:
+                return_ack = continue_ack
+            else:
+                self.back_pressure = AckSubject()
+                return_ack = self.back_pressure
+
+            is_draining = self.is_draining
+            self.is_draining = True
+
+        if not is_draining:
+            self.scheduler.schedule(self._drain_action)
+
+        return return_ack
+
+    def on_error(self, exc):
+        with self.lock:
+            is_stopped = self.is_stopped
+
+        if not is_stopped:
+            self._stop()
+            self.observer.on_error(exc)
+
+    def on_completed(self):
+        with self.lock:
+            self.is_completed = True
+
+            is_draining = self.is_draining
+            self.is_draining = True
+
+        # the remaining batches are sent before completing
+        if not is_draining:
+            self.scheduler.schedule(self._drain_action)
@@ -0,0 +1,102 @@
+import itertools
+from dataclasses import dataclass
+from typing import Iterator
+
+from rxbp.acknowledgement.ack import Ack
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.single import Single
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray
+
+
+@dataclass
+class RebatchObserver(Observer):
+    """
+    Splits the received batches into batches of at most `size` elements.
+
+    Lists, ranges and numpy arrays are split by slicing, which results in views
+    in case of ranges and numpy arrays. Other iterables are consumed lazily one
+    chunk at a time. The next chunk is only sent after the previous one is
+    acknowledged.
+    """
+
+    observer: Observer
+    size: int
+
+    def _iterate_chunks(self, elem: ElementType) -> Iterator[ElementType]:
+        if isinstance(elem, (list, range)) or is_ndarray(elem):
+            for idx in range(0, len(elem), self.size):
+                yield elem[idx:idx + self.size]
+
+        else:
+            iterator = iter(elem)
+
+            while True:
+                chunk = list(itertools.islice(iterator, self.size))
+
+                if not chunk:
+                    break
+
+                yield chunk
+
+    def _send_chunks(self, chunks: Iterator[ElementType], chunk: ElementType) -> Ack:
+        while True:
+            ack = self.observer.on_next(chunk)
+
+            try:
+                chunk = next(chunks)
+            except StopIteration:
+                return ack
+            except Exception as exc:
+                self.observer.on_error(exc)
+                return stop_ack
+
+            if isinstance(ack, ContinueAck):
+                continue
+
+            elif isinstance(ack, StopAck):
+                return stop_ack
+
+            else:
+                outer_self = self
+                next_chunk = chunk
+                ack_subject = AckSubject()
+
+                class ResumeSingle(Single):
+                    def on_next(self, ack: Ack):
+                        if isinstance(ack, ContinueAck):
+                            outer_self._send_chunks(chunks, next_chunk).subscribe(ack_subject)
+                        else:
+                            ack_subject.on_next(stop_ack)
+
+                ack.subscribe(ResumeSingle())
+                return ack_subject
+
+    def on_next(self, elem: ElementType):
+        # fast path: the batch is small enough
+        if (isinstance(elem, (list, range)) or is_ndarray(elem)) and len(elem) <= self.size:
+            if len(elem) == 0:
+                return continue_ack
+
+            return self.observer.on_next(elem)
+
+        chunks = self._iterate_chunks(elem)
+
+        try:
+            chunk = next(chunks)
+        except StopIteration:
+            return continue_ack
+        except Exception as exc:
+            self.observer.on_error(exc)
+            return stop_ack
+
+        return self._send_chunks(chunks, chunk)
+
+    def on_error(self, exc):
+        return self.observer.on_error(exc)
+
+    def on_completed(self):
+        return self.observer.on_completed()
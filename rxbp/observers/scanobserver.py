@@ -3,6 +3,7 @@ from typing import Callable, Any
 
 from rxbp.observer import Observer
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import is_ndarray, is_ufunc, np
 
 
 @dataclass
@@ -13,8 +14,18 @@ class ScanObserver(Observer):
 
     def __post_init__(self):
         self.acc = self.initial
+        self.is_vectorized = is_ufunc(self.func)
 
     def on_next(self, elem: ElementType):
+        # accumulate the whole numpy array at once with a numpy ufunc, e.g. `np.add`
+        if self.is_vectorized and is_ndarray(elem):
+            if len(elem) == 0:
+                return self.observer.on_next(elem)
+
+            accumulated = self.func.accumulate(np.concatenate(([self.acc], elem)))[1:]
+            self.acc = accumulated[-1]
+            return self.observer.on_next(accumulated)
+
         def scan_gen():
             for v in elem:
                 val = self.func(self.acc, v)
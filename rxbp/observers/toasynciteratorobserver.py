@@ -0,0 +1,142 @@
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch
+
+
+@dataclass
+class ToAsyncIteratorObserver(Observer):
+    """
+    Queues the received batches for an asynchronous iterator running on the
+    event loop `loop`.
+
+    The iterator awaits a future that is completed on the event loop by the
+    next event. Once `buffer_size` batches are queued, the upstream Observable
+    is back-pressured until the iterator takes a batch from the queue.
+    """
+
+    loop: asyncio.AbstractEventLoop
+    buffer_size: Optional[int]
+
+    def __post_init__(self):
+        self.lock = threading.Lock()
+
+        self.queue = deque()
+        self.back_pressure: Optional[AckSubject] = None
+        self.is_completed = False
+        self.is_stopped = False
+        self.exception: Optional[Exception] = None
+
+        # future awaited by the iterator while no event is available
+        self.waiter: Optional[asyncio.Future] = None
+
+    @property
+    def has_event(self) -> bool:
+        """
+        The lock is held by the caller.
+        """
+
+        return bool(self.queue) or self.is_completed or self.exception is not None
+
+    def _notify(self):
+        with self.lock:
+            waiter = self.waiter
+            self.waiter = None
+
+        if waiter is not None:
+            # the event can be received on any thread
+            self.loop.call_soon_threadsafe(self._wake_up, waiter)
+
+    @staticmethod
+    def _wake_up(waiter: asyncio.Future):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def wait(self) -> Optional[asyncio.Future]:
+        """
+        Return a future to await if no event is available, otherwise return None.
+        """
+
+        with self.lock:
+            if self.has_event:
+                return None
+
+            self.waiter = self.loop.create_future()
+            return self.waiter
+
+    def pop(self) -> ElementType:
+        """
+        Take the next batch from the queue and release the upstream Observable
+        if it was back-pressured.
+        """
+
+        with self.lock:
+            batch = self.queue.popleft()
+
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(continue_ack)
+
+        return batch
+
+    def stop(self):
+        """
+        Stop the upstream Observable if the iterator is closed early.
+        """
+
+        with self.lock:
+            self.is_stopped = True
+            self.queue.clear()
+
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(stop_ack)
+
+    def on_next(self, elem: ElementType):
+        try:
+            batch = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        with self.lock:
+            if self.is_stopped:
+                return stop_ack
+
+            self.queue.append(batch)
+
+            if self.buffer_size is None or len(self.queue) < self.buffer_size:
+                ack = continue_ack
+            else:
+                self.back_pressure = AckSubject()
+                ack = self.back_pressure
+
+        self._notify()
+        return ack
+
+    def on_error(self, exc: Exception):
+        with self.lock:
+            # the first terminal event wins
+            if not self.is_completed:
+                self.exception = exc
+
+        self._notify()
+
+    def on_completed(self):
+        with self.lock:
+            if self.exception is None:
+                self.is_completed = True
+
+        self._notify()
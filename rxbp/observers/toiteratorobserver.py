@@ -0,0 +1,90 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional
+
+from rxbp.acknowledgement.acksubject import AckSubject
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.observer import Observer
+from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch
+
+
+@dataclass
+class ToIteratorObserver(Observer):
+    """
+    Queues the received batches for a blocking iterator.
+
+    The iterator waits on the `condition` which is notified on every event.
+    Once `buffer_size` batches are queued, the upstream Observable is
+    back-pressured until the iterator takes a batch from the queue.
+    """
+
+    buffer_size: Optional[int]
+
+    def __post_init__(self):
+        self.condition = threading.Condition()
+
+        self.queue = deque()
+        self.back_pressure: Optional[AckSubject] = None
+        self.is_completed = False
+        self.exception: Optional[Exception] = None
+
+    @property
+    def has_event(self) -> bool:
+        """
+        The lock of the condition is held by the caller.
+        """
+
+        return bool(self.queue) or self.is_completed or self.exception is not None
+
+    def pop(self) -> ElementType:
+        """
+        Take the next batch from the queue and release the upstream Observable
+        if it was back-pressured.
+        """
+
+        with self.condition:
+            batch = self.queue.popleft()
+
+            upstream_ack = self.back_pressure
+            self.back_pressure = None
+
+        if upstream_ack is not None:
+            upstream_ack.on_next(continue_ack)
+
+        return batch
+
+    def on_next(self, elem: ElementType):
+        try:
+            batch = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
+
+        with self.condition:
+            self.queue.append(batch)
+
+            if self.buffer_size is None or len(self.queue) < self.buffer_size:
+                ack = continue_ack
+            else:
+                self.back_pressure = AckSubject()
+                ack = self.back_pressure
+
+            self.condition.notify()
+
+        return ack
+
+    def on_error(self, exc: Exception):
+        with self.condition:
+            # the first terminal event wins
+            if not self.is_completed:
+                self.exception = exc
+            self.condition.notify()
+
+    def on_completed(self):
+        with self.condition:
+            if self.exception is None:
+                self.is_completed = True
+            self.condition.notify()
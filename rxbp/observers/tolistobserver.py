@@ -4,6 +4,7 @@ from rxbp.acknowledgement.continueack import continue_ack
 from rxbp.acknowledgement.stopack import stop_ack
 from rxbp.observer import Observer
 from rxbp.typing import ElementType
+from rxbp.utils.ndarrayutils import materialize_batch, concat_batches
 
 
 @dataclass
@@ -11,20 +12,17 @@ class ToListObserver(Observer):
     observer: Observer
 
     def __post_init__(self):
-        self.queue = []
+        # received batches are concatenated only once on completion
+        self.batches = []
 
     def on_next(self, elem: ElementType):
-        if isinstance(elem, list):
-            elem_list = elem
+        try:
+            batch = materialize_batch(elem)
+        except Exception as exc:
+            self.on_error(exc)
+            return stop_ack
 
-        else:
-            try:
-                elem_list = list(elem)
-            except Exception as exc:
-                self.on_error(exc)
-                return stop_ack
-
-        self.queue += elem_list
+        self.batches.append(batch)
 
         return continue_ack
 
@@ -32,5 +30,6 @@ class ToListObserver(Observer):
         return self.observer.on_error(exc)
 
     def on_completed(self):
-        _ = self.observer.on_next([self.queue])
+        # if all batches are numpy arrays, then a single numpy array is emitted
+        _ = self.observer.on_next([concat_batches(self.batches)])
         self.observer.on_completed()
\ No newline at end of file
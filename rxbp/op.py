@@ -1,4 +1,5 @@
-from typing import Any, Callable, Iterator
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterator, Iterable, Union, List
 
 from rxbp.acknowledgement.ack import Ack
 from rxbp.flowable import Flowable
@@ -6,9 +7,30 @@ from rxbp.mixins.flowablemixin import FlowableMixin
 from rxbp.observerinfo import ObserverInfo
 from rxbp.pipeoperation import PipeOperation
 from rxbp.scheduler import Scheduler
+from rxbp.schedulers.threadpoolscheduler import ThreadPoolScheduler
 from rxbp.subscriber import Subscriber
-from rxbp.typing import ValueType
+from rxbp.typing import ValueType, ElementType
 from rxbp.utils.getstacklines import get_stack_lines
+from rxbp.utils.operatorprofiler import OperatorProfiler
+
+
+def batch(max_size: int, max_delay: float = None):
+    """
+    Coalesce the batches emitted by the source into batches of up to `max_size` elements.
+
+    A batch is emitted as soon as `max_size` elements are collected, or after `max_delay`
+    seconds have elapsed since the first element of the batch was received. Batches larger
+    than `max_size` are split.
+
+    :param max_size: maximum number of elements in an emitted batch
+    :param max_delay: maximum time in seconds an element is held back; if None, a batch is
+    only emitted when it is full or when the source completes
+    """
+
+    def op_func(source: Flowable):
+        return source.batch(max_size=max_size, max_delay=max_delay)
+
+    return PipeOperation(op_func)
 
 
 def buffer(buffer_size: int = None):
@@ -82,11 +104,22 @@ def debug(
         on_subscribe: Callable[[Subscriber], None] = None,
         on_raw_ack: Callable[[Ack], None] = None,
         verbose: bool = None,
+        sample_every: int = None,
+        sample_probability: float = None,
+        profiler: OperatorProfiler = None,
 ):
     """
     Print debug messages to the console when providing the `name` argument
 
+    The debug operators can be disabled globally with `rxbp.set_debug_enabled(False)`
+    or by setting the environment variable `RXBP_DEBUG=0`.
+
     :on_next: customize the on next debug console print
+    :sample_every: only debug every n-th batch, the other batches are passed through
+    :sample_probability: only debug a batch with the given probability
+    :profiler: measure the batches and elements per second, the time spent in `on_next`,
+    the time waiting for asynchronous acknowledgments and the batch sizes of the operator;
+    the measurements are grouped by `name` and exported with `profiler.snapshot()`
     """
 
     stack = get_stack_lines()
@@ -104,6 +137,9 @@ def debug(
             on_raw_ack=on_raw_ack,
             stack=stack,
             verbose=verbose,
+            sample_every=sample_every,
+            sample_probability=sample_probability,
+            profiler=profiler,
         )
 
     return PipeOperation(op_func)
@@ -180,6 +216,25 @@ def filter(predicate: Callable[[Any], bool]):
     return PipeOperation(op_func)
 
 
+def filter_batch(predicate: Callable[[ElementType], Iterable[bool]]):
+    """
+    Only emit those elements for which the mask returned by the predicate holds.
+
+    Contrary to `filter`, the predicate is called once per batch with the whole
+    batch (e.g. a list, a range or a numpy array) and returns a boolean mask.
+
+    :param predicate: a function that returns a boolean mask for the given batch
+    :return: filtered Flowable
+    """
+
+    stack = get_stack_lines()
+
+    def op_func(left: Flowable):
+        return left.filter_batch(predicate=predicate, stack=stack)
+
+    return PipeOperation(op_func)
+
+
 def first():
     """
     Emit the first element only and stop the Flowable sequence thereafter.
@@ -278,6 +333,74 @@ def map(func: Callable[[Any], Any]):
     return PipeOperation(op_func)
 
 
+def map_batch(func: Callable[[ElementType], ElementType]):
+    """ Map each batch emitted by the source by applying the given function.
+
+    Contrary to `map`, the function is called once per batch with the whole
+    batch (e.g. a list, a range or a numpy array) and returns the mapped batch.
+
+    :param func: function that defines the mapping applied to each batch of the \
+    Flowable sequence.
+    """
+
+    def op_func(source: Flowable):
+        return source.map_batch(func=func)
+
+    return PipeOperation(op_func)
+
+
+def map_parallel(
+        func: Callable[[Any], Any],
+        executor: Union[Executor, ThreadPoolScheduler] = None,
+        max_in_flight: int = None,
+):
+    """
+    Map each element emitted by the source by applying the given function on an
+    executor and emit the mapped elements in their original order.
+
+    Each batch is mapped in a separate task; up to `max_in_flight` batches are mapped
+    concurrently before the source is back-pressured. Use a `ProcessPoolExecutor` for
+    CPU-bound functions (the function and the elements need to be picklable), or a
+    thread pool for functions that release the GIL.
+
+    :param func: function that defines the mapping applied to each element
+    :param executor: the executor, or a ThreadPoolScheduler whose executor is used; if
+    None, the subscriber scheduler needs to be a ThreadPoolScheduler
+    :param max_in_flight: maximum number of batches mapped concurrently, defaults to
+    the number of workers of the executor
+    """
+
+    def op_func(source: Flowable):
+        return source.map_parallel(func=func, executor=executor, max_in_flight=max_in_flight)
+
+    return PipeOperation(op_func)
+
+
+def map_parallel_unordered(
+        func: Callable[[Any], Any],
+        executor: Union[Executor, ThreadPoolScheduler] = None,
+        max_in_flight: int = None,
+):
+    """
+    Map each element emitted by the source by applying the given function on an
+    executor and emit each mapped batch as soon as it is ready.
+
+    Contrary to `map_parallel`, a slow batch does not hold back the batches
+    received after it; the order of the elements is only preserved within a batch.
+
+    :param func: function that defines the mapping applied to each element
+    :param executor: the executor, or a ThreadPoolScheduler whose executor is used; if
+    None, the subscriber scheduler needs to be a ThreadPoolScheduler
+    :param max_in_flight: maximum number of batches mapped concurrently, defaults to
+    the number of workers of the executor
+    """
+
+    def op_func(source: Flowable):
+        return source.map_parallel_unordered(func=func, executor=executor, max_in_flight=max_in_flight)
+
+    return PipeOperation(op_func)
+
+
 def map_to_iterator(
         func: Callable[[ValueType], Iterator[ValueType]],
 ):
@@ -294,15 +417,20 @@ def map_to_iterator(
     return PipeOperation(op_func)
 
 
-def merge(*others: Flowable):
+def merge(*others: Flowable, weights: List[int] = None):
     """
     Merge the elements of this and the other Flowable sequences into a single *Flowable*.
 
+    The batches of the Flowables are served in round-robin order. If weights are
+    given, a Flowable can send up to its weight number of batches per round.
+
     :param sources: other Flowables that get merged to this Flowable.
+    :param weights: number of batches each Flowable can send per round, starting
+    with the source Flowable
     """
 
     def op_func(left: Flowable):
-        return left.merge(*others)
+        return left.merge(*others, weights=weights)
 
     return PipeOperation(op_func)
 
@@ -333,6 +461,42 @@ def pairwise():
     return PipeOperation(op_func)
 
 
+def prefetch(n: int, scheduler: Scheduler = None):
+    """
+    Allow up to `n` batches to be in flight between the source and the downstream
+    operators, such that both sides can run concurrently.
+
+    The source gets back-pressured only after sending `n` batches that were not
+    acknowledged downstream. It is released again once three quarters of them
+    are acknowledged.
+
+    :param n: maximum number of batches sent without being acknowledged downstream
+    :param scheduler: scheduler the batches are sent downstream on; by default the
+    scheduler of the subscriber is used
+    """
+
+    def op_func(source: Flowable):
+        return source.prefetch(n=n, scheduler=scheduler)
+
+    return PipeOperation(op_func)
+
+
+def rebatch(size: int):
+    """
+    Split the batches emitted by the source into batches of at most `size` elements.
+
+    Lists, ranges and numpy arrays are split without copying the elements; other
+    iterables are consumed one batch at a time.
+
+    :param size: maximum number of elements in an emitted batch
+    """
+
+    def op_func(source: Flowable):
+        return source.rebatch(size=size)
+
+    return PipeOperation(op_func)
+
+
 def reduce(
         func: Callable[[Any, Any], Any],
         initial: Any,
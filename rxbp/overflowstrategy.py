@@ -1,3 +1,4 @@
+import threading
 from abc import ABC
 
 
@@ -5,6 +6,16 @@ class OverflowStrategy(ABC):
     def __init__(self, buffer_size: int):
         self.buffer_size = buffer_size
 
+        # number of batches and elements dropped by the Flowables created with this strategy
+        self.lock = threading.Lock()
+        self.dropped_batches = 0
+        self.dropped_elements = 0
+
+    def count_dropped(self, n_batches: int, n_elements: int):
+        with self.lock:
+            self.dropped_batches += n_batches
+            self.dropped_elements += n_elements
+
 
 class BackPressure(OverflowStrategy):
     # unbounded buffer
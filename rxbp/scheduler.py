@@ -1,7 +1,9 @@
+import time
 from abc import ABC
 
 from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.mixins.schedulermixin import SchedulerMixin
+from rxbp.schedulers.schedulerinstrumentation import SchedulerInstrumentation
 
 
 class BatchedExecution(ExecutionModelMixin):
@@ -13,6 +15,35 @@ class BatchedExecution(ExecutionModelMixin):
         return (current + 1) & self.batched_execution_modulus
 
 
+class TimeSlicedExecution(ExecutionModelMixin):
+    """
+    Yields to the scheduler once a loop ran synchronously for `time_slice`
+    seconds, independently of the number of batches sent in the meantime.
+
+    The frame index encodes the deadline of the current time slice, such that
+    the execution model itself stays stateless and can be shared by all loops
+    running on a scheduler.
+    """
+
+    def __init__(self, time_slice: float):
+        assert 0 < time_slice, f'time slice "{time_slice}" must be positive'
+
+        self.time_slice = time_slice
+        self.time_slice_ns = max(1, int(time_slice * 1e9))
+
+    def next_frame_index(self, current: int) -> int:
+        now = time.perf_counter_ns()
+
+        # a new time slice starts
+        if current <= 0:
+            return now + self.time_slice_ns
+
+        if current <= now:
+            return 0
+
+        return current
+
+
 class UncaughtExceptionReport:
     def report_failure(self, exc: Exception):
         raise exc
@@ -23,12 +54,20 @@ class Scheduler(SchedulerMixin, ABC):
 
 
 class SchedulerBase(Scheduler, ABC):
-    def __init__(self, r: UncaughtExceptionReport = None, execution_model: ExecutionModelMixin = None):
+    def __init__(
+            self,
+            r: UncaughtExceptionReport = None,
+            execution_model: ExecutionModelMixin = None,
+            instrumentation: SchedulerInstrumentation = None,
+    ):
         super().__init__()
 
         self.r = r or UncaughtExceptionReport()
         self.execution_model = execution_model or BatchedExecution(256)
 
+        # scheduled actions are only measured if an instrumentation is given
+        self.instrumentation = instrumentation
+
     def report_failure(self, exc: Exception):
         return self.r.report_failure(exc)
 
@@ -6,12 +6,20 @@ from threading import Thread
 from rx.core.typing import ScheduledAction, RelativeTime, AbsoluteTime
 from rx.disposable import Disposable
 
+from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.scheduler import SchedulerBase
+from rxbp.schedulers.schedulerinstrumentation import SchedulerInstrumentation
 
 
 class AsyncIOScheduler(SchedulerBase, Disposable):
-    def __init__(self, loop: asyncio.AbstractEventLoop = None, new_thread: bool = None):
-        super().__init__()
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop = None,
+            new_thread: bool = None,
+            execution_model: ExecutionModelMixin = None,
+            instrumentation: SchedulerInstrumentation = None,
+    ):
+        super().__init__(execution_model=execution_model, instrumentation=instrumentation)
 
         self.loop: asyncio.AbstractEventLoop = loop or asyncio.new_event_loop()
 
@@ -43,6 +51,9 @@ class AsyncIOScheduler(SchedulerBase, Disposable):
     def schedule(self,
                  action: ScheduledAction,
                  state=None):
+        if self.instrumentation is not None:
+            action = self.instrumentation.instrument(action)
+
         def func():
             action(self, state)
 
@@ -66,6 +77,9 @@ class AsyncIOScheduler(SchedulerBase, Disposable):
         else:
             timespan = duetime
 
+        if self.instrumentation is not None:
+            action = self.instrumentation.instrument(action, delay=max(0.0, timespan))
+
         def _():
             def func():
                 action(self, state)
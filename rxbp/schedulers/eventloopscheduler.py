@@ -1,5 +1,7 @@
 import time
+from typing import Optional
 
+from rx.core import typing
 from rx.scheduler.eventloopscheduler import EventLoopScheduler as ParentEventLoopScheduler
 
 from rxbp.scheduler import SchedulerBase
@@ -16,3 +18,16 @@ class EventLoopScheduler(SchedulerBase, ParentEventLoopScheduler):
 
     def sleep(self, seconds: float) -> None:
         time.sleep(seconds)
+
+    def schedule_absolute(
+            self,
+            duetime: typing.AbsoluteTime,
+            action: typing.ScheduledAction,
+            state: Optional[typing.TState] = None,
+    ) -> typing.Disposable:
+        # `schedule` and `schedule_relative` are both implemented by `schedule_absolute`
+        if self.instrumentation is not None:
+            delay = max(0.0, (self.to_datetime(duetime) - self.now).total_seconds())
+            action = self.instrumentation.instrument(action, delay=delay)
+
+        return super().schedule_absolute(duetime, action, state=state)
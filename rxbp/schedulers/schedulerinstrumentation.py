@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Callable, Dict, Any
+
+from rx.core import typing
+
+
+class LatencyHistogram:
+    """
+    Histogram with power-of-two buckets in microseconds, i.e. bucket `i` counts
+    the durations in [2^(i-1), 2^i) microseconds and bucket 0 the durations
+    below one microsecond.
+    """
+
+    def __init__(self, n_buckets: int = 32):
+        self.buckets = [0] * n_buckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        index = min(int(seconds * 1e6).bit_length(), len(self.buckets) - 1)
+
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += seconds
+
+        if self.max < seconds:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the upper bound in seconds of the bucket containing the q-th percentile.
+        """
+
+        if self.count == 0:
+            return 0.0
+
+        threshold = q / 100 * self.count
+        cumulative = 0
+        for index, count in enumerate(self.buckets):
+            cumulative += count
+
+            if threshold <= cumulative:
+                return min((1 << index) * 1e-6, self.max)
+
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class SchedulerInstrumentation:
+    """
+    Opt-in instrumentation of a scheduler that counts the scheduled actions and
+    measures how long they wait until they are invoked and how long they run.
+
+    A scheduler only instruments its actions if an instance is given, e.g.
+    `TrampolineScheduler(instrumentation=SchedulerInstrumentation())`. The wait
+    time of a timed action is measured from its due time. A cancelled action
+    that is never invoked remains counted as queued.
+    """
+
+    def __init__(self, callback: Callable[[float, float], None] = None):
+        """
+        :param callback: called with the wait time and the run time in seconds after
+        each invoked action
+        """
+
+        self.callback = callback
+
+        self.lock = threading.Lock()
+
+        self.n_scheduled = 0
+        self.n_invoked = 0
+        self.n_failed = 0
+        self.max_queue_depth = 0
+
+        self.wait_time = LatencyHistogram()
+        self.run_time = LatencyHistogram()
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        Number of actions that are scheduled, but not invoked yet.
+        """
+
+        return self.n_scheduled - self.n_invoked
+
+    def instrument(self, action: typing.ScheduledAction, delay: float = 0.0) -> typing.ScheduledAction:
+        """
+        Wrap the action such that it gets measured when it is invoked.
+
+        :param delay: seconds the action is intentionally delayed
+        """
+
+        due_time = time.perf_counter() + delay
+
+        with self.lock:
+            self.n_scheduled += 1
+            queue_depth = self.n_scheduled - self.n_invoked
+
+            if self.max_queue_depth < queue_depth:
+                self.max_queue_depth = queue_depth
+
+        def instrumented_action(scheduler, state):
+            start_time = time.perf_counter()
+            wait_time = max(0.0, start_time - due_time)
+            is_failed = True
+
+            try:
+                result = action(scheduler, state)
+                is_failed = False
+                return result
+
+            finally:
+                run_time = time.perf_counter() - start_time
+
+                with self.lock:
+                    self.n_invoked += 1
+                    if is_failed:
+                        self.n_failed += 1
+                    self.wait_time.record(wait_time)
+                    self.run_time.record(run_time)
+
+                if self.callback is not None:
+                    self.callback(wait_time, run_time)
+
+        return instrumented_action
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                'n_scheduled': self.n_scheduled,
+                'n_invoked': self.n_invoked,
+                'n_failed': self.n_failed,
+                'queue_depth': self.n_scheduled - self.n_invoked,
+                'max_queue_depth': self.max_queue_depth,
+                'wait_time': self.wait_time.to_dict(),
+                'run_time': self.run_time.to_dict(),
+            }
+
@@ -9,16 +9,20 @@ from concurrent.futures.thread import ThreadPoolExecutor
 from rx.core.typing import RelativeTime
 from rx.disposable import Disposable, MultipleAssignmentDisposable, CompositeDisposable
 
+from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.schedulers.asyncioscheduler import AsyncIOScheduler
+from rxbp.schedulers.schedulerinstrumentation import SchedulerInstrumentation
 
 
 class ThreadPoolScheduler(AsyncIOScheduler):
 
     def __init__(self, name, loop: asyncio.AbstractEventLoop = None, new_thread=True, executor: Executor = None,
-                 max_workers = None):
+                 max_workers = None, execution_model: ExecutionModelMixin = None,
+                 instrumentation: SchedulerInstrumentation = None):
 
         # starts a new thread
-        super().__init__(loop=loop, new_thread=new_thread)
+        super().__init__(loop=loop, new_thread=new_thread, execution_model=execution_model,
+                         instrumentation=instrumentation)
 
         self.executor = executor or ThreadPoolExecutor(max_workers=max_workers)
 
@@ -37,6 +41,9 @@ class ThreadPoolScheduler(AsyncIOScheduler):
         time.sleep(seconds)
 
     def schedule(self, action, state=None):
+        if self.instrumentation is not None:
+            action = self.instrumentation.instrument(action)
+
         # def outer_action(_, __):
         def func():
             action(self, None)
@@ -64,6 +71,9 @@ class ThreadPoolScheduler(AsyncIOScheduler):
         else:
             timespan = duetime
 
+        if self.instrumentation is not None:
+            action = self.instrumentation.instrument(action, delay=max(0.0, timespan))
+
         def func():
             action(self, None)
 
@@ -3,28 +3,45 @@ import logging
 import threading
 import time
 import traceback
+from collections import deque
 from typing import Optional
 
 from rx.core import typing
+from rx.disposable import SingleAssignmentDisposable
 from rx.internal import PriorityQueue
 from rx.scheduler.scheduleditem import ScheduledItem
 from rx.scheduler.scheduler import Scheduler
 
+from rxbp.mixins.executionmodelmixin import ExecutionModelMixin
 from rxbp.scheduler import SchedulerBase as RxBPSchedulerBase
+from rxbp.schedulers.schedulerinstrumentation import SchedulerInstrumentation
 
 log = logging.getLogger('Rx')
 
 
 class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
-    def __init__(self):
+    def __init__(
+            self,
+            execution_model: ExecutionModelMixin = None,
+            instrumentation: SchedulerInstrumentation = None,
+    ):
         """Gets a scheduler that schedules work as soon as possible on the
-        current thread."""
+        current thread.
 
-        super().__init__()
+        Args:
+            execution_model: [Optional] determines how often a synchronous loop
+                yields to the scheduler; `BatchedExecution(256)` by default.
+            instrumentation: [Optional] measures the scheduled actions.
+        """
+
+        super().__init__(execution_model=execution_model, instrumentation=instrumentation)
 
         self._idle = True
         self.queue = PriorityQueue()
 
+        # actions scheduled for immediate execution bypass the priority queue
+        self.immediate_queue = deque()
+
         self.lock = threading.RLock()
 
     def sleep(self, seconds: float) -> None:
@@ -51,7 +68,25 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
             (best effort).
         """
 
-        return self.schedule_absolute(self.now, action, state=state)
+        if self.instrumentation is not None:
+            action = self.instrumentation.instrument(action)
+
+        # fast path: an immediate action is queued without computing a due time
+        disposable = SingleAssignmentDisposable()
+
+        with self.lock:
+            self.immediate_queue.append((action, state, disposable))
+
+            if self._idle:
+                self._idle = False
+                start_trampoline = True
+            else:
+                start_trampoline = False
+
+        if start_trampoline:
+            self._run_trampoline()
+
+        return disposable
 
     def schedule_relative(self,
                           duetime: typing.RelativeTime,
@@ -88,6 +123,10 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
         if duetime > self.now:
             log.warning("Do not schedule imperative work!")
 
+        if self.instrumentation is not None:
+            delay = max(0.0, (duetime - self.now).total_seconds())
+            action = self.instrumentation.instrument(action, delay=delay)
+
         si = ScheduledItem(self, state, action, duetime)
 
         with self.lock:
@@ -100,32 +139,57 @@ class TrampolineScheduler(RxBPSchedulerBase, Scheduler):
                 start_trampoline = False
 
         if start_trampoline:
-            while True:
-                try:
-                    while self.queue:
-                        item: ScheduledItem = self.queue.peek()
-
-                        if item.is_cancelled():
-                            with self.lock:
-                                self.queue.dequeue()
-
-                        else:
-                            diff = item.duetime - item.scheduler.now
-                            if diff <= datetime.timedelta(0):
-                                item.invoke()
-                                with self.lock:
-                                    self.queue.dequeue()
-                            else:
-                                time.sleep(diff.total_seconds())
-
-                except:
-                    traceback.print_exc()
-                finally:
-                    with self.lock:
-                        if not self.queue:
-                            self._idle = True
-                            # self.queue.clear()
-                            break
+            self._run_trampoline()
 
         return si.disposable
 
+    def _run_next(self) -> bool:
+        """
+        Invoke the next action and return False if there is no action left.
+
+        Timed actions that are due are invoked before the immediate actions;
+        the due time is only checked if there are timed actions at all.
+        """
+
+        if self.queue:
+            item: ScheduledItem = self.queue.peek()
+
+            if item.is_cancelled():
+                with self.lock:
+                    self.queue.dequeue()
+                return True
+
+            diff = item.duetime - item.scheduler.now
+            if diff <= datetime.timedelta(0):
+                with self.lock:
+                    self.queue.dequeue()
+                item.invoke()
+                return True
+
+            if not self.immediate_queue:
+                time.sleep(diff.total_seconds())
+                return True
+
+        if self.immediate_queue:
+            action, state, disposable = self.immediate_queue.popleft()
+
+            if not disposable.is_disposed:
+                disposable.disposable = self.invoke_action(action, state=state)
+            return True
+
+        return False
+
+    def _run_trampoline(self):
+        while True:
+            try:
+                while self._run_next():
+                    pass
+
+            except:
+                traceback.print_exc()
+            finally:
+                with self.lock:
+                    if not self.queue and not self.immediate_queue:
+                        self._idle = True
+                        # self.queue.clear()
+                        break
@@ -1,10 +1,13 @@
+import asyncio
 import math
-from typing import Iterable, Any, List
+from typing import Iterable, Any, List, Union, AsyncIterable
 
 import rx
 from rx import operators
 
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
 from rxbp.flowable import Flowable
+from rxbp.flowables.fromasynciterableflowable import FromAsyncIterableFlowable
 from rxbp.flowables.fromemptyflowable import FromEmptyFlowable
 from rxbp.flowables.fromiterableflowable import FromIterableFlowable
 from rxbp.flowables.fromrxbufferingflowable import FromRxBufferingFlowable
@@ -13,6 +16,7 @@ from rxbp.flowables.fromsingleelementflowable import FromSingleElementFlowable
 from rxbp.init.initflowable import init_flowable
 from rxbp.overflowstrategy import OverflowStrategy, BackPressure, DropOld, ClearBuffer
 from rxbp.utils.getstacklines import get_stack_lines
+from rxbp.utils.ndarrayutils import is_ndarray, np
 
 
 def concat(*sources: Flowable):
@@ -37,6 +41,30 @@ def empty():
     return init_flowable(FromEmptyFlowable())
 
 
+def from_async_iterable(
+        async_iterable: AsyncIterable,
+        loop: asyncio.AbstractEventLoop = None,
+) -> Flowable:
+    """
+    Create a Flowable that emits each element of the given asynchronous iterable,
+    e.g. an async generator.
+
+    The elements are awaited on the event loop and sent downstream one at a time.
+    The next element is only awaited once the previous one is acknowledged,
+    therefore a slow consumer back-pressures the asynchronous iterable.
+
+    :param async_iterable: the asynchronous iterable whose elements are sent
+    :param loop: the event loop the asynchronous iterable runs on; by default the
+    event loop running at subscription time is used, an exception is raised if
+    there is none
+    """
+
+    return init_flowable(FromAsyncIterableFlowable(
+        async_iterable=async_iterable,
+        loop=loop,
+    ))
+
+
 def from_iterable(iterable: Iterable): #, base: Any = None):
     """
     Create a Flowable that emits each element of the given iterable.
@@ -55,7 +83,10 @@ def from_list(val: List, batch_size: int = None, base: Any = None):
     """
     Create a Flowable that emits each element of the given list.
 
-    :param val: the list whose elements are sent
+    If `val` is a numpy array, then the batches are emitted as numpy arrays
+    that are views on `val`.
+
+    :param val: the list or numpy array whose elements are sent
     :param batch_size: determines the number of elements that are sent in a batch
     :param base: the base of the Flowable sequence
     """
@@ -69,7 +100,7 @@ def from_list(val: List, batch_size: int = None, base: Any = None):
         ))
 
     else:
-        if batch_size == 1:
+        if batch_size == 1 and not is_ndarray(buffer):
             class EachElementIterable():
                 def __iter__(self):
                     return ([e] for e in buffer)
@@ -98,13 +129,20 @@ def from_list(val: List, batch_size: int = None, base: Any = None):
         ))
 
 
-def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any = None):
+def from_range(
+        arg1: int,
+        arg2: int = None,
+        batch_size: int = None,
+        base: Any = None,
+        as_ndarray: bool = None,
+):
     """
     Create a Flowable that emits elements defined by the range.
 
     :param arg1: start identifier
     :param arg2: end identifier
     :param batch_size: determines the number of elements that are sent in a batch
+    :param as_ndarray: if set to True, the batches are emitted as numpy arrays
     """
 
     if arg2 is None:
@@ -116,7 +154,14 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
 
     n_elements = stop_idx - start_idx
 
-    if batch_size is None:
+    if as_ndarray:
+        assert np is not None, 'numpy is required to emit batches of type numpy.ndarray'
+
+        to_batch = np.arange
+    else:
+        to_batch = range
+
+    if batch_size is None and not as_ndarray:
         class FromRangeIterable:
             def __iter__(self):
                 return iter(range(start_idx, stop_idx))
@@ -128,6 +173,9 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
         )
 
     else:
+        if batch_size is None:
+            batch_size = max(n_elements, 1)
+
         n_batches = max(math.ceil(n_elements / batch_size) - 1, 0)
 
         class FromRangeIterable():
@@ -138,11 +186,11 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
                 for idx in range(n_batches):
                     current_stop_idx = current_stop_idx + batch_size
 
-                    yield range(current_start_idx, current_stop_idx)
+                    yield to_batch(current_start_idx, current_stop_idx)
 
                     current_start_idx = current_stop_idx
 
-                yield range(current_start_idx, stop_idx)
+                yield to_batch(current_start_idx, stop_idx)
 
         iterable = FromRangeIterable()
 
@@ -153,7 +201,7 @@ def from_range(arg1: int, arg2: int = None, batch_size: int = None, base: Any =
 
 def from_rx(
         source: rx.Observable,
-        batch_size: int = None,
+        batch_size: Union[int, AdaptiveBatchSize] = None,
         overflow_strategy: OverflowStrategy = None,
         is_batched: bool = None,
 ) -> Flowable:
@@ -162,14 +210,26 @@ def from_rx(
 
     :param source: an rx.observable
     :param overflow_strategy: define which batches are ignored once the buffer is full
-    :param batch_size: determines the number of elements that are sent in a batch
+    :param batch_size: determines the number of elements that are sent in a batch; an
+    `AdaptiveBatchSize` adapts the number of elements at runtime
     :param is_batched: if set to True, the elements emitted by the source rx.Observable are
     either of type List or of type Iterator
     """
 
-    if is_batched is True:
+    if isinstance(batch_size, AdaptiveBatchSize):
+        assert is_batched is not True, 'an adaptive batch size cannot be used with an already batched source'
+
+        # the elements are batched by the Flowable at runtime
+        adaptive_batch_size = batch_size
+        batched_source = source
+
+    elif is_batched is True:
+        adaptive_batch_size = None
         batched_source = source
+
     else:
+        adaptive_batch_size = None
+
         if batch_size is None:
             batch_size = 1
 
@@ -181,6 +241,7 @@ def from_rx(
         return init_flowable(FromRxEvictingFlowable(
             batched_source=batched_source,
             overflow_strategy=overflow_strategy,
+            adaptive_batch_size=adaptive_batch_size,
         ))
 
     else:
@@ -195,20 +256,25 @@ def from_rx(
             batched_source=batched_source,
             overflow_strategy=overflow_strategy,
             buffer_size=buffer_size,
+            adaptive_batch_size=adaptive_batch_size,
         ))
 
 
-def merge(*sources: Flowable) -> Flowable:
+def merge(*sources: Flowable, weights: List[int] = None) -> Flowable:
     """
     Merge the elements of zero or more *Flowables* into a single *Flowable*.
 
+    The batches of the Flowables are served in round-robin order. If weights are
+    given, a Flowable can send up to its weight number of batches per round.
+
     :param sources: zero or more Flowables whose elements are merged
+    :param weights: number of batches each Flowable can send per round
     """
 
     if len(sources) == 0:
         return empty()
     else:
-        return sources[0].merge(*sources[1:])
+        return sources[0].merge(*sources[1:], weights=weights)
 
 
 def return_value(val: Any):
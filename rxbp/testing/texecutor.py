@@ -0,0 +1,28 @@
+from concurrent.futures import Executor, Future
+
+
+class TExecutor(Executor):
+    """ A test executor that runs a submitted task only when `run` is called
+    """
+
+    def __init__(self):
+        self.tasks = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.tasks.append((future, fn, args, kwargs))
+        return future
+
+    def run(self, index: int = 0):
+        future, fn, args, kwargs = self.tasks.pop(index)
+
+        try:
+            result = fn(*args, **kwargs)
+        except Exception as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def run_all(self):
+        while self.tasks:
+            self.run()
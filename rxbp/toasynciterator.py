@@ -0,0 +1,78 @@
+import asyncio
+from typing import Optional
+
+from rxbp.mixins.flowablesubscribemixin import FlowableSubscribeMixin
+from rxbp.observers.toasynciteratorobserver import ToAsyncIteratorObserver
+from rxbp.scheduler import Scheduler
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+def to_async_iterator(
+        source: FlowableSubscribeMixin,
+        scheduler: Scheduler = None,
+        buffer_size: Optional[int] = 16,
+        batched: bool = False,
+):
+    """
+    Return an asynchronous iterator over the elements of the source to be used
+    with `async for`.
+
+    The source is subscribed once the iteration starts on the running event
+    loop. Closing the iterator early stops the source.
+
+    :param source: Flowable whose elements are iterated
+    :param scheduler: scheduler the source is subscribed with
+    :param buffer_size: number of batches queued before the source gets back-pressured;
+    if None, the batches are queued without back-pressure
+    :param batched: if True, the iterator yields whole batches instead of single elements
+    """
+
+    assert buffer_size is None or 0 < buffer_size, f'buffer size "{buffer_size}" must be positive'
+
+    async def gen_batches():
+        observer = ToAsyncIteratorObserver(
+            loop=asyncio.get_running_loop(),
+            buffer_size=buffer_size,
+        )
+        subscribe_scheduler = TrampolineScheduler()
+
+        disposable = source.subscribe(
+            observer=observer,
+            scheduler=scheduler or subscribe_scheduler,
+            subscribe_scheduler=subscribe_scheduler,
+        )
+
+        try:
+            while True:
+                waiter = observer.wait()
+
+                if waiter is not None:
+                    await waiter
+                    continue
+
+                if observer.queue:
+                    yield observer.pop()
+
+                elif observer.is_completed:
+                    return
+
+                else:
+                    raise observer.exception
+
+        finally:
+            observer.stop()
+            disposable.dispose()
+
+    if batched:
+        return gen_batches()
+
+    async def gen():
+        batches = gen_batches()
+        try:
+            async for batch in batches:
+                for value in batch:
+                    yield value
+        finally:
+            await batches.aclose()
+
+    return gen()
@@ -1,63 +1,74 @@
-from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional
+
+from rx.scheduler import VirtualTimeScheduler
 
-from rxbp.acknowledgement.continueack import continue_ack
-from rxbp.acknowledgement.ack import Ack
 from rxbp.mixins.flowablesubscribemixin import FlowableSubscribeMixin
-from rxbp.observer import Observer
+from rxbp.observers.toiteratorobserver import ToIteratorObserver
 from rxbp.scheduler import Scheduler
 from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
-from rxbp.typing import ElementType
-
-
-def to_iterator(source: FlowableSubscribeMixin, scheduler: Scheduler = None):
-    @dataclass
-    class ToIteratorObserver(Observer):
-        received: List[ElementType]
-        is_completed: bool
-        exception: Optional[Exception]
 
-        def on_next(self, elem: ElementType) -> Ack:
-            if not isinstance(elem, list):
-                elem = list(elem)
 
-            self.received.append(elem)
-            return continue_ack
+def to_iterator(
+        source: FlowableSubscribeMixin,
+        scheduler: Scheduler = None,
+        buffer_size: Optional[int] = 16,
+        batched: bool = False,
+):
+    """
+    Subscribe to the source and return a blocking iterator over its elements.
 
-        def on_error(self, exc: Exception):
-            self.exception = exc
+    :param source: Flowable whose elements are iterated
+    :param scheduler: scheduler the source is subscribed with
+    :param buffer_size: number of batches queued before the source gets back-pressured;
+    if None, the batches are queued without back-pressure
+    :param batched: if True, the iterator yields whole batches instead of single elements
+    """
 
-        def on_completed(self):
-            self.is_completed = True
+    assert buffer_size is None or 0 < buffer_size, f'buffer size "{buffer_size}" must be positive'
 
     observer = ToIteratorObserver(
-        received=[],
-        is_completed=False,
-        exception=None,
+        buffer_size=buffer_size,
     )
     subscribe_scheduler = TrampolineScheduler()
     scheduler = scheduler or subscribe_scheduler
 
+    # elements only arrive when the virtual time advances, therefore the
+    # iterator cannot block on the condition
+    is_virtual_time = isinstance(scheduler, VirtualTimeScheduler)
+
     source.subscribe(
         observer=observer,
         scheduler=scheduler,
         subscribe_scheduler=subscribe_scheduler,
     )
 
-    def gen():
+    def gen_batches():
         while True:
-            while True:
-                if len(observer.received):
-                    break
+            with observer.condition:
+                if not is_virtual_time:
+                    observer.condition.wait_for(lambda: observer.has_event)
 
-                if observer.is_completed:
-                    return  # StopIteration
+                has_batch = bool(observer.queue)
+                is_completed = observer.is_completed
+                exception = observer.exception
 
-                if observer.exception is not None:
-                    raise observer.exception
+            if has_batch:
+                yield observer.pop()
 
+            elif is_completed:
+                return  # StopIteration
+
+            elif exception is not None:
+                raise exception
+
+            else:
                 scheduler.sleep(0.1)
 
-            yield from observer.received.pop(0)
+    if batched:
+        return gen_batches()
+
+    def gen():
+        for batch in gen_batches():
+            yield from batch
 
     return gen()
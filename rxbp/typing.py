@@ -8,5 +8,8 @@ ValueType = TypeVar('ValueType')
 # list or in an iterator. Putting the values in an iterator is sometimes more
 # preferable as the data does not need to be copied from one location to the other.
 # But sometimes you cannot avoid buffering data in a list.
+# A batch can also be a numpy array (if numpy is installed), in which case
+# some operators process the whole batch at once instead of each element
+# separately (see `rxbp.utils.ndarrayutils`).
 # A batch consists of zero or more elements.
 ElementType = Union[Iterator[ValueType], List[ValueType]]
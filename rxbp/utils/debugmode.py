@@ -0,0 +1,24 @@
+import os
+
+# the debug operators can be disabled without code changes, e.g. in production
+_is_debug_enabled = os.environ.get('RXBP_DEBUG', '1') != '0'
+
+
+def set_debug_enabled(enabled: bool) -> None:
+    """
+    Enable or disable all `debug` operators globally, i.e. the `debug` operators
+    of Flowables and MultiCasts as well as the `debug_base` operator of indexed
+    Flowables.
+
+    A disabled `debug` operator subscribes directly to its source and, therefore,
+    adds no overhead to the elements sent through it. The setting is read when a
+    Flowable or MultiCast is subscribed.
+    """
+
+    global _is_debug_enabled
+
+    _is_debug_enabled = enabled
+
+
+def is_debug_enabled() -> bool:
+    return _is_debug_enabled
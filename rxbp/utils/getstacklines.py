@@ -1,9 +1,91 @@
+import linecache
+import os
+import sys
 import traceback
 
+from collections.abc import Sequence
 from traceback import FrameSummary
 from typing import List
 
+EAGER_STACK_CAPTURE = 'eager'
+LAZY_STACK_CAPTURE = 'lazy'
+NO_STACK_CAPTURE = 'disabled'
+
+_stack_capture_modes = (EAGER_STACK_CAPTURE, LAZY_STACK_CAPTURE, NO_STACK_CAPTURE)
+
+# the mode can be selected without code changes, e.g. to disable the stack capture in production
+_stack_capture = os.environ.get('RXBP_STACK_CAPTURE', LAZY_STACK_CAPTURE)
+
+assert _stack_capture in _stack_capture_modes, \
+    f'stack capture mode "{_stack_capture}" must be one of {_stack_capture_modes}'
+
+
+def set_stack_capture(mode: str) -> None:
+    """
+    Select how the stack is captured when an operator is created; the stack is
+    used to point to the operator in an error message.
+
+    :param mode: 'eager' extracts the stack including the source lines immediately,
+    'lazy' only records the code locations and extracts the stack when an error is
+    reported, 'disabled' does not capture the stack at all
+    """
+
+    global _stack_capture
+
+    assert mode in _stack_capture_modes, \
+        f'stack capture mode "{mode}" must be one of {_stack_capture_modes}'
+
+    _stack_capture = mode
+
+
+class LazyStack(Sequence):
+    """
+    Stack lines that are only extracted when they are accessed.
+
+    Only the code objects and line numbers are recorded, such that no frame
+    (and no local variable) is kept alive by the stack.
+    """
+
+    def __init__(self, locations: List):
+        self._locations = locations
+        self._stack_lines = None
+
+    def _extract(self) -> List[FrameSummary]:
+        if self._stack_lines is None:
+            stack_lines = []
+            for code, lineno in self._locations:
+                linecache.checkcache(code.co_filename)
+                stack_lines.append(FrameSummary(code.co_filename, lineno, code.co_name))
+
+            self._stack_lines = stack_lines
+
+        return self._stack_lines
+
+    def __getitem__(self, index):
+        return self._extract()[index]
+
+    def __len__(self):
+        return len(self._locations)
+
 
 def get_stack_lines(index: int = 2) -> List[FrameSummary]:
+    if _stack_capture == LAZY_STACK_CAPTURE:
+        try:
+            frame = sys._getframe(index)
+        except ValueError:
+            return []
+
+        locations = []
+        while frame is not None:
+            locations.append((frame.f_code, frame.f_lineno))
+            frame = frame.f_back
+
+        # most recent call last as returned by `traceback.extract_stack`
+        locations.reverse()
+        return LazyStack(locations)
+
+    elif _stack_capture == NO_STACK_CAPTURE:
+        return []
+
     stack_lines = traceback.extract_stack()[:-index]
     return stack_lines
@@ -0,0 +1,48 @@
+from typing import Any, Callable, List
+
+from rxbp.typing import ElementType
+
+# numpy is an optional dependency; batches of type `numpy.ndarray` are only
+# treated specially if numpy can be imported
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_ndarray(elem: Any) -> bool:
+    return np is not None and isinstance(elem, np.ndarray)
+
+
+def is_ufunc(func: Callable) -> bool:
+    return np is not None and isinstance(func, np.ufunc)
+
+
+def materialize_batch(elem: ElementType) -> ElementType:
+    """
+    Materialize a batch such that it can be iterated more than once.
+
+    Lists, ranges and numpy arrays are returned as they are, any other
+    iterable is copied into a list.
+    """
+
+    if isinstance(elem, (list, range)) or is_ndarray(elem):
+        return elem
+    else:
+        return list(elem)
+
+
+def concat_batches(batches: List[ElementType]) -> ElementType:
+    """
+    Concatenate materialized batches into a single batch.
+
+    If all batches are numpy arrays, the result is again a numpy array.
+    """
+
+    if 0 < len(batches) and all(is_ndarray(batch) for batch in batches):
+        return np.concatenate(batches)
+
+    result = []
+    for batch in batches:
+        result.extend(batch)
+    return result
@@ -0,0 +1,156 @@
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from rxbp.schedulers.schedulerinstrumentation import LatencyHistogram
+
+
+class BatchSizeHistogram:
+    """
+    Histogram with power-of-two buckets, i.e. bucket `i` counts the batches with
+    [2^(i-1), 2^i) elements and bucket 0 the empty batches.
+    """
+
+    def __init__(self, n_buckets: int = 32):
+        self.buckets = [0] * n_buckets
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def record(self, size: int):
+        index = min(size.bit_length(), len(self.buckets) - 1)
+
+        self.buckets[index] += 1
+        self.count += 1
+        self.total += size
+
+        if self.max < size:
+            self.max = size
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'max': self.max,
+            'buckets': {
+                (1 << index) - 1: count
+                for index, count in enumerate(self.buckets) if count
+            },
+        }
+
+
+class OperatorStats:
+    """
+    Measurements of a single named `debug` operator.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+        self.n_batches = 0
+        self.n_elements = 0
+        self.n_async_acks = 0
+
+        # batches of unknown size, i.e. iterators that are not sampled
+        self.n_unsized_batches = 0
+
+        # time of the first and the last batch sent by the operator
+        self.first_time = None
+        self.last_time = None
+
+        self.batch_size = BatchSizeHistogram()
+        self.on_next_time = LatencyHistogram()
+        self.ack_wait_time = LatencyHistogram()
+
+    def _count_batch(self, start_time: float, end_time: float, size: Optional[int], is_async_ack: bool):
+        if self.first_time is None:
+            self.first_time = start_time
+
+        self.last_time = end_time
+        self.n_batches += 1
+
+        if size is None:
+            self.n_unsized_batches += 1
+        else:
+            self.n_elements += size
+            self.batch_size.record(size)
+
+        if is_async_ack:
+            self.n_async_acks += 1
+
+    def record_batch(self, start_time: float, end_time: float, size: int, is_async_ack: bool):
+        with self.lock:
+            self._count_batch(start_time, end_time, size, is_async_ack)
+            self.on_next_time.record(end_time - start_time)
+
+    def record_untimed_batch(self, time_: float, size: Optional[int], is_async_ack: bool):
+        """
+        Count a batch without measuring its `on_next` time, e.g. a batch not sampled
+        by the `debug` operator; the size is None if it is unknown.
+        """
+
+        with self.lock:
+            self._count_batch(time_, time_, size, is_async_ack)
+
+    def record_async_ack(self, start_time: float):
+        wait_time = time.perf_counter() - start_time
+
+        with self.lock:
+            self.ack_wait_time.record(wait_time)
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self.lock:
+            if self.first_time is None:
+                duration = 0.0
+            else:
+                duration = self.last_time - self.first_time
+
+            return {
+                'n_batches': self.n_batches,
+                'n_elements': self.n_elements,
+                'n_async_acks': self.n_async_acks,
+                'n_unsized_batches': self.n_unsized_batches,
+                'duration': duration,
+                'batches_per_second': self.n_batches / duration if duration else 0.0,
+                'elements_per_second': self.n_elements / duration if duration else 0.0,
+                'batch_size': self.batch_size.to_dict(),
+                'on_next_time': self.on_next_time.to_dict(),
+                'ack_wait_time': self.ack_wait_time.to_dict(),
+            }
+
+
+class OperatorProfiler:
+    """
+    Opt-in profiler that measures the throughput and latency of each `debug`
+    operator it is given to, e.g. `rxbp.op.debug('parse', profiler=profiler)`.
+
+    The measurements are grouped by the name of the `debug` operator. The time
+    spent in `on_next` includes the downstream operators called synchronously,
+    such that the bottleneck of a pipeline shows up as the largest drop
+    between two consecutive `debug` operators. The time waiting for an
+    asynchronous acknowledgment is measured from the return of `on_next`.
+
+    When the `debug` operator samples its batches, every batch is counted but
+    only the sampled batches are timed. The elements of a batch not sampled are
+    only counted if the batch is sized, e.g. a list.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.operators: Dict[str, OperatorStats] = {}
+
+    def get_stats(self, name: str) -> OperatorStats:
+        with self.lock:
+            stats = self.operators.get(name)
+
+            if stats is None:
+                stats = OperatorStats()
+                self.operators[name] = stats
+
+            return stats
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self.lock:
+            operators = list(self.operators.items())
+
+        return {name: stats.to_dict() for name, stats in operators}
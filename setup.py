@@ -12,6 +12,7 @@ setup(
     name='rxbp',
     version='3.0.0a12',
     install_requires=['rx', 'dataclass-abc'],
+    extras_require={'numpy': ['numpy']},
     description='An RxPY extension with back-pressure',
     long_description=long_description,
     long_description_content_type='text/markdown',
@@ -0,0 +1,42 @@
+import unittest
+
+import rxbp
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestMapBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.subscriber = init_subscriber(self.scheduler, self.scheduler)
+
+    def test_map_batch_drops_base_and_selectors(self):
+        source = rxbp.indexed.from_range(4)
+
+        subscription = source.pipe(
+            rxbp.op.map_batch(lambda batch: batch[1:]),
+        ).unsafe_subscribe(self.subscriber)
+
+        self.assertIsNone(subscription.index.base)
+        self.assertIsNone(subscription.index.selectors)
+
+    def test_match_mapped_batches(self):
+        source = rxbp.indexed.from_range(4)
+        mapped = source.pipe(
+            rxbp.op.map_batch(lambda batch: [v * 3 for v in batch[1:]]),
+        )
+
+        with self.assertRaises(Exception):
+            mapped.pipe(
+                rxbp.indexed.op.match(source),
+            ).unsafe_subscribe(self.subscriber)
+
+    def test_match_filtered_batches(self):
+        source = rxbp.indexed.from_range(4)
+
+        result = source.pipe(
+            rxbp.op.filter_batch(lambda batch: [v % 2 == 0 for v in batch]),
+            rxbp.indexed.op.match(source),
+        ).run()
+
+        self.assertEqual([(0, 0), (2, 2)], result)
@@ -0,0 +1,32 @@
+import unittest
+
+import rxbp
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.testing.texecutor import TExecutor
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestMapParallelUnordered(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.executor = TExecutor()
+        self.subscriber = init_subscriber(self.scheduler, self.scheduler)
+
+    def test_ordered_keeps_base(self):
+        source = rxbp.indexed.from_range(4)
+
+        subscription = source.pipe(
+            rxbp.op.map_parallel(lambda v: v + 1, executor=self.executor),
+        ).unsafe_subscribe(self.subscriber)
+
+        self.assertIsNotNone(subscription.index.base)
+
+    def test_unordered_drops_base_and_selectors(self):
+        source = rxbp.indexed.from_range(4)
+
+        subscription = source.pipe(
+            rxbp.op.map_parallel_unordered(lambda v: v + 1, executor=self.executor),
+        ).unsafe_subscribe(self.subscriber)
+
+        self.assertIsNone(subscription.index.base)
+        self.assertIsNone(subscription.index.selectors)
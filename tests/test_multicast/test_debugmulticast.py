@@ -0,0 +1,30 @@
+import unittest
+
+import rxbp
+
+
+class TestDebugMultiCast(unittest.TestCase):
+    def _run(self):
+        received = []
+
+        rxbp.multicast.return_value(rxbp.range(3)).pipe(
+            rxbp.multicast.op.debug('d1', on_next=received.append, verbose=False),
+        ).to_flowable().run()
+
+        return received
+
+    def test_debug(self):
+        received = self._run()
+
+        self.assertEqual(1, len(received))
+
+    def test_debug_disabled(self):
+        rxbp.set_debug_enabled(False)
+
+        try:
+            received = self._run()
+
+        finally:
+            rxbp.set_debug_enabled(True)
+
+        self.assertEqual([], received)
@@ -0,0 +1,65 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.filterobservable import FilterObservable
+from rxbp.observables.fusedobservable import FusedObservable, fuse_observable
+from rxbp.observables.mapobservable import MapObservable
+from rxbp.observables.zipwithindexobservable import ZipWithIndexObservable
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.utils.ndarrayutils import np
+
+
+class TestFusedObservable(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+
+    def test_single_observable_is_not_fused(self):
+        observable = MapObservable(source=self.source, func=lambda v: v + 1)
+
+        self.assertIs(observable, fuse_observable(observable))
+
+    def test_fuse_chain(self):
+        observable = fuse_observable(MapObservable(source=self.source, func=lambda v: v + 1))
+        observable = fuse_observable(FilterObservable(source=observable, predicate=lambda v: v % 2 == 0))
+        observable = fuse_observable(ZipWithIndexObservable(source=observable, selector=None))
+
+        self.assertIsInstance(observable, FusedObservable)
+        self.assertIs(self.source, observable.source)
+        self.assertEqual(3, len(observable.stages))
+
+        sink = TObserver()
+        observable.observe(init_observer_info(sink))
+
+        self.source.on_next_list([1, 2, 3])
+        self.source.on_next_list([4, 5])
+
+        self.assertEqual([(2, 0), (4, 1), (6, 2)], sink.received)
+        self.assertEqual(2, sink.on_next_counter)
+
+    def test_index_is_local_to_observer(self):
+        observable = fuse_observable(MapObservable(source=self.source, func=lambda v: v))
+        observable = fuse_observable(ZipWithIndexObservable(source=observable, selector=None))
+
+        sink = TObserver()
+        observable.observe(init_observer_info(sink))
+        self.source.on_next_list([1, 2])
+
+        # observing the fused observable again starts a new index
+        observable.observe(init_observer_info(sink))
+        self.source.on_next_list([3])
+
+        self.assertEqual([(1, 0), (2, 1), (3, 0)], sink.received)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_vectorized_stages(self):
+        observable = fuse_observable(MapObservable(source=self.source, func=np.negative))
+        observable = fuse_observable(FilterObservable(source=observable, predicate=np.signbit))
+        observable = fuse_observable(MapObservable(source=observable, func=lambda v: int(v) * 2))
+
+        sink = TObserver()
+        observable.observe(init_observer_info(sink))
+
+        self.source.on_next(np.array([1, -2, 3]))
+
+        self.assertEqual([-2, -6], sink.received)
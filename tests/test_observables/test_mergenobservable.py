@@ -0,0 +1,147 @@
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.mergenobservable import MergeNObservable
+from rxbp.testing.testcasebase import TestCaseBase
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+
+
+class TestMergeNObservable(TestCaseBase):
+    def setUp(self):
+        self.sources = [TObservable(), TObservable(), TObservable()]
+        self.exception = Exception('test')
+
+    def test_send_immediately(self):
+        sink = TObserver()
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        ack2 = self.sources[2].on_next_list([2])
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+
+    def test_buffer_on_async_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+
+        self.assertEqual([1], sink.received)
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_round_robin(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+        ack3 = self.sources[2].on_next_list([3])
+
+        sink.ack.on_next(continue_ack)
+
+        # source 1 sends its next batch before source 2 is served
+        self.sources[1].on_next_list([4])
+
+        sink.ack.on_next(continue_ack)
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2, 3, 4], sink.received)
+        self.assertIsInstance(ack3.value, ContinueAck)
+
+    def test_weighted(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources[:2], weights=[2, 1])
+        obs.observe(init_observer_info(sink))
+
+        self.sources[1].on_next_list([1])
+        self.sources[0].on_next_list([2])
+        ack = self.sources[1].on_next_list([3])
+
+        sink.ack.on_next(continue_ack)
+
+        # source 1 spent its weight in this round, source 0 did not
+        self.sources[0].on_next_list([4])
+
+        sink.ack.on_next(continue_ack)
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2, 4, 3], sink.received)
+        self.assertIsInstance(ack.value, ContinueAck)
+
+    def test_weighted_unequal_rates(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources[:2], weights=[2, 1])
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1])
+        self.sources[1].on_next_list([2])
+        self.sources[0].on_next_list([3])
+
+        sink.ack.on_next(continue_ack)
+
+        # the slow source 1 waits before the fast source 0 sends its next batch
+        self.sources[1].on_next_list([4])
+
+        sink.ack.on_next(continue_ack)
+        self.sources[0].on_next_list([5])
+
+        sink.ack.on_next(continue_ack)
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2, 3, 4, 5], sink.received)
+
+    def test_complete_after_buffered_batches(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1])
+        self.sources[1].on_next_list([2])
+        for source in self.sources:
+            source.on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        sink.ack.on_next(continue_ack)
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_stop_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+
+        sink.ack.on_next(stop_ack)
+
+        self.assertIsInstance(ack2.value, StopAck)
+        self.assertIsInstance(self.sources[2].on_next_list([3]), StopAck)
+
+    def test_on_error(self):
+        sink = TObserver(immediate_continue=0)
+        obs = MergeNObservable(self.sources)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+        self.sources[2].on_error(self.exception)
+
+        self.assertEqual(self.exception, sink.exception)
+        self.assertIsInstance(ack2.value, StopAck)
@@ -0,0 +1,150 @@
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observables.zipnobservable import ZipNObservable
+from rxbp.testing.testcasebase import TestCaseBase
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+from rxbp.utils.ndarrayutils import np
+
+
+class TestZipNObservable(TestCaseBase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.sources = [TObservable(), TObservable(), TObservable()]
+        self.exception = Exception('test')
+
+    def test_wait_on_all_sources(self):
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+        self.assertEqual([], sink.received)
+
+        ack3 = self.sources[2].on_next_list([3])
+
+        self.assertEqual([(1, 2, 3)], sink.received)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertIsInstance(ack3, ContinueAck)
+
+    def test_keep_remaining_elements(self):
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1, 2])
+        ack2 = self.sources[1].on_next_list([3])
+        ack3 = self.sources[2].on_next_list([5, 6])
+
+        self.assertEqual([(1, 3, 5)], sink.received)
+        self.assertFalse(ack1.has_value)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertFalse(ack3.has_value)
+
+        ack2 = self.sources[1].on_next_list([4])
+
+        self.assertEqual([(1, 3, 5), (2, 4, 6)], sink.received)
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertIsInstance(ack3.value, ContinueAck)
+
+    def test_acknowledge_all_sources_on_async_ack(self):
+        sink = TObserver(immediate_continue=0)
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+        ack3 = self.sources[2].on_next_list([3])
+
+        self.assertFalse(ack1.has_value)
+        self.assertFalse(ack2.has_value)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack1.value, ContinueAck)
+        self.assertIsInstance(ack2.value, ContinueAck)
+        self.assertIs(sink.ack, ack3)
+
+    def test_complete_when_source_has_no_remaining_elements(self):
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        self.sources[1].on_completed()
+
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack1.value, StopAck)
+
+    def test_complete_after_remaining_elements(self):
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next_list([1, 2])
+        self.sources[0].on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        self.sources[1].on_next_list([3])
+        self.sources[2].on_next_list([5])
+
+        self.assertFalse(sink.is_completed)
+
+        self.sources[1].on_next_list([4])
+        ack = self.sources[2].on_next_list([6])
+
+        self.assertEqual([(1, 3, 5), (2, 4, 6)], sink.received)
+        self.assertTrue(sink.is_completed)
+        self.assertIsInstance(ack, StopAck)
+
+    def test_on_error(self):
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        self.sources[1].on_error(self.exception)
+
+        self.assertEqual(self.exception, sink.exception)
+        self.assertIsInstance(ack1.value, StopAck)
+
+    def test_exception_while_zipping(self):
+        def gen():
+            raise self.exception
+            yield
+
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=[])
+        obs.observe(init_observer_info(sink))
+
+        ack1 = self.sources[0].on_next_list([1])
+        ack2 = self.sources[1].on_next_list([2])
+        self.sources[2].on_next_iter(gen())
+
+        self.assertIn('zipping the batches failed', str(sink.exception))
+        self.assertIsInstance(ack1.value, StopAck)
+        self.assertIsInstance(ack2.value, StopAck)
+
+    def test_ndarray_batches(self):
+        if np is None:
+            self.skipTest('numpy is not installed')
+
+        sink = TObserver()
+        obs = ZipNObservable(self.sources, stack=None)
+        obs.observe(init_observer_info(sink))
+
+        self.sources[0].on_next(np.array([1, 2]))
+        self.sources[1].on_next(np.array([3]))
+        self.sources[2].on_next(np.array([5, 6]))
+        self.sources[1].on_next(np.array([4]))
+
+        self.assertEqual([(1, 3, 5), (2, 4, 6)], sink.received)
@@ -2,6 +2,7 @@ from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.init.initobserverinfo import init_observer_info
 from rxbp.observablesubjects.cacheservefirstobservablesubject import CacheServeFirstObservableSubject
 from rxbp.observerinfo import ObserverInfo
+from rxbp.lagpolicy import BACKPRESSURE, DROP_OLDEST, DETACH
 from rxbp.testing.testcasebase import TestCaseBase
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
@@ -38,6 +39,128 @@ class TestCachedServeFirstSubject(TestCaseBase):
         self.assertEqual([1], observer.received)
         self.assertEqual(0, len(self.subject.shared_state.queue))
 
+    def test_buffer_follows_slowest_subscriber(self):
+        """
+        the buffer only keeps the elements not yet sent to the slowest subscriber
+        """
+
+        # preparation
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=1)
+        self.subject.observe(init_observer_info(o1))
+        self.subject.observe(init_observer_info(o2))
+
+        # state change
+        for value in range(5):
+            self.source.on_next_single(value)
+
+        # verification
+        self.assertEqual([0, 1, 2, 3, 4], o1.received)
+        self.assertEqual([0, 1], o2.received)
+        self.assertEqual(3, len(self.subject.shared_state.queue))
+
+        # state change
+        o2.immediate_continue = 10
+        o2.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        # verification
+        self.assertEqual([0, 1, 2, 3, 4], o2.received)
+        self.assertEqual(0, len(self.subject.shared_state.queue))
+
+    def test_back_pressure_lagging_subscriber(self):
+        """
+        the upstream is back-pressured while the slowest subscriber lags behind more than the maximum lag
+        """
+
+        # preparation
+        subject = CacheServeFirstObservableSubject(scheduler=self.scheduler, max_lag=2, lag_policy=BACKPRESSURE)
+        self.source.observe(init_observer_info(subject))
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        subject.observe(init_observer_info(o1))
+        subject.observe(init_observer_info(o2))
+
+        # state change
+        acks = [self.source.on_next_single(value) for value in range(4)]
+
+        # verification
+        self.assertIsInstance(acks[2], ContinueAck)
+        self.assertFalse(acks[3].has_value)
+        self.assertEqual(3, subject.get_lag_snapshot()['largest_lag'])
+
+        # state change
+        o2.immediate_continue = 1
+        o2.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        # verification
+        self.assertEqual([0, 1, 2], o2.received)
+        self.assertIsInstance(acks[3].value, ContinueAck)
+
+    def test_drop_old_for_lagging_subscriber(self):
+        """
+        the lagging subscriber skips the oldest elements exceeding the maximum lag
+        """
+
+        # preparation
+        subject = CacheServeFirstObservableSubject(scheduler=self.scheduler, max_lag=2, lag_policy=DROP_OLDEST)
+        self.source.observe(init_observer_info(subject))
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        subject.observe(init_observer_info(o1))
+        subject.observe(init_observer_info(o2))
+
+        # state change
+        acks = [self.source.on_next_single(value) for value in range(5)]
+
+        # verification
+        self.assertTrue(all(isinstance(ack, ContinueAck) for ack in acks))
+        self.assertEqual(2, len(subject.shared_state.queue))
+        self.assertEqual(
+            [{'lag': 0, 'dropped_batches': 0}, {'lag': 2, 'dropped_batches': 2}],
+            subject.get_lag_snapshot()['subscriptions'],
+        )
+
+        # state change
+        o2.immediate_continue = 10
+        o2.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        # verification
+        self.assertEqual([0, 1, 2, 3, 4], o1.received)
+        self.assertEqual([0, 3, 4], o2.received)
+
+    def test_detach_lagging_subscriber(self):
+        """
+        the lagging subscriber receives an error once it acknowledges the last element
+        """
+
+        # preparation
+        subject = CacheServeFirstObservableSubject(scheduler=self.scheduler, max_lag=2, lag_policy=DETACH)
+        self.source.observe(init_observer_info(subject))
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        subject.observe(init_observer_info(o1))
+        subject.observe(init_observer_info(o2))
+
+        # state change
+        acks = [self.source.on_next_single(value) for value in range(4)]
+
+        # verification
+        self.assertTrue(all(isinstance(ack, ContinueAck) for ack in acks))
+        self.assertEqual(0, len(subject.shared_state.queue))
+        self.assertEqual(1, subject.get_lag_snapshot()['n_detached'])
+
+        # state change
+        o2.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        # verification
+        self.assertEqual([0, 1, 2, 3], o1.received)
+        self.assertEqual([0], o2.received)
+        self.assertIsInstance(o2.exception, Exception)
+
     def test_on_completed(self):
         """
                on_completed
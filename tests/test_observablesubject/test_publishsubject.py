@@ -1,6 +1,8 @@
 import unittest
 
-from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.countdownack import CountdownAck
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
 from rxbp.init.initobserverinfo import init_observer_info
 from rxbp.observablesubjects.publishobservablesubject import PublishObservableSubject
 from rxbp.observerinfo import ObserverInfo
@@ -129,3 +131,50 @@ class TestPublishSubject(unittest.TestCase):
         self.scheduler.advance_by(1)
         d.dispose()
         self.assertListEqual(o1.received, [1])
+
+    def test_aggregate_asynchronous_acknowledgments(self):
+        subject = PublishObservableSubject()
+        s1 = TObservable()
+        s1.observe(init_observer_info(subject))
+
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        o3 = TObserver(immediate_continue=0)
+        for observer in [o1, o2, o3]:
+            subject.observe(init_observer_info(observer))
+
+        ack = s1.on_next_single(1)
+
+        self.assertIsInstance(ack, CountdownAck)
+        self.assertFalse(ack.has_value)
+
+        o2.ack.on_next(continue_ack)
+
+        self.assertFalse(ack.has_value)
+
+        o3.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack.value, ContinueAck)
+
+    def test_stop_acknowledgment_removes_subscriber(self):
+        subject = PublishObservableSubject()
+        s1 = TObservable()
+        s1.observe(init_observer_info(subject))
+
+        o1 = TObserver(immediate_continue=0)
+        o2 = TObserver(immediate_continue=0)
+        for observer in [o1, o2]:
+            subject.observe(init_observer_info(observer))
+
+        ack = s1.on_next_single(1)
+        o1.ack.on_next(stop_ack)
+        o2.ack.on_next(continue_ack)
+
+        self.assertIsInstance(ack.value, ContinueAck)
+
+        ack = s1.on_next_single(2)
+        o2.ack.on_next(stop_ack)
+
+        self.assertEqual([1], o1.received)
+        self.assertEqual([1, 2], o2.received)
+        self.assertIsInstance(ack.value, StopAck)
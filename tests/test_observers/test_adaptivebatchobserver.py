@@ -0,0 +1,122 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.adaptivebatchsize import AdaptiveBatchSize
+from rxbp.observers.adaptivebatchobserver import AdaptiveBatchObserver
+from rxbp.observers.bufferedobserver import BufferedObserver
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestAdaptiveBatchObserver(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.batch_size = AdaptiveBatchSize(min_size=1, max_size=4, max_linger=1.0)
+
+    def test_grow_batch_size_on_fast_arrival(self):
+        sink = TObserver()
+        observer = AdaptiveBatchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            batch_size=self.batch_size,
+        )
+
+        for i in range(7):
+            observer.on_next(i)
+
+        self.assertEqual(list(range(7)), sink.received)
+        self.assertEqual(3, sink.on_next_counter)
+        self.assertEqual(4, observer.current_size)
+
+    def test_upper_bound(self):
+        sink = TObserver()
+        observer = AdaptiveBatchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            batch_size=self.batch_size,
+        )
+
+        for i in range(20):
+            observer.on_next(i)
+
+        self.assertEqual(4, observer.current_size)
+
+    def test_shrink_batch_size_after_linger_time(self):
+        sink = TObserver()
+        observer = AdaptiveBatchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            batch_size=self.batch_size,
+        )
+        observer.on_next(0)
+        observer.on_next(1)
+
+        self.assertEqual([0], sink.received)
+
+        self.scheduler.advance_by(1.0)
+
+        self.assertEqual([0, 1], sink.received)
+        self.assertEqual(1, observer.current_size)
+
+    def test_grow_batch_size_on_pending_ack(self):
+        sink = TObserver(immediate_continue=0)
+        observer = AdaptiveBatchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            batch_size=AdaptiveBatchSize(min_size=2, max_size=8, max_linger=1.0),
+        )
+        observer.on_next(0)
+        self.scheduler.advance_by(1.0)
+
+        self.assertEqual(2, observer.current_size)
+
+        observer.on_next(1)
+        self.scheduler.advance_by(1.0)
+
+        self.assertEqual(4, observer.current_size)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertFalse(observer.is_ack_pending)
+
+    def test_flush_on_completed(self):
+        sink = TObserver()
+        observer = AdaptiveBatchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            batch_size=AdaptiveBatchSize(min_size=4, max_size=8, max_linger=1.0),
+        )
+        observer.on_next(0)
+        observer.on_completed()
+
+        self.assertEqual([0], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_grow_batch_size_on_backlog(self):
+        """
+        an unbounded buffer acknowledges immediately, the batch size grows
+        because the slow consumer did not process the previous batch yet
+        """
+
+        sink = TObserver(immediate_continue=0)
+        buffered_observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=None,
+        )
+        observer = AdaptiveBatchObserver(
+            observer=buffered_observer,
+            scheduler=self.scheduler,
+            batch_size=AdaptiveBatchSize(min_size=2, max_size=8, max_linger=1.0),
+            get_backlog=lambda: buffered_observer.backlog,
+        )
+
+        # elements arrive too slowly to grow the batch size by themselves
+        for i in range(6):
+            observer.on_next(i)
+            self.scheduler.advance_by(0.6)
+
+        self.assertEqual([0, 1], sink.received)
+        self.assertEqual(2, buffered_observer.backlog)
+        self.assertEqual(4, observer.current_size)
@@ -98,3 +98,58 @@ class TestBackpressureBufferedObserver(unittest.TestCase):
 
         self.assertFalse(ack.is_sync)
         self.assertEqual([0, 1], sink.received)
+
+    def test_drain_large_buffer(self):
+        sink = TObserver()
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=100,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        for i in range(50):
+            self.source.on_next_single(i)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual(list(range(50)), sink.received)
+
+    def test_wait_on_asynchronous_ack_of_last_batch(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=10,
+        )
+        self.source.observe(init_observer_info(observer))
+        self.source.on_next_single(0)
+        self.scheduler.advance_by(1)
+
+        self.source.on_next_single(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0], sink.received)
+
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0, 1], sink.received)
+
+    def test_fast_path_on_consumer_thread(self):
+        sink = TObserver()
+        observer = BufferedObserver(
+            underlying=sink,
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+            buffer_size=10,
+        )
+        self.source.observe(init_observer_info(observer))
+        self.source.on_next_single(0)
+        self.scheduler.advance_by(1)
+
+        ack = self.source.on_next_single(1)
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([0, 1], sink.received)
@@ -0,0 +1,120 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.batchobserver import BatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+from rxbp.utils.ndarrayutils import np
+
+
+class TestBatchObserver(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.source = TObservable()
+
+    def test_coalesce_small_batches(self):
+        sink = TObserver()
+        observer = BatchObserver(
+            observer=sink,
+            max_size=3,
+            max_delay=None,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1])
+        self.source.on_next_list([2])
+
+        self.assertEqual([], sink.received)
+
+        self.source.on_next_list([3, 4])
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertEqual(1, sink.on_next_counter)
+
+    def test_split_large_batch(self):
+        sink = TObserver()
+        observer = BatchObserver(
+            observer=sink,
+            max_size=2,
+            max_delay=None,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2, 3, 4, 5])
+
+        self.assertEqual([1, 2, 3, 4], sink.received)
+        self.assertEqual(2, sink.on_next_counter)
+
+    def test_flush_after_max_delay(self):
+        sink = TObserver()
+        observer = BatchObserver(
+            observer=sink,
+            max_size=3,
+            max_delay=1.0,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1])
+        self.scheduler.advance_by(0.5)
+        self.source.on_next_list([2])
+
+        self.assertEqual([], sink.received)
+
+        self.scheduler.advance_by(0.5)
+
+        self.assertEqual([1, 2], sink.received)
+
+    def test_wait_on_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = BatchObserver(
+            observer=sink,
+            max_size=1,
+            max_delay=None,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2])
+
+        self.assertEqual([1], sink.received)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2], sink.received)
+
+    def test_flush_on_completed(self):
+        sink = TObserver()
+        observer = BatchObserver(
+            observer=sink,
+            max_size=3,
+            max_delay=None,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1])
+        self.source.on_completed()
+
+        self.assertEqual([1], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batches(self):
+        sink = TObserver()
+        observer = BatchObserver(
+            observer=sink,
+            max_size=3,
+            max_delay=None,
+            scheduler=self.scheduler,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next(np.array([1, 2]))
+        self.source.on_next(np.array([3, 4]))
+
+        self.assertEqual([1, 2, 3], sink.received)
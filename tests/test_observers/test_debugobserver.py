@@ -0,0 +1,131 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.debugobserver import DebugObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+from rxbp.utils.operatorprofiler import OperatorProfiler
+
+
+class TestDebugObserver(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.source = TObservable()
+        self.received = []
+        self.acks = []
+
+    def _create_observer(self, sink, **kwargs):
+        return DebugObserver(
+            source=sink,
+            name='d1',
+            on_next_func=self.received.append,
+            on_completed_func=lambda: None,
+            on_error_func=lambda exc: None,
+            on_sync_ack=self.acks.append,
+            on_async_ack=self.acks.append,
+            on_raw_ack=lambda ack: None,
+            stack=[],
+            **kwargs,
+        )
+
+    def test_on_next(self):
+        sink = TObserver()
+        observer = self._create_observer(sink)
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_list([3])
+
+        self.assertEqual([1, 2, 3], self.received)
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertEqual(2, len(self.acks))
+
+    def test_sample_every(self):
+        sink = TObserver()
+        observer = self._create_observer(sink, sample_every=2)
+        self.source.observe(init_observer_info(observer))
+
+        for value in range(5):
+            self.source.on_next_single(value)
+
+        self.assertEqual([0, 2, 4], self.received)
+        self.assertEqual([0, 1, 2, 3, 4], sink.received)
+        self.assertEqual(3, len(self.acks))
+
+    def test_sample_probability(self):
+        sink = TObserver()
+        observer = self._create_observer(sink, sample_probability=0.0)
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_iter(iter([1, 2]))
+
+        self.assertEqual([], self.received)
+        self.assertEqual([1, 2], sink.received)
+
+    def test_profiler(self):
+        profiler = OperatorProfiler()
+        sink = TObserver(immediate_continue=0)
+        observer = self._create_observer(sink, stats=profiler.get_stats('d1'))
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2, 3])
+        sink.ack.on_next(continue_ack)
+
+        snapshot = profiler.snapshot()['d1']
+        self.assertEqual(1, snapshot['n_batches'])
+        self.assertEqual(3, snapshot['n_elements'])
+        self.assertEqual(1, snapshot['n_async_acks'])
+        self.assertEqual({3: 1}, snapshot['batch_size']['buckets'])
+        self.assertEqual(1, snapshot['ack_wait_time']['count'])
+
+    def test_profiler_with_sampling(self):
+        profiler = OperatorProfiler()
+        sink = TObserver()
+        observer = self._create_observer(sink, sample_every=2, stats=profiler.get_stats('d1'))
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_iter(iter([3, 4, 5]))
+        self.source.on_next_list([6])
+
+        snapshot = profiler.snapshot()['d1']
+        self.assertEqual([1, 2, 6], self.received)
+        self.assertEqual([1, 2, 3, 4, 5, 6], sink.received)
+        self.assertEqual(3, snapshot['n_batches'])
+        self.assertEqual(3, snapshot['n_elements'])
+        self.assertEqual(1, snapshot['n_unsized_batches'])
+        self.assertEqual(2, snapshot['on_next_time']['count'])
+
+    def test_profiler_counts_empty_batches(self):
+        profiler = OperatorProfiler()
+        sink = TObserver()
+        observer = self._create_observer(sink, sample_every=2, stats=profiler.get_stats('d1'))
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([])
+        self.source.on_next_list([])
+
+        snapshot = profiler.snapshot()['d1']
+        self.assertEqual(2, snapshot['n_batches'])
+        self.assertEqual({0: 2}, snapshot['batch_size']['buckets'])
+
+    def test_profiler_exception_in_unsampled_batch(self):
+        exception = Exception('test')
+
+        def gen():
+            raise exception
+            yield
+
+        sink = TObserver()
+        observer = self._create_observer(
+            sink,
+            sample_probability=0.0,
+            stats=OperatorProfiler().get_stats('d1'),
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_iter(gen())
+
+        self.assertEqual(exception, sink.exception)
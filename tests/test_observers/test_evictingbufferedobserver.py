@@ -1,6 +1,6 @@
 from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
 from rxbp.observers.evictingbufferedobserver import EvictingBufferedObserver
-from rxbp.overflowstrategy import DropOld
+from rxbp.overflowstrategy import DropOld, ClearBuffer
 from rxbp.testing.testcasebase import TestCaseBase
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
@@ -42,3 +42,51 @@ class TestEvictingBufferedObserver(TestCaseBase):
         self.scheduler.advance_by(1)
 
         self.assertEqual(self.sink.received, [2, 3])
+
+    def test_count_dropped_batches(self):
+        s: TScheduler = self.scheduler
+
+        strategy = DropOld(2)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        for i in range(5):
+            s1.on_next_single(i)
+
+        self.assertEqual(3, evicting_obs.dropped_batches)
+        self.assertEqual(3, evicting_obs.dropped_elements)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([3], self.sink.received)
+
+    def test_count_dropped_elements(self):
+        s: TScheduler = self.scheduler
+
+        strategy = DropOld(1)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        s1.on_next_list([1, 2, 3])
+        s1.on_next_iter(iter([4, 5]))
+        s1.on_next_list([6])
+
+        self.assertEqual(2, evicting_obs.dropped_batches)
+        self.assertEqual(5, evicting_obs.dropped_elements)
+
+    def test_clear_buffer(self):
+        s: TScheduler = self.scheduler
+
+        strategy = ClearBuffer(2)
+        evicting_obs = EvictingBufferedObserver(self.sink, scheduler=s, strategy=strategy, subscribe_scheduler=s)
+        s1 = TObservable(observer=evicting_obs)
+
+        for i in range(3):
+            s1.on_next_single(i)
+
+        self.assertEqual(2, evicting_obs.dropped_batches)
+        self.assertEqual(2, evicting_obs.dropped_elements)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2], self.sink.received)
@@ -0,0 +1,80 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.filterbatchobserver import FilterBatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.utils.ndarrayutils import np
+
+
+class TestFilterBatchObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.exc = Exception()
+
+    def test_on_error(self):
+        sink = TObserver()
+        observer = FilterBatchObserver(
+            observer=sink,
+            predicate=lambda batch: [v > 0 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_error(self.exc)
+
+        self.assertEqual(self.exc, sink.exception)
+
+    def test_single_batch(self):
+        sink = TObserver()
+        observer = FilterBatchObserver(
+            observer=sink,
+            predicate=lambda batch: [v > 0 for v in batch],
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_iter([0, 1, 0, 2])
+
+        self.assertEqual([1, 2], sink.received)
+
+    def test_empty_result_is_not_sent(self):
+        sink = TObserver()
+        observer = FilterBatchObserver(
+            observer=sink,
+            predicate=lambda batch: [False for _ in batch],
+        )
+        self.source.observe(init_observer_info(observer))
+
+        ack = self.source.on_next_list([0, 1])
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual(0, sink.on_next_counter)
+
+    def test_exception_in_predicate(self):
+        sink = TObserver()
+
+        def predicate(_):
+            raise self.exc
+
+        observer = FilterBatchObserver(
+            observer=sink,
+            predicate=predicate,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([0, 1])
+
+        self.assertEqual(self.exc, sink.exception)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batch(self):
+        sink = TObserver()
+        observer = FilterBatchObserver(
+            observer=sink,
+            predicate=lambda batch: batch > 0,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next(np.array([0, 1, 0, 2]))
+
+        self.assertEqual([1, 2], sink.received)
@@ -5,6 +5,7 @@ from rxbp.observers.filterobserver import FilterObserver
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
 from rxbp.testing.tscheduler import TScheduler
+from rxbp.utils.ndarrayutils import np
 
 
 class TestFilterObserver(unittest.TestCase):
@@ -92,3 +93,16 @@ class TestFilterObserver(unittest.TestCase):
         self.source.on_next_list([0, 2])
 
         self.assertEqual([1, 2], sink.received)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batch_with_ufunc(self):
+        sink = TObserver()
+        observer = FilterObserver(
+            observer=sink,
+            predicate=np.isfinite,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next(np.array([1.0, np.inf, 2.0]))
+
+        self.assertEqual([1.0, 2.0], sink.received)
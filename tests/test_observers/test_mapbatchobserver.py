@@ -0,0 +1,74 @@
+import unittest
+
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.mapbatchobserver import MapBatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.utils.ndarrayutils import np
+
+
+class TestMapBatchObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.exc = Exception()
+
+    def test_on_completed(self):
+        sink = TObserver()
+        observer = MapBatchObserver(
+            observer=sink,
+            func=lambda batch: batch,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_completed()
+
+        self.assertTrue(sink.is_completed)
+
+    def test_function_receives_whole_batch(self):
+        sink = TObserver()
+        received_batches = []
+
+        def func(batch):
+            received_batches.append(batch)
+            return [sum(batch)]
+
+        observer = MapBatchObserver(
+            observer=sink,
+            func=func,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_iter([1, 2, 3])
+        self.source.on_next_list([4])
+
+        self.assertEqual([[1, 2, 3], [4]], received_batches)
+        self.assertEqual([6, 4], sink.received)
+
+    def test_exception_in_function(self):
+        sink = TObserver()
+
+        def func(_):
+            raise self.exc
+
+        observer = MapBatchObserver(
+            observer=sink,
+            func=func,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1])
+
+        self.assertEqual(self.exc, sink.exception)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batch(self):
+        sink = TObserver()
+        observer = MapBatchObserver(
+            observer=sink,
+            func=lambda batch: batch * 2,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next(np.array([1, 2]))
+
+        self.assertEqual([2, 4], sink.received)
@@ -0,0 +1,174 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.mapparallelobserver import MapParallelObserver
+from rxbp.testing.texecutor import TExecutor
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestMapParallelObserver(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.executor = TExecutor()
+        self.source = TObservable()
+        self.exc = Exception()
+
+    def _observe(self, sink: TObserver, max_in_flight: int = 2, func=lambda v: v + 1, is_ordered: bool = True):
+        observer = MapParallelObserver(
+            observer=sink,
+            func=func,
+            executor=self.executor,
+            max_in_flight=max_in_flight,
+            scheduler=self.scheduler,
+            is_ordered=is_ordered,
+        )
+        self.source.observe(init_observer_info(observer))
+        return observer
+
+    def test_emit_in_order(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_iter([3])
+
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([], sink.received)
+
+        self.executor.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2, 3, 4], sink.received)
+
+    def test_back_pressure_while_window_is_full(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        ack1 = self.source.on_next_list([1])
+        ack2 = self.source.on_next_list([2])
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+        self.executor.run()
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(ack2.has_value)
+        self.assertEqual([2], sink.received)
+
+    def test_wait_on_downstream_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        self._observe(sink)
+
+        self.source.on_next_list([1])
+        self.source.on_next_list([2])
+        self.executor.run_all()
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2], sink.received)
+
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2, 3], sink.received)
+
+    def test_complete_after_in_flight_batches(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        self.source.on_next_list([1])
+        self.source.on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        self.executor.run()
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([2], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_exception_in_function(self):
+        sink = TObserver()
+
+        def func(_):
+            raise self.exc
+
+        self._observe(sink, func=func)
+
+        self.source.on_next_list([1])
+        self.executor.run()
+        self.scheduler.advance_by(1)
+
+        self.assertEqual(self.exc, sink.exception)
+
+    def test_exception_in_function_while_window_is_full(self):
+        sink = TObserver()
+
+        def func(_):
+            raise self.exc
+
+        self._observe(sink, func=func)
+
+        self.source.on_next_list([1])
+        ack = self.source.on_next_list([2])
+        self.executor.run()
+        self.scheduler.advance_by(1)
+
+        self.assertEqual(self.exc, sink.exception)
+        self.assertIsInstance(ack.value, StopAck)
+
+    def test_unordered_emit_on_completion(self):
+        sink = TObserver()
+        self._observe(sink, is_ordered=False)
+
+        self.source.on_next_list([1, 2])
+        self.source.on_next_iter([3])
+
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([4], sink.received)
+
+        self.executor.run(0)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([4, 2, 3], sink.received)
+
+    def test_unordered_back_pressure_while_window_is_full(self):
+        sink = TObserver()
+        self._observe(sink, is_ordered=False)
+
+        self.source.on_next_list([1])
+        ack = self.source.on_next_list([2])
+
+        self.assertFalse(ack.has_value)
+
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertTrue(ack.has_value)
+        self.assertEqual([3], sink.received)
+
+    def test_unordered_complete_after_in_flight_batches(self):
+        sink = TObserver()
+        self._observe(sink, is_ordered=False)
+
+        self.source.on_next_list([1])
+        self.source.on_next_list([2])
+        self.source.on_completed()
+        self.executor.run(1)
+        self.scheduler.advance_by(1)
+
+        self.assertFalse(sink.is_completed)
+
+        self.executor.run()
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([3, 2], sink.received)
+        self.assertTrue(sink.is_completed)
@@ -0,0 +1,104 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import ContinueAck, continue_ack
+from rxbp.acknowledgement.stopack import StopAck, stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.prefetchobserver import PrefetchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestPrefetchObserver(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = TScheduler()
+        self.source = TObservable()
+        self.exc = Exception()
+
+    def _observe(self, sink: TObserver, prefetch: int = 3, replenish: int = 2):
+        observer = PrefetchObserver(
+            observer=sink,
+            scheduler=self.scheduler,
+            prefetch=prefetch,
+            replenish=replenish,
+        )
+        self.source.observe(init_observer_info(observer))
+        return observer
+
+    def test_send_on_scheduler(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        ack = self.source.on_next_iter([1, 2])
+
+        self.assertIsInstance(ack, ContinueAck)
+        self.assertEqual([], sink.received)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 2], sink.received)
+
+    def test_back_pressure_without_credits(self):
+        sink = TObserver(immediate_continue=0)
+        self._observe(sink)
+
+        ack1 = self.source.on_next_list([1])
+        ack2 = self.source.on_next_list([2])
+        ack3 = self.source.on_next_list([3])
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertIsInstance(ack2, ContinueAck)
+        self.assertFalse(ack3.has_value)
+
+        self.scheduler.advance_by(1)
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        # credits are returned only after `replenish` acknowledged batches
+        self.assertEqual([1, 2], sink.received)
+        self.assertFalse(ack3.has_value)
+
+        sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertIsInstance(ack3.value, ContinueAck)
+
+    def test_complete_after_queued_batches(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        self.source.on_next_list([1])
+        self.source.on_next_list([2])
+        self.source.on_completed()
+
+        self.assertFalse(sink.is_completed)
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_stop_ack(self):
+        sink = TObserver(immediate_continue=0)
+        self._observe(sink, prefetch=2)
+
+        self.source.on_next_list([1])
+        ack = self.source.on_next_list([2])
+        self.scheduler.advance_by(1)
+
+        sink.ack.on_next(stop_ack)
+
+        self.assertIsInstance(ack.value, StopAck)
+        self.assertEqual([1], sink.received)
+
+    def test_on_error(self):
+        sink = TObserver()
+        self._observe(sink)
+
+        self.source.on_next_list([1])
+        self.source.on_error(self.exc)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual(self.exc, sink.exception)
+        self.assertEqual([], sink.received)
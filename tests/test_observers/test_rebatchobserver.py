@@ -0,0 +1,105 @@
+import unittest
+
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.acknowledgement.stopack import stop_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.observers.rebatchobserver import RebatchObserver
+from rxbp.testing.tobservable import TObservable
+from rxbp.testing.tobserver import TObserver
+from rxbp.utils.ndarrayutils import np
+
+
+class TestRebatchObserver(unittest.TestCase):
+    def setUp(self):
+        self.source = TObservable()
+        self.exc = Exception()
+
+    def test_small_batch_is_passed_through(self):
+        sink = TObserver()
+        observer = RebatchObserver(observer=sink, size=3)
+        self.source.observe(init_observer_info(observer))
+
+        ack = self.source.on_next_list([1, 2])
+
+        self.assertEqual([1, 2], sink.received)
+        self.assertEqual(1, sink.on_next_counter)
+        self.assertIsInstance(ack, type(continue_ack))
+
+    def test_split_list(self):
+        sink = TObserver()
+        observer = RebatchObserver(observer=sink, size=2)
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_list([1, 2, 3, 4, 5])
+
+        self.assertEqual([1, 2, 3, 4, 5], sink.received)
+        self.assertEqual(3, sink.on_next_counter)
+
+    def test_split_iterator(self):
+        sink = TObserver()
+        observer = RebatchObserver(observer=sink, size=2)
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next_iter([1, 2, 3])
+
+        self.assertEqual([1, 2, 3], sink.received)
+        self.assertEqual(2, sink.on_next_counter)
+
+    def test_wait_on_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = RebatchObserver(observer=sink, size=1)
+        self.source.observe(init_observer_info(observer))
+
+        ack = self.source.on_next_list([1, 2])
+
+        self.assertEqual([1], sink.received)
+        self.assertFalse(ack.is_sync)
+
+        sink.ack.on_next(continue_ack)
+
+        self.assertEqual([1, 2], sink.received)
+
+    def test_stop_acknowledgment(self):
+        sink = TObserver(immediate_continue=0)
+        observer = RebatchObserver(observer=sink, size=1)
+        self.source.observe(init_observer_info(observer))
+
+        ack = self.source.on_next_list([1, 2])
+        sink.ack.on_next(stop_ack)
+
+        self.assertEqual([1], sink.received)
+        self.assertTrue(ack.has_value)
+        self.assertIsInstance(ack.value, type(stop_ack))
+
+    def test_exception_in_iterator(self):
+        sink = TObserver()
+        observer = RebatchObserver(observer=sink, size=1)
+        self.source.observe(init_observer_info(observer))
+
+        def gen():
+            yield 1
+            raise self.exc
+
+        self.source.on_next(gen())
+
+        self.assertEqual([1], sink.received)
+        self.assertEqual(self.exc, sink.exception)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_split_ndarray_into_views(self):
+        received = []
+
+        class RecordObserver(TObserver):
+            def on_next(self, elem):
+                received.append(elem)
+                return super().on_next(elem)
+
+        sink = RecordObserver()
+        observer = RebatchObserver(observer=sink, size=2)
+        self.source.observe(init_observer_info(observer))
+
+        batch = np.arange(5)
+        self.source.on_next(batch)
+
+        self.assertEqual([0, 1, 2, 3, 4], sink.received)
+        self.assertTrue(all(np.shares_memory(chunk, batch) for chunk in received))
@@ -6,6 +6,7 @@ from rxbp.observers.pairwiseobserver import PairwiseObserver
 from rxbp.observers.scanobserver import ScanObserver
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
+from rxbp.utils.ndarrayutils import np
 
 
 class TestScanObserver(unittest.TestCase):
@@ -118,3 +119,18 @@ class TestScanObserver(unittest.TestCase):
         self.source.on_next_list([3, 4])
 
         self.assertEqual([1, 3, 6, 10], sink.received)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batches_with_ufunc(self):
+        sink = TObserver()
+        obs = ScanObserver(
+            observer=sink,
+            func=np.add,
+            initial=10,
+        )
+        self.source.observe(init_observer_info(observer=obs))
+
+        self.source.on_next(np.array([1, 2]))
+        self.source.on_next(np.array([3]))
+
+        self.assertEqual([11, 13, 16], sink.received)
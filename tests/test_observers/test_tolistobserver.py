@@ -11,6 +11,7 @@ from rxbp.observers.tolistobserver import ToListObserver
 from rxbp.testing.tobservable import TObservable
 from rxbp.testing.tobserver import TObserver
 from rxbp.testing.tscheduler import TScheduler
+from rxbp.utils.ndarrayutils import np
 
 
 class TestToListObserver(unittest.TestCase):
@@ -83,3 +84,18 @@ class TestToListObserver(unittest.TestCase):
 
         self.assertEqual([[0, 1, 2, 3]], sink.received)
         self.assertTrue(sink.is_completed)
+
+    @unittest.skipIf(np is None, 'numpy is not installed')
+    def test_ndarray_batches(self):
+        sink = TObserver()
+        observer = ToListObserver(
+            observer=sink,
+        )
+        self.source.observe(init_observer_info(observer))
+
+        self.source.on_next(np.array([0, 1]))
+        self.source.on_next(np.array([2]))
+        self.source.on_completed()
+
+        self.assertIsInstance(sink.received[0], np.ndarray)
+        self.assertEqual([0, 1, 2], list(sink.received[0]))
@@ -4,7 +4,9 @@ import rxbp
 from rxbp.init.initflowable import init_flowable
 from rxbp.init.initsubscriber import init_subscriber
 from rxbp.indexed.selectors.bases.objectrefbase import ObjectRefBase
+from rxbp.observables.debugobservable import DebugObservable
 from rxbp.testing.testflowable import TestFlowable
+from rxbp.testing.texecutor import TExecutor
 from rxbp.testing.tscheduler import TScheduler
 
 
@@ -17,6 +19,11 @@ class TestOperators(unittest.TestCase):
         self.right = TestFlowable(base=self.right_base)
         self.subscriber = init_subscriber(self.scheduler, self.scheduler)
 
+    def test_batch(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.batch(10, max_delay=1.0)
+        ).unsafe_subscribe(self.subscriber)
+
     def test_buffer(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.buffer(10)
@@ -45,6 +52,45 @@ class TestOperators(unittest.TestCase):
             rxbp.op.debug('d1'),
         ).unsafe_subscribe(self.subscriber)
 
+    def test_debug_disabled(self):
+        rxbp.set_debug_enabled(False)
+
+        try:
+            subscription = init_flowable(self.left).pipe(
+                rxbp.op.debug('d1'),
+            ).unsafe_subscribe(self.subscriber)
+
+        finally:
+            rxbp.set_debug_enabled(True)
+
+        self.assertNotIsInstance(subscription.observable, DebugObservable)
+
+    def test_debug_base_disabled(self):
+        rxbp.set_debug_enabled(False)
+
+        try:
+            subscription = rxbp.indexed.range(3).pipe(
+                rxbp.op.filter(lambda v: v % 2 == 0),
+                rxbp.indexed.op.debug_base(base=3),
+            ).unsafe_subscribe(self.subscriber)
+
+        finally:
+            rxbp.set_debug_enabled(True)
+
+        for selector in subscription.index.selectors.values():
+            self.assertNotIsInstance(selector, DebugObservable)
+
+    def test_debug_invalid_sampling(self):
+        with self.assertRaises(AssertionError):
+            init_flowable(self.left).pipe(
+                rxbp.op.debug('d1', sample_every=0),
+            )
+
+        with self.assertRaises(AssertionError):
+            init_flowable(self.left).pipe(
+                rxbp.op.debug('d1', sample_probability=1.5),
+            )
+
     def test_default_if_empty(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.default_if_empty(lazy_val=lambda: 5),
@@ -65,6 +111,11 @@ class TestOperators(unittest.TestCase):
             rxbp.op.filter(lambda v: True)
         ).unsafe_subscribe(self.subscriber)
 
+    def test_filter_batch(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.filter_batch(lambda batch: [True for _ in batch])
+        ).unsafe_subscribe(self.subscriber)
+
     def test_first(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.first()
@@ -80,6 +131,21 @@ class TestOperators(unittest.TestCase):
             rxbp.op.flat_map(lambda _: init_flowable(self.right))
         ).unsafe_subscribe(self.subscriber)
 
+    def test_map_batch(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.map_batch(lambda batch: batch)
+        ).unsafe_subscribe(self.subscriber)
+
+    def test_map_parallel(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.map_parallel(lambda v: v, executor=TExecutor())
+        ).unsafe_subscribe(self.subscriber)
+
+    def test_map_parallel_unordered(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.map_parallel_unordered(lambda v: v, executor=TExecutor())
+        ).unsafe_subscribe(self.subscriber)
+
     def test_map_to_iterator(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.map_to_iterator(lambda _: [1, 2, 3])
@@ -96,4 +162,14 @@ class TestOperators(unittest.TestCase):
     def test_merge(self):
         subscription = init_flowable(self.left).pipe(
             rxbp.op.merge(init_flowable(self.right))
-        ).unsafe_subscribe(self.subscriber)
\ No newline at end of file
+        ).unsafe_subscribe(self.subscriber)
+
+    def test_prefetch(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.prefetch(4)
+        ).unsafe_subscribe(self.subscriber)
+
+    def test_rebatch(self):
+        subscription = init_flowable(self.left).pipe(
+            rxbp.op.rebatch(10)
+        ).unsafe_subscribe(self.subscriber)
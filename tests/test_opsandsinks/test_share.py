@@ -0,0 +1,57 @@
+import unittest
+
+from rxbp.init.initflowable import init_flowable
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.lagmetrics import LagMetrics
+from rxbp.lagpolicy import DROP_OLDEST
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+from rxbp.testing.testflowable import TestFlowable
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestShare(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.subscribe_scheduler = TrampolineScheduler()
+        self.subscriber = init_subscriber(self.scheduler, self.subscribe_scheduler)
+        self.source = TestFlowable()
+
+    def _observe(self, shared, *observers):
+        subscriptions = [shared.unsafe_subscribe(self.subscriber) for _ in observers]
+
+        def action(_, __):
+            for subscription, observer in zip(subscriptions, observers):
+                subscription.observable.observe(init_observer_info(observer))
+
+        self.subscribe_scheduler.schedule(action)
+
+    def test_lag_metrics(self):
+        lag_metrics = LagMetrics()
+        shared = init_flowable(self.source).share(
+            max_lag=2,
+            lag_policy=DROP_OLDEST,
+            lag_metrics=lag_metrics,
+        )
+
+        self.assertEqual([], lag_metrics.snapshot()['subscriptions'])
+
+        o1 = TObserver()
+        o2 = TObserver(immediate_continue=0)
+        self._observe(shared, o1, o2)
+
+        for value in range(5):
+            self.source.on_next_single(value)
+
+        snapshot = lag_metrics.snapshot()
+        self.assertEqual(
+            [{'lag': 0, 'dropped_batches': 0}, {'lag': 2, 'dropped_batches': 2}],
+            snapshot['subscriptions'],
+        )
+        self.assertEqual(3, snapshot['largest_lag'])
+        self.assertEqual([0, 1, 2, 3, 4], o1.received)
+
+    def test_lag_policy_requires_max_lag(self):
+        with self.assertRaises(AssertionError):
+            init_flowable(self.source).share(lag_policy=DROP_OLDEST)
@@ -0,0 +1,86 @@
+import asyncio
+import unittest
+
+import rxbp
+from rxbp.toasynciterator import to_async_iterator
+
+
+class TestToAsyncIterator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self) -> None:
+        self.loop.close()
+
+    def test_async_for(self):
+        async def consume():
+            return [value async for value in rxbp.to_async_iterator(rxbp.range(100, batch_size=7))]
+
+        result = self.loop.run_until_complete(consume())
+
+        self.assertEqual(list(range(100)), result)
+
+    def test_batched(self):
+        async def consume():
+            iterator = to_async_iterator(rxbp.from_list([1, 2, 3], batch_size=2), batched=True)
+            return [list(batch) async for batch in iterator]
+
+        result = self.loop.run_until_complete(consume())
+
+        self.assertEqual([[1, 2], [3]], result)
+
+    def test_raise_exception(self):
+        def func(value):
+            if value == 2:
+                raise Exception('test')
+            return value
+
+        async def consume():
+            result = []
+            try:
+                async for value in to_async_iterator(rxbp.range(5, batch_size=1).pipe(rxbp.op.map(func))):
+                    result.append(value)
+            except Exception:
+                pass
+
+            return result
+
+        result = self.loop.run_until_complete(consume())
+
+        self.assertEqual([0, 1], result)
+
+    def test_async_source(self):
+        async def gen():
+            for value in range(3):
+                await asyncio.sleep(0)
+                yield value
+
+        async def consume():
+            source = rxbp.from_async_iterable(gen())
+            return [value async for value in to_async_iterator(source, buffer_size=1)]
+
+        result = self.loop.run_until_complete(consume())
+
+        self.assertEqual([0, 1, 2], result)
+
+    def test_stop_source_on_break(self):
+        is_closed = []
+
+        async def gen():
+            try:
+                for value in range(10):
+                    yield value
+            finally:
+                is_closed.append(True)
+
+        async def consume():
+            iterator = to_async_iterator(rxbp.from_async_iterable(gen()), buffer_size=1)
+            async for value in iterator:
+                if value == 1:
+                    break
+            await iterator.aclose()
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(consume())
+
+        self.assertTrue(is_closed)
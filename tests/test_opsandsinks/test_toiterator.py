@@ -1,3 +1,5 @@
+import threading
+import time
 import unittest
 
 from rxbp.acknowledgement.continueack import ContinueAck
@@ -41,3 +43,64 @@ class TestToIterator(unittest.TestCase):
         val = next(iterator)
 
         self.assertEqual(1, val)
+
+    def test_back_pressure(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            scheduler=self.scheduler,
+            buffer_size=2,
+        )
+
+        ack1 = self.source.on_next_single(1)
+        ack2 = self.source.on_next_single(2)
+
+        self.assertIsInstance(ack1, ContinueAck)
+        self.assertFalse(ack2.has_value)
+
+        val = next(iterator)
+
+        self.assertEqual(1, val)
+        self.assertIsInstance(ack2.value, ContinueAck)
+
+    def test_batched(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            scheduler=self.scheduler,
+            batched=True,
+        )
+
+        self.source.on_next_list([1, 2])
+        self.source.on_completed()
+
+        self.assertEqual([[1, 2]], list(iterator))
+
+    def test_raise_after_queued_batches(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            scheduler=self.scheduler,
+        )
+
+        self.source.on_next_single(1)
+        self.source.on_error(Exception('test'))
+
+        self.assertEqual(1, next(iterator))
+        self.assertRaises(Exception, next, iterator)
+
+    def test_wake_up_on_other_thread(self):
+        iterator = to_iterator(
+            source=init_flowable(self.source),
+            buffer_size=1,
+        )
+
+        def produce():
+            for value in range(3):
+                ack = self.source.on_next_single(value)
+                while not isinstance(ack, ContinueAck) and not ack.has_value:
+                    time.sleep(0.001)
+            self.source.on_completed()
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+
+        self.assertEqual([0, 1, 2], list(iterator))
+        thread.join()
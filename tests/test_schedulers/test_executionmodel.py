@@ -0,0 +1,36 @@
+import time
+import unittest
+
+from rxbp.scheduler import BatchedExecution, TimeSlicedExecution
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class TestExecutionModel(unittest.TestCase):
+    def test_batched_execution(self):
+        em = BatchedExecution(4)
+
+        indices = [0]
+        for _ in range(4):
+            indices.append(em.next_frame_index(indices[-1]))
+
+        self.assertEqual([0, 1, 2, 3, 0], indices)
+
+    def test_time_sliced_execution(self):
+        em = TimeSlicedExecution(0.01)
+
+        index = em.next_frame_index(0)
+
+        self.assertLess(0, index)
+        self.assertEqual(index, em.next_frame_index(index))
+
+        time.sleep(0.02)
+
+        self.assertEqual(0, em.next_frame_index(index))
+
+    def test_select_execution_model_per_scheduler(self):
+        em = TimeSlicedExecution(0.001)
+
+        scheduler = TrampolineScheduler(execution_model=em)
+
+        self.assertIs(em, scheduler.get_execution_model())
+        self.assertIsInstance(TrampolineScheduler().get_execution_model(), BatchedExecution)
@@ -0,0 +1,67 @@
+import threading
+import unittest
+
+from rxbp.schedulers.eventloopscheduler import EventLoopScheduler
+from rxbp.schedulers.schedulerinstrumentation import SchedulerInstrumentation, LatencyHistogram
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class TestSchedulerInstrumentation(unittest.TestCase):
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+
+        for _ in range(9):
+            histogram.record(3e-6)
+        histogram.record(1e-3)
+
+        self.assertEqual(10, histogram.count)
+        self.assertEqual(4e-6, histogram.percentile(50))
+        self.assertEqual(1e-3, histogram.percentile(99))
+
+    def test_trampoline_scheduler(self):
+        measured = []
+        instrumentation = SchedulerInstrumentation(callback=lambda wait, run: measured.append((wait, run)))
+        scheduler = TrampolineScheduler(instrumentation=instrumentation)
+
+        def action(_, __):
+            # the inner actions are queued while this action runs
+            scheduler.schedule(lambda _, __: None)
+            scheduler.schedule(lambda _, __: None)
+
+            self.assertEqual(2, instrumentation.queue_depth)
+
+        scheduler.schedule(action)
+
+        snapshot = instrumentation.snapshot()
+
+        self.assertEqual(3, snapshot['n_scheduled'])
+        self.assertEqual(3, snapshot['n_invoked'])
+        self.assertEqual(0, snapshot['queue_depth'])
+        self.assertEqual(3, snapshot['max_queue_depth'])
+        self.assertEqual(3, snapshot['run_time']['count'])
+        self.assertEqual(3, len(measured))
+
+    def test_failed_action(self):
+        instrumentation = SchedulerInstrumentation()
+        scheduler = TrampolineScheduler(instrumentation=instrumentation)
+
+        def action(_, __):
+            raise Exception('test')
+
+        scheduler.schedule(action)
+
+        self.assertEqual(1, instrumentation.snapshot()['n_failed'])
+
+    def test_event_loop_scheduler(self):
+        is_measured = threading.Event()
+        instrumentation = SchedulerInstrumentation(callback=lambda wait, run: is_measured.set())
+        scheduler = EventLoopScheduler(instrumentation=instrumentation)
+
+        scheduler.schedule_relative(0.2, lambda _, __: None)
+        is_measured.wait(1)
+        scheduler.dispose()
+
+        self.assertEqual(1, instrumentation.snapshot()['n_invoked'])
+
+        # the delay of a timed action does not count as wait time
+        self.assertLess(instrumentation.wait_time.max, 0.2)
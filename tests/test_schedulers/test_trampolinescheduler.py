@@ -0,0 +1,56 @@
+import datetime
+import unittest
+
+from rxbp.schedulers.trampolinescheduler import TrampolineScheduler
+
+
+class TestTrampolineScheduler(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TrampolineScheduler()
+        self.invoked = []
+
+    def _action(self, name, schedule=None):
+        def action(_, __):
+            self.invoked.append(name)
+
+            if schedule is not None:
+                schedule()
+
+        return action
+
+    def test_immediate_actions_in_order(self):
+        def schedule_inner():
+            self.scheduler.schedule(self._action('b'))
+            self.scheduler.schedule(self._action('c'))
+
+        self.scheduler.schedule(self._action('a', schedule_inner))
+
+        self.assertEqual(['a', 'b', 'c'], self.invoked)
+        self.assertTrue(self.scheduler.idle)
+
+    def test_cancel_immediate_action(self):
+        def schedule_inner():
+            disposable = self.scheduler.schedule(self._action('b'))
+            disposable.dispose()
+
+        self.scheduler.schedule(self._action('a', schedule_inner))
+
+        self.assertEqual(['a'], self.invoked)
+
+    def test_due_timed_action_before_immediate_action(self):
+        def schedule_inner():
+            self.scheduler.schedule_absolute(self.scheduler.now - datetime.timedelta(seconds=1), self._action('b'))
+            self.scheduler.schedule(self._action('c'))
+
+        self.scheduler.schedule(self._action('a', schedule_inner))
+
+        self.assertEqual(['a', 'b', 'c'], self.invoked)
+
+    def test_continue_after_exception(self):
+        def schedule_inner():
+            self.scheduler.schedule(self._action('b', lambda: 1 / 0))
+            self.scheduler.schedule(self._action('c'))
+
+        self.scheduler.schedule(self._action('a', schedule_inner))
+
+        self.assertEqual(['a', 'b', 'c'], self.invoked)
@@ -0,0 +1,129 @@
+import asyncio
+import unittest
+
+import rxbp
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestFromAsyncIterable(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self) -> None:
+        self.loop.close()
+
+    def _run_loop(self):
+        # run the scheduled callbacks of the event loop
+        self.loop.run_until_complete(asyncio.sleep(0.01))
+
+    def test_from_async_generator(self):
+        async def gen():
+            for value in range(3):
+                yield value
+
+        sink = TObserver()
+        subscription = rxbp.from_async_iterable(gen(), loop=self.loop).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self._run_loop()
+
+        self.assertEqual([0, 1, 2], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_back_pressure(self):
+        is_closed = []
+
+        async def gen():
+            try:
+                for value in range(3):
+                    yield value
+            finally:
+                is_closed.append(True)
+
+        sink = TObserver(immediate_continue=0)
+        subscription = rxbp.from_async_iterable(gen(), loop=self.loop).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self._run_loop()
+
+        self.assertEqual([0], sink.received)
+
+        sink.ack.on_next(continue_ack)
+        self._run_loop()
+
+        self.assertEqual([0, 1], sink.received)
+        self.assertFalse(is_closed)
+
+        sink.ack.on_next(continue_ack)
+        sink.immediate_continue = 1
+        self._run_loop()
+
+        self.assertEqual([0, 1, 2], sink.received)
+        self.assertTrue(sink.is_completed)
+        self.assertTrue(is_closed)
+
+    def test_exception(self):
+        exception = Exception('test')
+
+        async def gen():
+            yield 1
+            raise exception
+
+        sink = TObserver()
+        subscription = rxbp.from_async_iterable(gen(), loop=self.loop).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self._run_loop()
+
+        self.assertEqual([1], sink.received)
+        self.assertEqual(exception, sink.exception)
+
+    def test_no_running_loop(self):
+        async def gen():
+            yield 1
+
+        with self.assertRaises(Exception):
+            rxbp.from_async_iterable(gen()).unsafe_subscribe(self.subscriber)
+
+    def test_running_loop(self):
+        async def gen():
+            yield 1
+
+        sink = TObserver()
+
+        async def subscribe():
+            subscription = rxbp.from_async_iterable(gen()).unsafe_subscribe(self.subscriber)
+            subscription.observable.observe(init_observer_info(observer=sink))
+            await asyncio.sleep(0.01)
+
+        self.loop.run_until_complete(subscribe())
+
+        self.assertEqual([1], sink.received)
+        self.assertTrue(sink.is_completed)
+
+    def test_exception_in_on_next(self):
+        exception = Exception('test')
+
+        async def gen():
+            yield 1
+
+        class RaisingObserver(TObserver):
+            def on_next(self, elem):
+                raise exception
+
+        sink = RaisingObserver()
+        subscription = rxbp.from_async_iterable(gen(), loop=self.loop).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self._run_loop()
+
+        self.assertEqual(exception, sink.exception)
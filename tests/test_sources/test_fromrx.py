@@ -0,0 +1,68 @@
+import unittest
+
+import rx
+from rx.subject import Subject
+
+import rxbp
+from rxbp.acknowledgement.continueack import continue_ack
+from rxbp.init.initobserverinfo import init_observer_info
+from rxbp.init.initsubscriber import init_subscriber
+from rxbp.overflowstrategy import DropOld, ClearBuffer
+from rxbp.testing.tobserver import TObserver
+from rxbp.testing.tscheduler import TScheduler
+
+
+class TestFromRx(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = TScheduler()
+        self.subscriber = init_subscriber(
+            scheduler=self.scheduler,
+            subscribe_scheduler=self.scheduler,
+        )
+        self.source = Subject()
+        self.sink = TObserver(immediate_continue=0)
+
+    def test_from_rx(self):
+        sink = TObserver()
+        subscription = rxbp.from_rx(rx.from_(range(3))).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=sink))
+
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([0, 1, 2], sink.received)
+
+    def test_drop_old_counts_dropped(self):
+        strategy = DropOld(2)
+        subscription = rxbp.from_rx(
+            self.source,
+            batch_size=2,
+            overflow_strategy=strategy,
+        ).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=self.sink))
+
+        for value in range(8):
+            self.source.on_next(value)
+
+        self.assertEqual(2, strategy.dropped_batches)
+        self.assertEqual(4, strategy.dropped_elements)
+
+        self.scheduler.advance_by(1)
+        self.sink.ack.on_next(continue_ack)
+        self.scheduler.advance_by(1)
+
+        self.assertEqual([4, 5, 6, 7], self.sink.received)
+
+    def test_clear_buffer_counts_dropped_iterators(self):
+        strategy = ClearBuffer(2)
+        subscription = rxbp.from_rx(
+            self.source,
+            is_batched=True,
+            overflow_strategy=strategy,
+        ).unsafe_subscribe(self.subscriber)
+        subscription.observable.observe(init_observer_info(observer=self.sink))
+
+        for batch in [[0], iter([1, 2]), [3]]:
+            self.source.on_next(batch)
+
+        self.assertEqual(2, strategy.dropped_batches)
+        self.assertEqual(3, strategy.dropped_elements)
@@ -0,0 +1,45 @@
+import traceback
+import unittest
+
+from rxbp.utils import getstacklines
+from rxbp.utils.getstacklines import get_stack_lines, set_stack_capture, EAGER_STACK_CAPTURE, \
+    LAZY_STACK_CAPTURE, NO_STACK_CAPTURE
+from rxbp.utils.tooperatorexception import to_operator_exception
+
+
+def create_operator():
+    return get_stack_lines()
+
+
+class TestGetStackLines(unittest.TestCase):
+    def setUp(self):
+        self.mode = getstacklines._stack_capture
+
+    def tearDown(self):
+        set_stack_capture(self.mode)
+
+    def test_lazy_equals_eager(self):
+        set_stack_capture(EAGER_STACK_CAPTURE)
+        eager = create_operator()
+        set_stack_capture(LAZY_STACK_CAPTURE)
+        lazy = create_operator()
+
+        self.assertEqual(
+            [(s.filename, s.name) for s in eager],
+            [(s.filename, s.name) for s in lazy],
+        )
+        self.assertEqual('test_lazy_equals_eager', lazy[-1].name)
+        self.assertIn('lazy = create_operator()', lazy[-1].line)
+
+    def test_lazy_operator_exception(self):
+        set_stack_capture(LAZY_STACK_CAPTURE)
+        stack = create_operator()
+
+        message = to_operator_exception(message='error', stack=stack)
+
+        self.assertIn('stack = create_operator()', message)
+
+    def test_disabled(self):
+        set_stack_capture(NO_STACK_CAPTURE)
+
+        self.assertEqual(0, len(create_operator()))